@@ -23,10 +23,17 @@ NWN:EE 한글 패치 릴리스 빌드 스크립트
 """
 
 import argparse
+import hashlib
+import os
 import shutil
+import struct
 import subprocess
 import sys
+import threading
+import time
 import zipfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -55,7 +62,7 @@ NWN_FONT_FILES = [
 ]
 
 
-def build_tlk(debug_mode: bool = False):
+def build_tlk(debug_mode: bool = False, profile: bool = False):
     """TLK 빌드 (translate/merge_dialog_files.py 호출)"""
     print()
     print("=" * 50)
@@ -65,6 +72,8 @@ def build_tlk(debug_mode: bool = False):
     cmd = [sys.executable, "merge_dialog_files.py"]
     if debug_mode:
         cmd.append("--debug")
+    if profile:
+        cmd.append("--profile")
 
     result = subprocess.run(
         cmd,
@@ -91,7 +100,92 @@ def build_tlk(debug_mode: bool = False):
     return tlk_path
 
 
-def build_mac(tlk_path: Path):
+def build_glyph_table(hook_dir: Path) -> bool:
+    """코퍼스에서 쓰이는 한글로 korean_glyph_table.h 재생성"""
+    result = subprocess.run(
+        [sys.executable, "tools/gen_glyph_table.py",
+         "--output", str(hook_dir / "korean_glyph_table.h")],
+        cwd=TRANSLATE_DIR,
+        capture_output=True,
+        text=True,
+        encoding='utf-8'
+    )
+    if result.returncode != 0:
+        print("  [!] 글리프 테이블 생성 실패")
+        print(result.stderr)
+        return False
+    for line in result.stdout.split('\n'):
+        if line.strip():
+            print(f"  {line}")
+    return True
+
+
+def subset_font(src_font: Path, font_dst: Path, full_hangul: bool) -> bool:
+    """ASCII/Latin-1 + 번역 코퍼스 문자만 남긴 서브셋 폰트 생성 (translate/.cache/fonts/에 캐시)
+
+    fontTools가 없거나 실패하면 False (호출하는 쪽에서 원본을 복사)
+    """
+    cmd = [sys.executable, "tools/subset_font.py", str(src_font.resolve()),
+           "--output", str(font_dst.resolve())]
+    if full_hangul:
+        cmd.append("--all-hangul")
+    result = subprocess.run(
+        cmd,
+        cwd=TRANSLATE_DIR,
+        capture_output=True,
+        text=True,
+        encoding='utf-8'
+    )
+    for line in (result.stdout + result.stderr).split('\n'):
+        if line.strip():
+            print(f"  {line}")
+    if result.returncode != 0:
+        print("  [!] 폰트 서브셋 실패, 원본 폰트를 사용합니다")
+        return False
+    return True
+
+
+def link_or_copy(src: Path, dst: Path) -> bool:
+    """같은 내용의 파일을 하드링크로 배치 (지원하지 않는 파일 시스템이면 복사)
+
+    Returns:
+        하드링크했는지
+    """
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        shutil.copy2(src, dst)
+        return False
+
+
+def copy_fonts(override_dst: Path, full_hangul: bool = True, subset: bool = True):
+    """폰트를 NWN 폰트 파일명으로 복사 (기본: 서브셋 후 복사)
+
+    full_hangul이면 코퍼스에 없는 완성형 한글도 남깁니다 (전체 베이크 훅, 채팅 입력용).
+    """
+    font_src_files = list(FONTS_DIR.glob("*.ttf")) + list(FONTS_DIR.glob("*.otf"))
+    if not font_src_files:
+        print("  [!] fonts/ 디렉토리에 폰트 파일이 없습니다.")
+        print("      Spoqa Han Sans Neo 등의 폰트를 fonts/에 넣어주세요.")
+        return
+
+    # 첫 번째 폰트 파일을 NWN 폰트 파일명으로 복사
+    src_font = font_src_files[0]
+    first_dst = override_dst / NWN_FONT_FILES[0]
+    if not (subset and subset_font(src_font, first_dst, full_hangul)):
+        shutil.copy2(src_font, first_dst)
+    # 나머지 파일명은 같은 내용이므로 하드링크 (디스크에는 한 벌만 저장)
+    for font_name in NWN_FONT_FILES:
+        font_dst = override_dst / font_name
+        linked = font_dst != first_dst and link_or_copy(first_dst, font_dst)
+        note = f" → {first_dst.name} 하드링크" if linked else ""
+        print(f"  [OK] override/{font_name} ({font_dst.stat().st_size / 1024 / 1024:.1f} MB){note}")
+
+
+def build_mac(tlk_path: Path, glyph_subset: bool = False, font_subset: bool = True):
     """macOS 릴리스 빌드"""
     print()
     print("=" * 50)
@@ -110,9 +204,14 @@ def build_mac(tlk_path: Path):
 
     # 1. dylib 빌드
     print("\n[1/5] dylib 빌드...")
+    make_cmd = ["make", "universal"]
+    if glyph_subset:
+        if not build_glyph_table(hook_dir):
+            return False
+        make_cmd.append("SUBSET=1")
     subprocess.run(["make", "clean"], cwd=hook_dir, capture_output=True)
     result = subprocess.run(
-        ["make", "universal"],
+        make_cmd,
         cwd=hook_dir,
         capture_output=True,
         text=True
@@ -156,17 +255,7 @@ def build_mac(tlk_path: Path):
 
     # 5. 폰트 복사 (override 디렉토리)
     print("\n[5/5] 폰트 복사...")
-    font_src_files = list(FONTS_DIR.glob("*.ttf")) + list(FONTS_DIR.glob("*.otf"))
-    if font_src_files:
-        # 첫 번째 폰트 파일을 NWN 폰트 파일명으로 복사
-        src_font = font_src_files[0]
-        for font_name in NWN_FONT_FILES:
-            font_dst = override_dst / font_name
-            shutil.copy2(src_font, font_dst)
-            print(f"  [OK] override/{font_name} ({font_dst.stat().st_size / 1024 / 1024:.1f} MB)")
-    else:
-        print("  [!] fonts/ 디렉토리에 폰트 파일이 없습니다.")
-        print("      Spoqa Han Sans Neo 등의 폰트를 fonts/에 넣어주세요.")
+    copy_fonts(override_dst, full_hangul=not glyph_subset, subset=font_subset)
 
     return True
 
@@ -259,7 +348,7 @@ def build_windows_hook(hook_dir: Path) -> bool:
     return True
 
 
-def build_windows(tlk_path: Path):
+def build_windows(tlk_path: Path, font_subset: bool = True):
     """Windows 릴리스 빌드"""
     print()
     print("=" * 50)
@@ -364,17 +453,7 @@ def build_windows(tlk_path: Path):
 
     # 5. 폰트 복사 (override 디렉토리)
     print("\n[5/5] 폰트 복사...")
-    font_src_files = list(FONTS_DIR.glob("*.ttf")) + list(FONTS_DIR.glob("*.otf"))
-    if font_src_files:
-        # 첫 번째 폰트 파일을 NWN 폰트 파일명으로 복사
-        src_font = font_src_files[0]
-        for font_name in NWN_FONT_FILES:
-            font_dst = override_dst / font_name
-            shutil.copy2(src_font, font_dst)
-            print(f"  [OK] override/{font_name} ({font_dst.stat().st_size / 1024 / 1024:.1f} MB)")
-    else:
-        print("  [!] fonts/ 디렉토리에 폰트 파일이 없습니다.")
-        print("      Spoqa Han Sans Neo 등의 폰트를 fonts/에 넣어주세요.")
+    copy_fonts(override_dst, full_hangul=True, subset=font_subset)
 
     return True
 
@@ -404,8 +483,134 @@ RELEASE_FILES = {
 }
 
 
-def create_zip(platform: str, version: str | None = None) -> Path | None:
-    """플랫폼별 릴리스 zip 파일 생성 (화이트리스트 기반)"""
+# zip 압축 레벨 (0이면 전부 저장)
+DEFAULT_ZIP_LEVEL = 6
+# 압축률 표본: 파일 곳곳에서 떼어 낸 조각을 빠르게 압축해 보고
+# 거의 줄지 않으면(이미 압축된 데이터 등) 압축 없이 저장(ZIP_STORED)
+SAMPLE_CHUNK = 16 * 1024
+SAMPLE_CHUNKS = 4
+STORED_RATIO = 0.95
+
+
+def looks_incompressible(data: bytes) -> bool:
+    """표본 압축률로 압축할 가치가 없는 데이터인지 추정"""
+    if len(data) <= SAMPLE_CHUNK * SAMPLE_CHUNKS:
+        sample = data
+    else:
+        step = (len(data) - SAMPLE_CHUNK) // (SAMPLE_CHUNKS - 1)
+        sample = b''.join(data[i * step:i * step + SAMPLE_CHUNK] for i in range(SAMPLE_CHUNKS))
+    if not sample:
+        return False
+    return len(zlib.compress(sample, 1)) >= len(sample) * STORED_RATIO
+
+
+class ZipMember:
+    """압축을 마친 zip 멤버 (같은 내용의 파일끼리 공유)
+
+    zlib은 압축 중 GIL을 놓으므로 스레드 풀에서 여러 멤버를 동시에 만듭니다.
+    """
+
+    def __init__(self, data: bytes, level: int = DEFAULT_ZIP_LEVEL):
+        self.size = len(data)
+        self.crc = zlib.crc32(data)
+        self.method = zipfile.ZIP_STORED
+        self.payload = data
+        if level == 0 or looks_incompressible(data):
+            return
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        if len(payload) < self.size:
+            self.method = zipfile.ZIP_DEFLATED
+            self.payload = payload
+
+
+class ZipMemberCache:
+    """내용 해시 → 압축 작업 (플랫폼 zip 사이에서도 같은 내용은 한 번만 압축)"""
+
+    def __init__(self, executor: ThreadPoolExecutor, level: int = DEFAULT_ZIP_LEVEL):
+        self.executor = executor
+        self.level = level
+        self.futures: dict[bytes, Future] = {}
+        self.lock = threading.Lock()
+
+    def submit(self, data: bytes) -> tuple[Future, bool]:
+        """(압축 작업, 이미 있던 작업인지)"""
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        with self.lock:
+            future = self.futures.get(digest)
+            if future is not None:
+                return future, True
+            future = self.executor.submit(ZipMember, data, self.level)
+            self.futures[digest] = future
+            return future, False
+
+
+class PrecompressedZipWriter:
+    """압축해 둔 페이로드를 그대로 기록하는 zip 작성기 (zip64 미지원)
+
+    zipfile.ZipFile은 멤버마다 다시 압축하므로, 같은 내용의 파일(폰트 3종 등)을
+    한 번만 압축하고 로컬 헤더만 따로 붙이기 위해 직접 기록합니다.
+    """
+
+    def __init__(self, path: Path):
+        self.file = open(path, 'wb')
+        self.entries: list[tuple[bytes, int, int, int, int, int, int, int]] = []
+
+    def add(self, arcname: str, member: ZipMember, file_path: Path) -> None:
+        if member.size > 0xFFFFFFFF or len(member.payload) > 0xFFFFFFFF:
+            raise ValueError(f"zip64가 필요한 크기입니다: {arcname}")
+        stat = file_path.stat()
+        year, month, day, hour, minute, second = time.localtime(stat.st_mtime)[:6]
+        year = max(year, 1980)
+        dos_time = (hour << 11) | (minute << 5) | (second // 2)
+        dos_date = ((year - 1980) << 9) | (month << 5) | day
+        name = arcname.encode('utf-8')
+        flags = 0 if arcname.isascii() else 0x800  # UTF-8 파일명
+        external_attr = (stat.st_mode & 0xFFFF) << 16
+
+        offset = self.file.tell()
+        self.file.write(struct.pack(
+            '<4s5H3L2H', b'PK\x03\x04', 20, flags, member.method, dos_time, dos_date,
+            member.crc, len(member.payload), member.size, len(name), 0))
+        self.file.write(name)
+        self.file.write(member.payload)
+        self.entries.append((name, flags, member.method, dos_time, dos_date, member.crc,
+                             len(member.payload), member.size, external_attr, offset))
+
+    def close(self) -> None:
+        # 중앙 디렉토리 (만든 시스템: Unix여야 권한 비트가 적용됨)
+        create_system = 0 if os.name == 'nt' else 3
+        start = self.file.tell()
+        for (name, flags, method, dos_time, dos_date, crc, compress_size, size,
+             external_attr, offset) in self.entries:
+            self.file.write(struct.pack(
+                '<4s6H3L5H2L', b'PK\x01\x02', (create_system << 8) | 20, 20, flags, method,
+                dos_time, dos_date, crc, compress_size, size, len(name), 0, 0, 0, 0,
+                external_attr, offset))
+            self.file.write(name)
+        end = self.file.tell()
+        self.file.write(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, len(self.entries),
+                                    len(self.entries), end - start, start, 0))
+        self.file.close()
+
+    def __enter__(self) -> 'PrecompressedZipWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def create_zip(platform: str, version: str | None = None,
+               members: ZipMemberCache | None = None) -> Path | None:
+    """플랫폼별 릴리스 zip 파일 생성 (화이트리스트 기반)
+
+    멤버 압축은 members의 스레드 풀에서 병렬로 하고, 끝나는 대로 화이트리스트
+    순서대로 아카이브에 기록합니다. 출력은 다른 플랫폼과 섞이지 않게 모아서 찍습니다.
+    """
+    if members is None:
+        with ThreadPoolExecutor() as executor:
+            return create_zip(platform, version, ZipMemberCache(executor))
+
     platform_dir = RELEASE_DIR / platform
     if not platform_dir.exists():
         return None
@@ -423,22 +628,48 @@ def create_zip(platform: str, version: str | None = None) -> Path | None:
 
     zip_path = RELEASE_DIR / zip_name
 
-    print(f"\n[{platform}] 압축 중...")
+    lines = [f"\n[{platform}] 압축 중..."]
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for rel_path in whitelist:
-            file_path = platform_dir / rel_path
-            if file_path.exists():
-                arcname = f"{platform}/{rel_path}"
-                zf.write(file_path, arcname)
-                print(f"  + {rel_path}")
+    # 먼저 모든 파일의 압축 작업을 걸어 두고 순서대로 결과를 기록
+    entries = []
+    for rel_path in whitelist:
+        file_path = platform_dir / rel_path
+        if file_path.exists():
+            entries.append((rel_path, file_path, *members.submit(file_path.read_bytes())))
+        else:
+            entries.append((rel_path, file_path, None, False))
+
+    with PrecompressedZipWriter(zip_path) as zf:
+        for rel_path, file_path, future, reused in entries:
+            if future is None:
+                lines.append(f"  [!] 누락: {rel_path}")
+                continue
+            member = future.result()
+            zf.add(f"{platform}/{rel_path}", member, file_path)
+            if reused:
+                note = " (중복, 압축 재사용)"
+            elif member.method == zipfile.ZIP_STORED:
+                note = " (저장)"
             else:
-                print(f"  [!] 누락: {rel_path}")
+                note = ""
+            lines.append(f"  + {rel_path}{note}")
 
-    print(f"  [OK] {zip_name} ({zip_path.stat().st_size / 1024 / 1024:.1f} MB)")
+    lines.append(f"  [OK] {zip_name} ({zip_path.stat().st_size / 1024 / 1024:.1f} MB)")
+    print('\n'.join(lines))
     return zip_path
 
 
+def create_zips(platforms: list[str], version: str | None = None,
+                level: int = DEFAULT_ZIP_LEVEL) -> list[Path]:
+    """여러 플랫폼 zip을 동시에 생성 (압축 스레드 풀과 중복 제거 캐시 공유)"""
+    with ThreadPoolExecutor() as executor, \
+            ThreadPoolExecutor(max_workers=max(1, len(platforms))) as platform_executor:
+        members = ZipMemberCache(executor, level)
+        futures = [platform_executor.submit(create_zip, platform, version, members)
+                   for platform in platforms]
+        return [zip_path for zip_path in (future.result() for future in futures) if zip_path]
+
+
 def print_summary(zip_files: list[Path] | None = None):
     """빌드 요약"""
     print()
@@ -504,6 +735,15 @@ def main():
                         help='TLK 빌드 건너뛰기')
     parser.add_argument('--zip', action='store_true',
                         help='릴리스 zip 파일 생성 (pyproject.toml 버전 사용)')
+    parser.add_argument('--glyph-subset', action='store_true',
+                        help='번역에 쓰이는 한글만 베이크하도록 macOS 훅 빌드 (글리프 테이블 재생성)')
+    parser.add_argument('--profile', action='store_true',
+                        help='TLK 빌드 단계별 프로파일 (translate/profile_report.json)')
+    parser.add_argument('--no-font-subset', action='store_true',
+                        help='폰트 서브셋 없이 원본 폰트 복사')
+    parser.add_argument('--zip-level', type=int, choices=range(10), default=DEFAULT_ZIP_LEVEL,
+                        metavar='0-9',
+                        help=f'zip 압축 레벨 (기본: {DEFAULT_ZIP_LEVEL}, 0이면 압축 없이 저장)')
 
     args = parser.parse_args()
 
@@ -523,17 +763,18 @@ def main():
             return 1
         print("\nTLK 빌드 건너뜀 (기존 파일 사용)")
     else:
-        tlk_path = build_tlk(debug_mode=args.debug)
+        tlk_path = build_tlk(debug_mode=args.debug, profile=args.profile)
         if not tlk_path:
             return 1
 
     # 플랫폼별 빌드
     if build_all or args.mac:
-        if not build_mac(tlk_path):
+        if not build_mac(tlk_path, glyph_subset=args.glyph_subset,
+                         font_subset=not args.no_font_subset):
             return 1
 
     if build_all or args.windows:
-        if not build_windows(tlk_path):
+        if not build_windows(tlk_path, font_subset=not args.no_font_subset):
             return 1
 
     # zip 생성
@@ -555,10 +796,7 @@ def main():
             if args.windows:
                 platforms.append('windows')
 
-        for platform in platforms:
-            zf = create_zip(platform, version)
-            if zf:
-                zip_files.append(zf)
+        zip_files = create_zips(platforms, version, args.zip_level)
 
     # 요약
     print_summary(zip_files if zip_files else None)
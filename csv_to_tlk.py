@@ -8,16 +8,25 @@ NWN:EE 한글 패치 호환:
 """
 
 import struct
-import csv
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Optional, Dict
 
+# 공용 모듈 (translate/의 CSV 로더, 인코딩 사전 검사, 완성형 판정)
+sys.path.insert(0, str(Path(__file__).parent / "translate"))
+from cp949_preflight import apply_encode_substitutions
+from csv_rows import open_rows
+from ksx1001 import contains_hangul
+
+# TLK 엔트리 (40 bytes)
+TLK_ENTRY = struct.Struct('<I16sIIIIf')
+
 
 class CSVToTLKConverter:
     def __init__(self, csv_path: Path, encoding: str = 'auto',
                  reference_tlk: Optional[Path] = None, language_id: int = 0,
-                 debug_mode: bool = False):
+                 debug_mode: bool = False, profiler=None):
         self.csv_path = csv_path
         self.entries = []
         self.encoding = encoding
@@ -26,30 +35,57 @@ class CSVToTLKConverter:
         self.debug_mode = debug_mode  # 검수 모드: 텍스트 앞에 [StrRef] 추가
         self.reference_entries = {}  # 원본 TLK 엔트리 캐시
         self.reference_texts = {}    # 원본 TLK 텍스트 캐시
+        self.profiler = profiler     # 단계별 프로파일러 (translate/profiling.py, 선택)
+
+    def _phase(self, name: str):
+        """프로파일러 측정 구간 (프로파일러가 없으면 아무 일도 하지 않음)"""
+        return self.profiler.phase(name) if self.profiler else nullcontext()
         
     def load_csv(self) -> None:
         """Load CSV file and parse entries"""
-        with open(self.csv_path, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
+        required_columns = ['StrRef', 'Text', 'SoundRef', 'VolumeVariance', 'PitchVariance']
+        with open_rows(self.csv_path, required_columns) as reader:
             # Verify required columns exist
-            required_columns = ['StrRef', 'Text', 'SoundRef', 'VolumeVariance', 'PitchVariance']
             if not all(col in reader.fieldnames for col in required_columns):
                 raise ValueError(f"CSV must contain columns: {required_columns}")
             
-            for row in reader:
+            for strref, text, sound_ref, volume, pitch in reader:
                 try:
                     entry = {
-                        'strref': int(row['StrRef']),
-                        'text': row['Text'] or '',  # Handle empty text
-                        'sound_ref': row['SoundRef'] or '',
-                        'volume_variance': int(row['VolumeVariance'] or '0'),
-                        'pitch_variance': int(row['PitchVariance'] or '0')
+                        'strref': int(strref),
+                        'text': text or '',  # Handle empty text
+                        'sound_ref': sound_ref or '',
+                        'volume_variance': int(volume or '0'),
+                        'pitch_variance': int(pitch or '0')
                     }
                     self.entries.append(entry)
                 except ValueError as e:
                     print(f"Warning: Skipping invalid row {reader.line_num}: {e}")
 
+        self._fill_gaps()
+
+    def load_records(self, records) -> None:
+        """Load entries from an in-memory RecordStore (merge_dialog_files)
+
+        CSV를 다시 파싱하지 않고 병합 단계의 컬럼 저장소에서 바로 엔트리를 만듭니다.
+        """
+        fields = ('StrRef', 'Text', 'SoundRef', 'VolumeVariance', 'PitchVariance')
+        for line_num, (strref, text, sound_ref, volume, pitch) in enumerate(records.iter_sorted(fields), start=2):
+            try:
+                self.entries.append({
+                    'strref': int(strref),
+                    'text': text or '',
+                    'sound_ref': sound_ref or '',
+                    'volume_variance': int(volume or '0'),
+                    'pitch_variance': int(pitch or '0')
+                })
+            except ValueError as e:
+                print(f"Warning: Skipping invalid row {line_num}: {e}")
+
+        self._fill_gaps()
+
+    def _fill_gaps(self) -> None:
+        """Index loaded entries by StrRef and fill gaps with empty entries"""
         # Create entry lookup by StrRef
         entry_dict = {entry['strref']: entry for entry in self.entries}
 
@@ -135,7 +171,8 @@ class CSVToTLKConverter:
         """Write TLK file"""
         # 원본 TLK가 있으면 로드
         if self.reference_tlk:
-            self.load_reference_tlk()
+            with self._phase('reference_load'):
+                self.load_reference_tlk()
 
         # 원본 TLK가 있으면 문자열 개수를 원본과 맞춤
         if self.reference_entries:
@@ -151,24 +188,10 @@ class CSVToTLKConverter:
                         'pitch_variance': 0
                     })
 
-        with open(output_path, 'wb') as f:
-            # Write header
-            f.write(b'TLK ')  # Signature
-            f.write(b'V3.0')  # Version
-
-            # Language ID (0 for NWN:EE compatibility)
-            f.write(struct.pack('<I', self.language_id))
-
-            # String count (total array size including gaps)
+        # 1) 엔트리 테이블/문자열 데이터 인코딩
+        with self._phase('encode'):
             string_count = len(self.entries)
-            f.write(struct.pack('<I', string_count))
-
-            # Calculate string data offset
-            # Header: 20 bytes + (40 bytes per entry)
-            string_data_offset = 20 + (string_count * 40)
-            f.write(struct.pack('<I', string_data_offset))
-
-            # Prepare string data and write entries
+            entry_table = bytearray()
             string_data = bytearray()
             current_offset = 0
             fallback_count = 0
@@ -211,30 +234,41 @@ class CSVToTLKConverter:
                     pitch_var = entry['pitch_variance']
                     sound_length = 0.0
 
-                # Write entry (40 bytes)
-                f.write(struct.pack('<I', flags))
+                # Entry (40 bytes): flags, sound resref (16 bytes, null padded),
+                # volume/pitch variance, string offset/length, sound length
+                entry_table += TLK_ENTRY.pack(
+                    flags,
+                    sound_ref.encode('ascii', errors='ignore')[:16],
+                    volume_var,
+                    pitch_var,
+                    current_offset,
+                    len(text_bytes),
+                    sound_length,
+                )
 
-                # Sound reference (16 bytes, padded with null bytes)
-                sound_ref_bytes = sound_ref.encode('ascii', errors='ignore')[:16]
-                sound_ref_bytes += b'\x00' * (16 - len(sound_ref_bytes))
-                f.write(sound_ref_bytes)
+                # Add to string data
+                string_data += text_bytes
+                current_offset += len(text_bytes)
 
-                # Volume and pitch variance
-                f.write(struct.pack('<I', volume_var))
-                f.write(struct.pack('<I', pitch_var))
+        # 2) 파일 쓰기
+        with self._phase('tlk_write'), open(output_path, 'wb') as f:
+            # Write header
+            f.write(b'TLK ')  # Signature
+            f.write(b'V3.0')  # Version
 
-                # String offset and length
-                f.write(struct.pack('<I', current_offset))
-                f.write(struct.pack('<I', len(text_bytes)))
+            # Language ID (0 for NWN:EE compatibility)
+            f.write(struct.pack('<I', self.language_id))
 
-                # Sound length
-                f.write(struct.pack('<f', sound_length))
+            # String count (total array size including gaps)
+            f.write(struct.pack('<I', string_count))
 
-                # Add to string data
-                string_data.extend(text_bytes)
-                current_offset += len(text_bytes)
+            # Calculate string data offset
+            # Header: 20 bytes + (40 bytes per entry)
+            string_data_offset = 20 + (string_count * TLK_ENTRY.size)
+            f.write(struct.pack('<I', string_data_offset))
 
-            # Write string data section
+            # Entry table, then string data section
+            f.write(entry_table)
             f.write(string_data)
 
         print(f"Successfully wrote TLK file: {output_path}")
@@ -252,15 +286,13 @@ class CSVToTLKConverter:
             
         if self.encoding == 'auto':
             # Check if text contains Korean characters
-            korean_chars = any('\uac00' <= char <= '\ud7af' for char in text)
+            korean_chars = contains_hangul(text)
             
             if korean_chars:
                 # Use CP949 (EUC-KR) for Korean text
                 try:
-                    # Replace characters not supported by CP949
-                    text_fixed = text.replace('—', '-')  # Replace em dash with regular dash
-                    text_fixed = text_fixed.replace('–', '-')  # Replace en dash with regular dash
-                    text_fixed = text_fixed.replace('\u00a0', ' ')  # Replace non-breaking space with regular space
+                    # Replace characters not supported by CP949 (em/en dash, non-breaking space)
+                    text_fixed = apply_encode_substitutions(text)
                     return text_fixed.encode('cp949')
                 except UnicodeEncodeError as e:
                     print(f"Warning: Cannot encode Korean text with CP949: {e}")
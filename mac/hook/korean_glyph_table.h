@@ -1,8 +1,15 @@
 /**
  * NWN:EE 한글 글리프 테이블 (자동 생성)
  *
- * TLK에서 실제 사용되는 한글 문자만 포함
- * 총 1797자 (ASCII 256 + 한글 1541)
+ * 번역 코퍼스에서 실제 사용되는 완성형 한글만 포함
+ * 총 1794자 (ASCII 256 + 한글 1538)
+ * 배치: 사용 빈도순
+ * 아틀라스 추정 (64px 셀, 줄당 64자, 29줄):
+ *   사용량 90%: 305자 → 5줄 (코드 순서 24줄)
+ *   사용량 99%: 720자 → 12줄 (코드 순서 24줄)
+ *   사용량 99.9%: 1104자 → 18줄 (코드 순서 25줄)
+ *
+ * 생성: python3 translate/tools/gen_glyph_table.py
  */
 
 #ifndef KOREAN_GLYPH_TABLE_H
@@ -11,166 +18,320 @@
 #include <stdint.h>
 
 // 글리프 개수
-#define KOREAN_GLYPH_TOTAL 1797
-#define KOREAN_CHAR_COUNT 1541
+#define KOREAN_GLYPH_TOTAL 1794
+#define KOREAN_CHAR_COUNT 1538
+#define KSX1001_REMAP_COUNT 2350
 
 // 베이크용 유니코드 배열 (한글 부분만, ASCII는 원본 사용)
+// 글리프 인덱스 = 256 + 배열 위치
 static const uint32_t korean_unicodes[KOREAN_CHAR_COUNT] = {
-    0xAC00, 0xAC01, 0xAC04, 0xAC07, 0xAC08, 0xAC09, 0xAC10, 0xAC11, 0xAC12, 0xAC13, 
-    0xAC14, 0xAC15, 0xAC16, 0xAC17, 0xAC19, 0xAC1A, 0xAC1B, 0xAC1C, 0xAC1D, 0xAC24, 
-    0xAC2C, 0xAC2F, 0xAC30, 0xAC31, 0xAC38, 0xAC40, 0xAC4D, 0xAC54, 0xAC58, 0xAC5C, 
-    0xAC70, 0xAC71, 0xAC74, 0xAC77, 0xAC78, 0xAC80, 0xAC81, 0xAC83, 0xAC89, 0xAC8C, 
-    0xAC90, 0xAC94, 0xAC9C, 0xAC9F, 0xACA0, 0xACA8, 0xACA9, 0xACAA, 0xACAC, 0xACB0, 
-    0xACB8, 0xACB9, 0xACBC, 0xACBD, 0xACC1, 0xACC4, 0xACE0, 0xACE1, 0xACE4, 0xACE7, 
-    0xACE8, 0xACEA, 0xACEF, 0xACF0, 0xACF1, 0xACF3, 0xACF5, 0xACFC, 0xACFD, 0xAD00, 
-    0xAD04, 0xAD11, 0xAD1C, 0xAD2D, 0xAD34, 0xAD49, 0xAD50, 0xAD6C, 0xAD6D, 0xAD70, 
-    0xAD73, 0xAD74, 0xAD75, 0xAD76, 0xAD7C, 0xAD7D, 0xAD7F, 0xAD81, 0xAD82, 0xAD88, 
-    0xAD8C, 0xAD90, 0xADA4, 0xADC0, 0xADC4, 0xADC8, 0xADD1, 0xADD3, 0xADDC, 0xADE0, 
-    0xADF8, 0xADF9, 0xADFC, 0xAE00, 0xAE01, 0xAE08, 0xAE09, 0xAE0B, 0xAE0D, 0xAE30, 
-    0xAE34, 0xAE38, 0xAE40, 0xAE41, 0xAE43, 0xAE45, 0xAE4A, 0xAE4C, 0xAE4D, 0xAE4E, 
-    0xAE50, 0xAE54, 0xAE5C, 0xAE5D, 0xAE61, 0xAE65, 0xAE68, 0xAE6C, 0xAE70, 0xAE79, 
-    0xAE7C, 0xAE7D, 0xAE84, 0xAEBC, 0xAEBD, 0xAEBE, 0xAEC4, 0xAECD, 0xAECF, 0xAED1, 
-    0xAED8, 0xAEF4, 0xAF08, 0xAF2C, 0xAF2D, 0xAF30, 0xAF34, 0xAF3C, 0xAF3D, 0xAF3F, 
-    0xAF41, 0xAF42, 0xAF43, 0xAF49, 0xAF5D, 0xAF64, 0xAF80, 0xAFB8, 0xAFB9, 0xAFBC, 
-    0xAFC0, 0xAFC7, 0xAFC8, 0xAFC9, 0xAFCB, 0xAFCD, 0xAFD4, 0xAFE8, 0xAFF0, 0xB00C, 
-    0xB010, 0xB014, 0xB01C, 0xB01D, 0xB044, 0xB048, 0xB04A, 0xB04C, 0xB053, 0xB054, 
-    0xB055, 0xB057, 0xB05D, 0xB07C, 0xB07D, 0xB080, 0xB084, 0xB08C, 0xB08D, 0xB08F, 
-    0xB091, 0xB098, 0xB099, 0xB09A, 0xB09C, 0xB0A0, 0xB0A1, 0xB0A8, 0xB0A9, 0xB0AB, 
-    0xB0AC, 0xB0AD, 0xB0AE, 0xB0AF, 0xB0B1, 0xB0B3, 0xB0B4, 0xB0B8, 0xB0BC, 0xB0C4, 
-    0xB0C5, 0xB0C7, 0xB0C8, 0xB0C9, 0xB0D0, 0xB0D8, 0xB0E5, 0xB108, 0xB109, 0xB10B, 
-    0xB10C, 0xB110, 0xB113, 0xB118, 0xB119, 0xB11C, 0xB11D, 0xB123, 0xB124, 0xB125, 
-    0xB128, 0xB12C, 0xB135, 0xB137, 0xB138, 0xB140, 0xB141, 0xB144, 0xB150, 0xB154, 
-    0xB155, 0xB158, 0xB15C, 0xB178, 0xB179, 0xB17C, 0xB180, 0xB188, 0xB189, 0xB18B, 
-    0xB18D, 0xB192, 0xB193, 0xB194, 0xB1A8, 0xB1CC, 0xB1E8, 0xB204, 0xB205, 0xB208, 
-    0xB20C, 0xB215, 0xB220, 0xB234, 0xB258, 0xB25C, 0xB260, 0xB269, 0xB274, 0xB290, 
-    0xB291, 0xB294, 0xB298, 0xB299, 0xB2A0, 0xB2A5, 0xB2A6, 0xB2AA, 0xB2AC, 0xB2C8, 
-    0xB2C9, 0xB2CC, 0xB2D0, 0xB2D8, 0xB2D9, 0xB2DB, 0xB2DD, 0xB2E2, 0xB2E4, 0xB2E5, 
-    0xB2E6, 0xB2E8, 0xB2EB, 0xB2EC, 0xB2ED, 0xB2EE, 0xB2F3, 0xB2F4, 0xB2F5, 0xB2F7, 
-    0xB2F9, 0xB2FB, 0xB2FF, 0xB300, 0xB301, 0xB304, 0xB308, 0xB310, 0xB311, 0xB313, 
-    0xB314, 0xB354, 0xB355, 0xB358, 0xB35C, 0xB35F, 0xB364, 0xB365, 0xB367, 0xB369, 
-    0xB36B, 0xB36E, 0xB370, 0xB371, 0xB374, 0xB378, 0xB381, 0xB385, 0xB38C, 0xB3A0, 
-    0xB3C4, 0xB3C5, 0xB3C8, 0xB3CB, 0xB3CC, 0xB3D4, 0xB3D5, 0xB3D9, 0xB3DB, 0xB3FC, 
-    0xB410, 0xB418, 0xB41C, 0xB420, 0xB428, 0xB429, 0xB450, 0xB451, 0xB454, 0xB458, 
-    0xB460, 0xB461, 0xB463, 0xB465, 0xB46C, 0xB480, 0xB4A4, 0xB4B7, 0xB4B9, 0xB4C0, 
-    0xB4C8, 0xB4DC, 0xB4DD, 0xB4E0, 0xB4E3, 0xB4E4, 0xB4E6, 0xB4EC, 0xB4ED, 0xB4EF, 
-    0xB4F1, 0xB514, 0xB515, 0xB518, 0xB51B, 0xB51C, 0xB524, 0xB525, 0xB528, 0xB529, 
-    0xB52A, 0xB530, 0xB531, 0xB534, 0xB538, 0xB540, 0xB544, 0xB545, 0xB54C, 0xB550, 
-    0xB554, 0xB55C, 0xB560, 0xB561, 0xB5A0, 0xB5A1, 0xB5A4, 0xB5A8, 0xB5B1, 0xB5B4, 
-    0xB5BB, 0xB5BC, 0xB5C4, 0xB5D0, 0xB610, 0xB611, 0xB612, 0xB618, 0xB625, 0xB69C, 
-    0xB69D, 0xB6A4, 0xB6AB, 0xB6B1, 0xB6F0, 0xB6F4, 0xB6F8, 0xB700, 0xB728, 0xB729, 
-    0xB72C, 0xB72F, 0xB730, 0xB738, 0xB739, 0xB73B, 0xB744, 0xB74C, 0xB754, 0xB755, 
-    0xB760, 0xB764, 0xB771, 0xB77C, 0xB77D, 0xB780, 0xB784, 0xB78C, 0xB78D, 0xB78F, 
-    0xB790, 0xB791, 0xB796, 0xB797, 0xB798, 0xB799, 0xB79C, 0xB7A0, 0xB7A8, 0xB7A9, 
-    0xB7AB, 0xB7AC, 0xB7AD, 0xB7B4, 0xB7B5, 0xB7C9, 0xB7EC, 0xB7ED, 0xB7F0, 0xB7F4, 
-    0xB7FC, 0xB7FD, 0xB7FF, 0xB800, 0xB801, 0xB807, 0xB808, 0xB809, 0xB80C, 0xB810, 
-    0xB818, 0xB81B, 0xB824, 0xB825, 0xB828, 0xB82C, 0xB834, 0xB835, 0xB837, 0xB838, 
-    0xB839, 0xB840, 0xB85C, 0xB85D, 0xB860, 0xB864, 0xB86C, 0xB86D, 0xB86F, 0xB871, 
-    0xB8B0, 0xB8CC, 0xB8E1, 0xB8E8, 0xB8E9, 0xB8EC, 0xB8F0, 0xB8F8, 0xB8F9, 0xB8FB, 
-    0xB8FD, 0xB904, 0xB918, 0xB958, 0xB959, 0xB95C, 0xB960, 0xB968, 0xB96D, 0xB974, 
-    0xB975, 0xB978, 0xB97C, 0xB984, 0xB985, 0xB987, 0xB989, 0xB98E, 0xB9AC, 0xB9AD, 
-    0xB9B0, 0xB9B4, 0xB9BC, 0xB9BD, 0xB9BF, 0xB9C1, 0xB9C8, 0xB9C9, 0xB9CC, 0xB9CE, 
-    0xB9CF, 0xB9D0, 0xB9D1, 0xB9D8, 0xB9D9, 0xB9DB, 0xB9DD, 0xB9DE, 0xB9E1, 0xB9E3, 
-    0xB9E4, 0xB9E5, 0xB9E8, 0xB9F4, 0xB9F5, 0xB9F7, 0xB9F8, 0xB9F9, 0xB9FA, 0xBA38, 
-    0xBA39, 0xBA3C, 0xBA40, 0xBA48, 0xBA49, 0xBA4B, 0xBA4D, 0xBA4E, 0xBA54, 0xBA55, 
-    0xBA58, 0xBA5C, 0xBA64, 0xBA67, 0xBA69, 0xBA70, 0xBA71, 0xBA74, 0xBA78, 0xBA84, 
-    0xBA85, 0xBA87, 0xBAA8, 0xBAA9, 0xBAAB, 0xBAAC, 0xBAB0, 0xBAB8, 0xBAB9, 0xBABB, 
-    0xBABD, 0xBAC4, 0xBB18, 0xBB34, 0xBB35, 0xBB36, 0xBB38, 0xBB3B, 0xBB3C, 0xBB44, 
-    0xBB45, 0xBB47, 0xBB49, 0xBB4D, 0xBB50, 0xBB54, 0xBB58, 0xBB61, 0xBB63, 0xBBA4, 
-    0xBBAC, 0xBBC0, 0xBBC8, 0xBBF8, 0xBBF9, 0xBBFC, 0xBBFF, 0xBC00, 0xBC08, 0xBC09, 
-    0xBC0B, 0xBC0C, 0xBC0D, 0xBC0F, 0xBC11, 0xBC14, 0xBC15, 0xBC16, 0xBC18, 0xBC1B, 
-    0xBC1C, 0xBC1D, 0xBC1F, 0xBC24, 0xBC25, 0xBC27, 0xBC29, 0xBC2D, 0xBC30, 0xBC31, 
-    0xBC34, 0xBC38, 0xBC40, 0xBC43, 0xBC45, 0xBC49, 0xBC6C, 0xBC84, 0xBC85, 0xBC88, 
-    0xBC8C, 0xBC94, 0xBC95, 0xBC97, 0xBC99, 0xBCA0, 0xBCA4, 0xBCA8, 0xBCB1, 0xBCB3, 
-    0xBCB5, 0xBCBC, 0xBCBD, 0xBCC0, 0xBCC4, 0xBCCD, 0xBCD0, 0xBCD1, 0xBCD5, 0xBCF4, 
-    0xBCF5, 0xBCF6, 0xBCF8, 0xBCFC, 0xBD04, 0xBD05, 0xBD09, 0xBD10, 0xBD24, 0xBD40, 
-    0xBD48, 0xBD4C, 0xBD50, 0xBD59, 0xBD80, 0xBD81, 0xBD84, 0xBD88, 0xBD89, 0xBD90, 
-    0xBD91, 0xBD93, 0xBD95, 0xBD99, 0xBDD4, 0xBDF0, 0xBE0C, 0xBE10, 0xBE14, 0xBE44, 
-    0xBE45, 0xBE48, 0xBE4C, 0xBE54, 0xBE55, 0xBE57, 0xBE59, 0xBE5A, 0xBE5B, 0xBE60, 
-    0xBE61, 0xBE64, 0xBE68, 0xBE74, 0xBE75, 0xBE7C, 0xBE7D, 0xBE80, 0xBE84, 0xBE8F, 
-    0xBEA8, 0xBED0, 0xBED1, 0xBED4, 0xBED7, 0xBED8, 0xBEE3, 0xBEE4, 0xBEE5, 0xBF08, 
-    0xBF18, 0xBF1B, 0xBF40, 0xBF50, 0xBF51, 0xBFB0, 0xBFC5, 0xBFCC, 0xBFCD, 0xBFD0, 
-    0xBFD4, 0xBFDC, 0xC058, 0xC05C, 0xC060, 0xC068, 0xC069, 0xC090, 0xC0AC, 0xC0AD, 
-    0xC0B0, 0xC0B4, 0xC0B6, 0xC0BC, 0xC0BD, 0xC0BF, 0xC0C0, 0xC0C1, 0xC0C5, 0xC0C8, 
-    0xC0C9, 0xC0CC, 0xC0D0, 0xC0D8, 0xC0DB, 0xC0DC, 0xC0DD, 0xC0E4, 0xC0E8, 0xC0EC, 
-    0xC0F4, 0xC0F7, 0xC0F9, 0xC100, 0xC11C, 0xC11D, 0xC11E, 0xC120, 0xC124, 0xC12C, 
-    0xC12D, 0xC12F, 0xC130, 0xC131, 0xC138, 0xC139, 0xC13C, 0xC140, 0xC148, 0xC149, 
-    0xC14B, 0xC14C, 0xC154, 0xC158, 0xC15C, 0xC168, 0xC170, 0xC178, 0xC18C, 0xC18D, 
-    0xC18E, 0xC190, 0xC194, 0xC19C, 0xC19F, 0xC1A1, 0xC1A5, 0xC1C4, 0xC1E0, 0xC1F3, 
-    0xC1FC, 0xC204, 0xC218, 0xC219, 0xC21C, 0xC21F, 0xC220, 0xC228, 0xC229, 0xC22B, 
-    0xC22D, 0xC22F, 0xC231, 0xC232, 0xC234, 0xC248, 0xC250, 0xC26C, 0xC26D, 0xC270, 
-    0xC274, 0xC27C, 0xC27D, 0xC27F, 0xC288, 0xC298, 0xC29D, 0xC2A4, 0xC2A5, 0xC2A8, 
-    0xC2AC, 0xC2AD, 0xC2B4, 0xC2B5, 0xC2B7, 0xC2B9, 0xC2DC, 0xC2DD, 0xC2E0, 0xC2E3, 
-    0xC2E4, 0xC2EB, 0xC2EC, 0xC2ED, 0xC2EF, 0xC2F1, 0xC2F6, 0xC2F8, 0xC2F9, 0xC2FC, 
-    0xC300, 0xC309, 0xC30C, 0xC30D, 0xC313, 0xC315, 0xC318, 0xC324, 0xC329, 0xC368, 
-    0xC369, 0xC36C, 0xC370, 0xC379, 0xC37C, 0xC37D, 0xC384, 0xC388, 0xC3D8, 0xC3D9, 
-    0xC3DC, 0xC3DF, 0xC3E0, 0xC3ED, 0xC3F4, 0xC408, 0xC410, 0xC42C, 0xC464, 0xC465, 
-    0xC4F0, 0xC4F1, 0xC4F4, 0xC4F8, 0xC500, 0xC501, 0xC50C, 0xC528, 0xC529, 0xC52C, 
-    0xC530, 0xC539, 0xC53B, 0xC544, 0xC545, 0xC548, 0xC549, 0xC54A, 0xC54C, 0xC54E, 
-    0xC553, 0xC554, 0xC555, 0xC557, 0xC558, 0xC559, 0xC55E, 0xC560, 0xC561, 0xC564, 
-    0xC568, 0xC570, 0xC573, 0xC574, 0xC575, 0xC57C, 0xC57D, 0xC580, 0xC584, 0xC587, 
-    0xC58C, 0xC58D, 0xC591, 0xC595, 0xC597, 0xC598, 0xC5B4, 0xC5B5, 0xC5B8, 0xC5B9, 
-    0xC5BB, 0xC5BC, 0xC5BD, 0xC5C4, 0xC5C5, 0xC5C6, 0xC5C7, 0xC5C8, 0xC5C9, 0xC5CA, 
-    0xC5CC, 0xC5CE, 0xC5D0, 0xC5D1, 0xC5D4, 0xC5D8, 0xC5E0, 0xC5E3, 0xC5E5, 0xC5EC, 
-    0xC5ED, 0xC5EE, 0xC5F0, 0xC5F4, 0xC5FC, 0xC5FD, 0xC5FE, 0xC5FF, 0xC600, 0xC601, 
-    0xC605, 0xC606, 0xC608, 0xC60C, 0xC61B, 0xC624, 0xC625, 0xC628, 0xC62C, 0xC62E, 
-    0xC633, 0xC634, 0xC635, 0xC637, 0xC639, 0xC640, 0xC644, 0xC648, 0xC651, 0xC654, 
-    0xC655, 0xC65C, 0xC660, 0xC678, 0xC67C, 0xC694, 0xC695, 0xC698, 0xC6A9, 0xC6B0, 
-    0xC6B1, 0xC6B4, 0xC6B8, 0xC6C0, 0xC6C1, 0xC6C3, 0xC6C5, 0xC6CC, 0xC6CD, 0xC6D0, 
-    0xC6D4, 0xC6DC, 0xC6E0, 0xC6E8, 0xC6E9, 0xC6EC, 0xC6F0, 0xC6F9, 0xC704, 0xC705, 
-    0xC708, 0xC70C, 0xC717, 0xC719, 0xC720, 0xC721, 0xC724, 0xC728, 0xC733, 0xC735, 
-    0xC73C, 0xC73D, 0xC740, 0xC744, 0xC74A, 0xC74C, 0xC74D, 0xC74F, 0xC751, 0xC758, 
-    0xC75C, 0xC774, 0xC775, 0xC778, 0xC77C, 0xC77D, 0xC783, 0xC784, 0xC785, 0xC787, 
-    0xC788, 0xC789, 0xC78A, 0xC78C, 0xC78E, 0xC790, 0xC791, 0xC794, 0xC796, 0xC798, 
-    0xC7A0, 0xC7A1, 0xC7A3, 0xC7A4, 0xC7A5, 0xC7A6, 0xC7AC, 0xC7AD, 0xC7BC, 0xC7BD, 
-    0xC7BF, 0xC7C1, 0xC7C8, 0xC7E4, 0xC800, 0xC801, 0xC804, 0xC808, 0xC80A, 0xC810, 
-    0xC811, 0xC813, 0xC815, 0xC816, 0xC81C, 0xC81D, 0xC820, 0xC824, 0xC82D, 0xC82F, 
-    0xC831, 0xC838, 0xC83C, 0xC84C, 0xC870, 0xC871, 0xC874, 0xC878, 0xC880, 0xC881, 
-    0xC885, 0xC887, 0xC88B, 0xC88C, 0xC8C4, 0xC8D4, 0xC8D7, 0xC8E0, 0xC8FC, 0xC8FD, 
-    0xC900, 0xC904, 0xC90C, 0xC90D, 0xC90F, 0xC911, 0xC918, 0xC92C, 0xC950, 0xC954, 
-    0xC961, 0xC96C, 0xC988, 0xC989, 0xC98C, 0xC990, 0xC998, 0xC999, 0xC99D, 0xC9C0, 
-    0xC9C1, 0xC9C4, 0xC9C8, 0xC9CA, 0xC9D0, 0xC9D1, 0xC9D3, 0xC9D5, 0xC9D6, 0xC9D9, 
-    0xC9DA, 0xC9DC, 0xC9DD, 0xC9E0, 0xC9E2, 0xC9E4, 0xC9E7, 0xC9ED, 0xC9F0, 0xC9F1, 
-    0xC9F8, 0xCA09, 0xCA0C, 0xCA4C, 0xCA4D, 0xCA50, 0xCA54, 0xCA61, 0xCA68, 0xCA84, 
-    0xCA98, 0xCABC, 0xCABD, 0xCAC4, 0xCAD2, 0xCAD3, 0xCB10, 0xCB14, 0xCB48, 0xCB49, 
-    0xCB50, 0xCB59, 0xCB64, 0xCBD4, 0xCBE4, 0xCBE7, 0xCC0C, 0xCC0D, 0xCC10, 0xCC14, 
-    0xCC1C, 0xCC21, 0xCC22, 0xCC27, 0xCC28, 0xCC29, 0xCC2C, 0xCC2E, 0xCC30, 0xCC38, 
-    0xCC39, 0xCC3B, 0xCC3C, 0xCC3D, 0xCC3E, 0xCC44, 0xCC45, 0xCC48, 0xCC4C, 0xCC54, 
-    0xCC55, 0xCC57, 0xCC58, 0xCC59, 0xCC60, 0xCC98, 0xCC99, 0xCC9C, 0xCCA0, 0xCCA8, 
-    0xCCA9, 0xCCAB, 0xCCAD, 0xCCB4, 0xCCB8, 0xCCBC, 0xCCC7, 0xCCD0, 0xCCE4, 0xCD08, 
-    0xCD09, 0xCD0C, 0xCD18, 0xCD1B, 0xCD1D, 0xCD5C, 0xCD78, 0xCD94, 0xCD95, 0xCD98, 
-    0xCD9C, 0xCDA4, 0xCDA5, 0xCDA9, 0xCDB0, 0xCDC4, 0xCDCC, 0xCDE8, 0xCE04, 0xCE20, 
-    0xCE21, 0xCE30, 0xCE35, 0xCE58, 0xCE59, 0xCE5C, 0xCE60, 0xCE68, 0xCE69, 0xCE6B, 
-    0xCE6D, 0xCE74, 0xCE75, 0xCE78, 0xCE7C, 0xCE84, 0xCE87, 0xCE89, 0xCE90, 0xCE91, 
-    0xCE94, 0xCE98, 0xCEA0, 0xCEA1, 0xCEE4, 0xCEE5, 0xCEE8, 0xCEEC, 0xCEF4, 0xCEF5, 
-    0xCEF7, 0xCEF8, 0xCEF9, 0xCF00, 0xCF04, 0xCF08, 0xCF13, 0xCF1C, 0xCF20, 0xCF24, 
-    0xCF2D, 0xCF30, 0xCF54, 0xCF58, 0xCF5C, 0xCF64, 0xCF65, 0xCF67, 0xCF69, 0xCF70, 
-    0xCF78, 0xCF85, 0xCF8C, 0xCFC4, 0xCFE0, 0xCFE8, 0xCFF0, 0xCFF5, 0xCFFC, 0xD000, 
-    0xD004, 0xD018, 0xD034, 0xD035, 0xD038, 0xD050, 0xD058, 0xD06C, 0xD070, 0xD074, 
-    0xD07C, 0xD07D, 0xD081, 0xD0A4, 0xD0A5, 0xD0A8, 0xD0AC, 0xD0B4, 0xD0B5, 0xD0B7, 
-    0xD0B9, 0xD0C0, 0xD0C1, 0xD0C4, 0xD0C8, 0xD0C9, 0xD0D0, 0xD0D1, 0xD0D3, 0xD0D4, 
-    0xD0D5, 0xD0DC, 0xD0DD, 0xD0E0, 0xD0E4, 0xD0EC, 0xD0ED, 0xD0EF, 0xD0F0, 0xD0F1, 
-    0xD130, 0xD131, 0xD134, 0xD138, 0xD140, 0xD141, 0xD145, 0xD14C, 0xD14D, 0xD150, 
-    0xD154, 0xD15C, 0xD15D, 0xD168, 0xD17C, 0xD1A0, 0xD1A1, 0xD1A4, 0xD1A8, 0xD1B0, 
-    0xD1B1, 0xD1B5, 0xD1F4, 0xD22C, 0xD22D, 0xD230, 0xD234, 0xD23C, 0xD23D, 0xD241, 
-    0xD264, 0xD280, 0xD284, 0xD291, 0xD295, 0xD29C, 0xD2B8, 0xD2B9, 0xD2BC, 0xD2C0, 
-    0xD2C8, 0xD2C9, 0xD2F0, 0xD2F1, 0xD2F4, 0xD2F8, 0xD300, 0xD301, 0xD305, 0xD30C, 
-    0xD30D, 0xD30E, 0xD310, 0xD314, 0xD31D, 0xD31F, 0xD320, 0xD321, 0xD325, 0xD328, 
-    0xD329, 0xD32C, 0xD330, 0xD33B, 0xD33D, 0xD37C, 0xD37D, 0xD380, 0xD384, 0xD38C, 
-    0xD390, 0xD391, 0xD398, 0xD399, 0xD39C, 0xD3A0, 0xD3AB, 0xD3AD, 0xD3B4, 0xD3B8, 
-    0xD3BC, 0xD3C4, 0xD3C8, 0xD3C9, 0xD3D0, 0xD3EC, 0xD3ED, 0xD3F0, 0xD3F4, 0xD3FC, 
-    0xD45C, 0xD478, 0xD479, 0xD47C, 0xD480, 0xD482, 0xD488, 0xD489, 0xD48B, 0xD48D, 
-    0xD4CC, 0xD4E8, 0xD4F8, 0xD504, 0xD508, 0xD50C, 0xD514, 0xD515, 0xD53C, 0xD53D, 
-    0xD540, 0xD544, 0xD54C, 0xD54D, 0xD54F, 0xD551, 0xD558, 0xD559, 0xD55C, 0xD560, 
-    0xD565, 0xD568, 0xD569, 0xD56B, 0xD56D, 0xD574, 0xD575, 0xD578, 0xD57C, 0xD584, 
-    0xD587, 0xD588, 0xD589, 0xD5A5, 0xD5C8, 0xD5C9, 0xD5CC, 0xD5D0, 0xD5D8, 0xD5DB, 
-    0xD5DD, 0xD5E4, 0xD5E5, 0xD5E8, 0xD5EC, 0xD5F4, 0xD5F7, 0xD5F9, 0xD600, 0xD601, 
-    0xD604, 0xD608, 0xD610, 0xD611, 0xD613, 0xD614, 0xD615, 0xD61C, 0xD638, 0xD639, 
-    0xD63C, 0xD640, 0xD648, 0xD649, 0xD64D, 0xD654, 0xD655, 0xD658, 0xD65C, 0xD669, 
-    0xD683, 0xD68C, 0xD68D, 0xD69F, 0xD6A1, 0xD6A8, 0xD6C4, 0xD6C5, 0xD6C8, 0xD6CC, 
-    0xD6D1, 0xD6D4, 0xD6D7, 0xD6E4, 0xD6E8, 0xD6FC, 0xD718, 0xD719, 0xD71C, 0xD720, 
-    0xD729, 0xD734, 0xD749, 0xD750, 0xD751, 0xD754, 0xD758, 0xD759, 0xD760, 0xD761, 
-    0xD763, 0xD765, 0xD769, 0xD76C, 0xD770, 0xD788, 0xD78C, 0xD790, 0xD798, 0xD799, 
-    0xD79D, 
+    0xC774, 0xB2E4, 0xC9C0, 0xB294, 0xAC00, 0xC5B4, 0xC744, 0xB2C8, 0xD558, 0xC5D0, 
+    0xADF8, 0xC758, 0xC694, 0xC544, 0xACE0, 0xC740, 0xAE30, 0xD574, 0xC788, 0xB3C4, 
+    0xD55C, 0xB098, 0xAC8C, 0xB4E4, 0xB85C, 0xB9AC, 0xC0AC, 0xB97C, 0xC790, 0xC11C, 
+    0xAC70, 0xC2DC, 0xC57C, 0xB9CC, 0xC218, 0xC2B5, 0xB300, 0xC2E0, 0xB77C, 0xB9C8, 
+    0xBA74, 0xC73C, 0xC8FC, 0xBCF4, 0xC2A4, 0xAC83, 0xB0B4, 0xC81C, 0xBB34, 0xC804, 
+    0xC778, 0xC5EC, 0xC815, 0xB124, 0xC6B0, 0xC624, 0xB9D0, 0xB2F9, 0xD560, 0xC0C1, 
+    0xC5C6, 0xC77C, 0xBB38, 0xB4DC, 0xC548, 0xBAA8, 0xBD80, 0xC5C8, 0xC18C, 0xAD6C, 
+    0xD588, 0xB824, 0xC54A, 0xACA0, 0xC7A5, 0xBA85, 0xC801, 0xB974, 0xB354, 0xB370, 
+    0xC0DD, 0xC131, 0xB108, 0xC54C, 0xBB3C, 0xC74C, 0xAC74, 0xCE58, 0xD569, 0xB7EC, 
+    0xB798, 0xC785, 0xACFC, 0xB3D9, 0xC704, 0xAE4C, 0xC640, 0xBE44, 0xC8FD, 0xC138, 
+    0xB4E0, 0xC800, 0xC6D0, 0xBBF8, 0xC6A9, 0xB418, 0xBC14, 0xAC19, 0xC9C4, 0xC720, 
+    0xAE08, 0xD788, 0xBC95, 0xC911, 0xD654, 0xB808, 0xC2E4, 0xAC04, 0xAD70, 0xB514, 
+    0xD130, 0xC6B4, 0xC870, 0xC608, 0xAC01, 0xC88B, 0xB450, 0xC120, 0xB54C, 0xBD84, 
+    0xB978, 0xBC84, 0xACF5, 0xD2B8, 0xC601, 0xC18D, 0xC5ED, 0xC558, 0xAC78, 0xBC1C, 
+    0xCCB4, 0xACBD, 0xCC3E, 0xBC29, 0xB2E8, 0xAD00, 0xC9C1, 0xB78C, 0xC791, 0xB140, 
+    0xC5B8, 0xD53C, 0xB3CC, 0xCC98, 0xC2EC, 0xB7FC, 0xC2F6, 0xC6CC, 0xD544, 0xC7AC, 
+    0xB825, 0xC9C8, 0xC8E0, 0xC0B4, 0xACC4, 0xB178, 0xC904, 0xBC18, 0xBD88, 0xB0A0, 
+    0xB807, 0xB204, 0xBABB, 0xAC10, 0xB09C, 0xBC1B, 0xBA70, 0xAC1C, 0xBCD1, 0xAE38, 
+    0xC220, 0xD30C, 0xD568, 0xC838, 0xACA9, 0xAD74, 0xC9D1, 0xBB50, 0xB9B0, 0xC871, 
+    0xBCA8, 0xD56D, 0xB9CE, 0xD5D8, 0xD0A8, 0xB358, 0xB2A5, 0xD14C, 0xD638, 0xB984, 
+    0xC6C0, 0xB0A8, 0xB9BC, 0xACB0, 0xC124, 0xD22C, 0xD589, 0xAC15, 0xACF3, 0xD1B5, 
+    0xC6B8, 0xD504, 0xD0C0, 0xB791, 0xB7F0, 0xCC28, 0xD615, 0xB41C, 0xC2DD, 0xC5F0, 
+    0xBC30, 0xC798, 0xAED8, 0xC885, 0xBCFC, 0xC65C, 0xC545, 0xD06C, 0xB839, 0xC11D, 
+    0xC918, 0xB8CC, 0xC57D, 0xCABD, 0xBCA0, 0xADFC, 0xB0E5, 0xCD94, 0xAD50, 0xB9B4, 
+    0xC880, 0xBA38, 0xCE5C, 0xB9DD, 0xC784, 0xB8E8, 0xB5BB, 0xBC88, 0xC5BC, 0xBD10, 
+    0xD658, 0xAC08, 0xBCF8, 0xC2A8, 0xC0C8, 0xBCF5, 0xBAA9, 0xC600, 0xD328, 0xB2EC, 
+    0xADC0, 0xC5F4, 0xAC11, 0xC654, 0xC7A0, 0xC808, 0xB2D8, 0xB9C9, 0xC810, 0xB9DE, 
+    0xC190, 0xB05D, 0xD63C, 0xB85D, 0xD3EC, 0xD798, 0xB9E4, 0xB530, 0xC708, 0xAC80, 
+    0xB420, 0xC21C, 0xC628, 0xD68C, 0xD1A0, 0xCE74, 0xD655, 0xC84C, 0xC2F8, 0xC4F0, 
+    0xACA8, 0xB208, 0xCD5C, 0xB3FC, 0xACAC, 0xCF54, 0xD070, 0xB290, 0xC598, 0xB410, 
+    0xAD34, 0xC228, 0xB780, 0xAE34, 0xD0A4, 0xACE8, 0xB5A0, 0xBCC4, 0xB07C, 0xD0DD, 
+    0xBFD0, 0xBBFF, 0xD310, 0xBCC0, 0xCE68, 0xB4DD, 0xC796, 0xD559, 0xC62C, 0xD6C4, 
+    0xD2F0, 0xCDA9, 0xB610, 0xB860, 0xD45C, 0xBB58, 0xC2ED, 0xC900, 0xCD08, 0xBA54, 
+    0xD2B9, 0xC232, 0xC168, 0xCCAD, 0xBAB0, 0xC0C9, 0xD0DC, 0xB0AC, 0xB2F5, 0xB838, 
+    0xC874, 0xC7A1, 0xD604, 0xC591, 0xD600, 0xB828, 0xC5D4, 0xAD8C, 0xC637, 0xBE5B, 
+    0xC99D, 0xC5C5, 0xCD9C, 0xC751, 0xAC81, 0xAE09, 0xC1E0, 0xC0E4, 0xC5D8, 0xBBFC, 
+    0xD5A5, 0xB188, 0xB155, 0xBA87, 0xD3B8, 0xC0B0, 0xC9D3, 0xCCD0, 0xD76C, 0xB110, 
+    0xC625, 0xB298, 0xBE0C, 0xB9BD, 0xC811, 0xD0D1, 0xC644, 0xC2B9, 0xB5A4, 0xB77D, 
+    0xD6A8, 0xCE78, 0xB9AD, 0xD3C9, 0xB10C, 0xCC45, 0xB3C5, 0xB458, 0xBE60, 0xAD11, 
+    0xCC3D, 0xC5BB, 0xBC15, 0xB958, 0xCC9C, 0xCF1C, 0xC5C7, 0xC5FC, 0xD07C, 0xD5C8, 
+    0xB180, 0xB4A4, 0xB0D0, 0xBA39, 0xBB54, 0xBE68, 0xD65C, 0xB429, 0xC8C4, 0xAD6D, 
+    0xD50C, 0xBC94, 0xD488, 0xC7C1, 0xAC14, 0xB4EF, 0xC6D4, 0xC783, 0xCC38, 0xC5B5, 
+    0xC678, 0xAE68, 0xB2F4, 0xB73B, 0xC55E, 0xBC00, 0xC2AC, 0xCC2E, 0xBA3C, 0xC6C5, 
+    0xAEBC, 0xBC8C, 0xD669, 0xD480, 0xC5C4, 0xB818, 0xC12C, 0xAE00, 0xCE7C, 0xB054, 
+    0xBD81, 0xBA78, 0xD15C, 0xB355, 0xD0C8, 0xB3C8, 0xCA4C, 0xAC71, 0xC554, 0xCC29, 
+    0xD611, 0xCC0D, 0xC500, 0xC560, 0xAD1C, 0xD314, 0xCC44, 0xC820, 0xC219, 0xCC30, 
+    0xB4E3, 0xAD81, 0xB525, 0xC9DC, 0xCEE4, 0xB7F4, 0xAF64, 0xBCBD, 0xBD24, 0xD765, 
+    0xC4F8, 0xC368, 0xC528, 0xC9F8, 0xB9F9, 0xCCE4, 0xD0D0, 0xBC16, 0xB193, 0xD639, 
+    0xC26C, 0xD3ED, 0xB864, 0xD6C8, 0xB545, 0xC655, 0xD37C, 0xB0C8, 0xB728, 0xBD99, 
+    0xD398, 0xBD09, 0xB144, 0xB291, 0xCD95, 0xB86D, 0xB18D, 0xB2CC, 0xD2F4, 0xB7FD, 
+    0xC6E0, 0xC6C3, 0xB04C, 0xBC31, 0xC92C, 0xB0BC, 0xB3D5, 0xD2C0, 0xB80C, 0xACBC, 
+    0xB8EC, 0xC2EB, 0xC794, 0xC52C, 0xB5A8, 0xCE60, 0xBA4D, 0xC170, 0xD081, 0xCDE8, 
+    0xAE4A, 0xB611, 0xB192, 0xBE14, 0xC9D5, 0xCE90, 0xC78A, 0xC9D6, 0xACE4, 0xBE4C, 
+    0xB840, 0xC27D, 0xD3A0, 0xD6E8, 0xAC90, 0xD074, 0xAFC8, 0xB0A9, 0xB369, 0xCCA0, 
+    0xBAB8, 0xC9D0, 0xB118, 0xCE35, 0xB364, 0xC05C, 0xC988, 0xACE7, 0xD150, 0xD39C, 
+    0xBD05, 0xB044, 0xAE50, 0xB2E5, 0xD760, 0xAFB8, 0xAFBC, 0xD718, 0xC0B6, 0xB790, 
+    0xC058, 0xC154, 0xB4F1, 0xBB3B, 0xD1F4, 0xC2B4, 0xAC16, 0xBA48, 0xD5E4, 0xB465, 
+    0xBC24, 0xC775, 0xD6CC, 0xC1A1, 0xB123, 0xB985, 0xB9C1, 0xC9DD, 0xB7C9, 0xC950, 
+    0xB78D, 0xBD89, 0xB96D, 0xB784, 0xC61B, 0xC559, 0xCC2C, 0xD5EC, 0xD68D, 0xBA40, 
+    0xB79C, 0xD0C1, 0xB835, 0xD608, 0xC0BC, 0xD0C4, 0xB515, 0xBE7C, 0xD754, 0xB1CC, 
+    0xB454, 0xB2D9, 0xAEF4, 0xB460, 0xB35C, 0xB0B8, 0xCA0C, 0xD78C, 0xBC97, 0xC30D, 
+    0xC555, 0xC990, 0xD61C, 0xD790, 0xAC07, 0xD478, 0xB128, 0xADF9, 0xD6D4, 0xB7AC, 
+    0xB451, 0xC989, 0xB518, 0xC695, 0xC80A, 0xCCA9, 0xD0AC, 0xD48D, 0xB8E1, 0xBB18, 
+    0xC27F, 0xC557, 0xD751, 0xB9E1, 0xB0AD, 0xD3D0, 0xBC1D, 0xB299, 0xB46C, 0xD750, 
+    0xAF2C, 0xC384, 0xB0AB, 0xB274, 0xC721, 0xB9D9, 0xBED0, 0xCAD3, 0xAC12, 0xB0C4, 
+    0xBA5C, 0xCC99, 0xD138, 0xCD09, 0xCCAB, 0xC194, 0xB538, 0xB801, 0xD749, 0xB6F0, 
+    0xCDB0, 0xCF30, 0xAF43, 0xBC40, 0xB179, 0xB0C5, 0xB17C, 0xB194, 0xB2D0, 0xD2BC, 
+    0xCE21, 0xB0C9, 0xD614, 0xACC1, 0xB531, 0xC90D, 0xD734, 0xCC0C, 0xBE48, 0xB0AE, 
+    0xB2EB, 0xBF08, 0xC1C4, 0xC77D, 0xAF2D, 0xBCA4, 0xADDC, 0xACF0, 0xD0B5, 0xB36E, 
+    0xACE1, 0xB00C, 0xC12F, 0xBB35, 0xD321, 0xB4C8, 0xC22D, 0xD761, 0xAE5D, 0xB4C0, 
+    0xB809, 0xBB36, 0xC606, 0xCD1D, 0xAE43, 0xD540, 0xB9E5, 0xC70C, 0xCBE4, 0xD1B1, 
+    0xB800, 0xCE20, 0xC635, 0xCDA4, 0xD640, 0xCF8C, 0xD54F, 0xC88C, 0xCF08, 0xC529, 
+    0xD758, 0xC4F4, 0xC6E8, 0xBCBC, 0xC0AD, 0xB2A6, 0xBA4B, 0xB760, 0xB9DB, 0xBCB5, 
+    0xB480, 0xB9E8, 0xB08C, 0xB099, 0xD2F8, 0xB82C, 0xC369, 0xB4ED, 0xB9BF, 0xBFD4, 
+    0xC158, 0xB0AF, 0xB78F, 0xC5C9, 0xB8E9, 0xBF51, 0xC633, 0xB6AB, 0xBE45, 0xB04A, 
+    0xD038, 0xD769, 0xC22B, 0xBED4, 0xD508, 0xACAA, 0xAFC0, 0xC12D, 0xB5BC, 0xB871, 
+    0xCD0C, 0xB7AB, 0xB8B0, 0xC564, 0xB7B5, 0xCFE0, 0xBFCC, 0xD5DB, 0xADE0, 0xC878, 
+    0xD0D3, 0xAC54, 0xC549, 0xB51C, 0xC9E7, 0xD3B4, 0xC140, 0xAD73, 0xBC34, 0xAC77, 
+    0xBE5A, 0xC998, 0xD034, 0xC14B, 0xB150, 0xCE59, 0xC561, 0xCC22, 0xCF58, 0xBC11, 
+    0xC67C, 0xBABD, 0xB86F, 0xB461, 0xC4F1, 0xD134, 0xCEF7, 0xAE41, 0xC6B1, 0xB048, 
+    0xB729, 0xBD59, 0xAFD4, 0xB799, 0xBC0F, 0xCC59, 0xB2FF, 0xC13C, 0xC2B7, 0xCE69, 
+    0xCE6D, 0xC130, 0xC313, 0xCA4D, 0xC73D, 0xD305, 0xC11E, 0xCA54, 0xB1E8, 0xB4B7, 
+    0xAD76, 0xB69D, 0xBE59, 0xC3DF, 0xC62E, 0xD5CC, 0xB084, 0xBC0C, 0xC0CC, 0xCF00, 
+    0xCF04, 0xAF34, 0xC728, 0xAE61, 0xD649, 0xAC1D, 0xBFDC, 0xD140, 0xB9FA, 0xBE55, 
+    0xD131, 0xC288, 0xD2C8, 0xB744, 0xCDA5, 0xB053, 0xB4EC, 0xBAAB, 0xB2AC, 0xD575, 
+    0xADA4, 0xB700, 0xC19F, 0xC37C, 0xB20C, 0xD514, 0xAE54, 0xBAAC, 0xD329, 0xAE5C, 
+    0xB72F, 0xBBC0, 0xD241, 0xD799, 0xD0A5, 0xB154, 0xB220, 0xB987, 0xB98E, 0xAFE8, 
+    0xD29C, 0xD610, 0xD759, 0xAC1A, 0xAFF0, 0xB550, 0xCEEC, 0xD14D, 0xB057, 0xB428, 
+    0xC813, 0xC2FC, 0xC789, 0xAF08, 0xAFB9, 0xAE65, 0xAECD, 0xBB49, 0xBC1F, 0xCCA8, 
+    0xB534, 0xD0D5, 0xB9D1, 0xB9D8, 0xB141, 0xB2EE, 0xB810, 0xBCCD, 0xCC14, 0xAE0B, 
+    0xC069, 0xC580, 0xD280, 0xB137, 0xC148, 0xCF64, 0xD23C, 0xD31D, 0xACB9, 0xC068, 
+    0xC0E8, 0xC234, 0xAC89, 0xB215, 0xB2ED, 0xB6B1, 0xC1FC, 0xD3BC, 0xBD95, 0xC719, 
+    0xD234, 0xACB8, 0xAE01, 0xBE75, 0xAF42, 0xB113, 0xB374, 0xB7FF, 0xC100, 0xC274, 
+    0xCC58, 0xAECF, 0xB080, 0xBED7, 0xD729, 0xB960, 0xC7AD, 0xD035, 0xD1B0, 0xD551, 
+    0xD64D, 0xAE40, 0xB0A1, 0xC060, 0xC5FD, 0xD587, 0xB8F0, 0xC6C1, 0xC787, 0xC824, 
+    0xD2F1, 0xD3F0, 0xBC49, 0xD018, 0xACF1, 0xAE4E, 0xAFC7, 0xB2C9, 0xC0BD, 0xC19C, 
+    0xCDC4, 0xB08D, 0xCF5C, 0xD683, 0xB109, 0xB1A8, 0xB378, 0xB7ED, 0xBE61, 0xC3D8, 
+    0xC5B9, 0xC816, 0xC90C, 0xCD98, 0xD6D1, 0xC090, 0xC0EC, 0xD648, 0xB529, 0xCABC, 
+    0xD145, 0xAF49, 0xB959, 0xC501, 0xC881, 0xCCC7, 0xD0F1, 0xBE57, 0xC2F1, 0xC5BD, 
+    0xC9D9, 0xD300, 0xD5E5, 0xBC27, 0xBC85, 0xD1A8, 0xD5D0, 0xAC24, 0xBC25, 0xC584, 
+    0xCB64, 0xAC31, 0xB3CB, 0xB7A8, 0xB8F8, 0xBA67, 0xC379, 0xCE6B, 0xCFE8, 0xD770, 
+    0xB055, 0xB091, 0xB0B3, 0xB2E2, 0xB69C, 0xB81B, 0xB8F9, 0xC5EE, 0xCC21, 0xAC2F, 
+    0xB52A, 0xB834, 0xBC0B, 0xC26D, 0xCEA0, 0xCEE8, 0xD479, 0xD47C, 0xD53D, 0xD5F7, 
+    0xACFD, 0xB35F, 0xB5A1, 0xC1A5, 0xC53B, 0xD1A4, 0xB12C, 0xBC45, 0xCB49, 0xAD7D, 
+    0xAEBE, 0xB2E6, 0xB904, 0xBC2D, 0xBFB0, 0xC0C5, 0xC2F9, 0xC37D, 0xC639, 0xCDCC, 
+    0xD3F4, 0xAF3C, 0xB367, 0xB837, 0xBB45, 0xBC43, 0xCA50, 0xD050, 0xAC94, 0xB540, 
+    0xB9F5, 0xC50C, 0xC81D, 0xAC13, 0xB38C, 0xB3DB, 0xBAB9, 0xBE54, 0xBE74, 0xC5CE, 
+    0xC724, 0xC78E, 0xCF67, 0xC539, 0xC587, 0xCA61, 0xD33D, 0xD48B, 0xB135, 0xB2F3, 
+    0xB304, 0xBD93, 0xC5CC, 0xCB50, 0xCB59, 0xCEF4, 0xD07D, 0xD54D, 0xB258, 0xB2A0, 
+    0xB730, 0xBE8F, 0xC568, 0xC5FF, 0xC735, 0xC82F, 0xCEA1, 0xCEF8, 0xD5F4, 0xAF3D, 
+    0xB385, 0xBB61, 0xC22F, 0xC465, 0xC9F1, 0xCCBC, 0xD168, 0xAC09, 0xB014, 0xBEA8, 
+    0xC139, 0xD154, 0xAE0D, 0xB09A, 0xB314, 0xB371, 0xB6A4, 0xBA58, 0xCD1B, 0xCF65, 
+    0xD0ED, 0xD4E8, 0xD69F, 0xAD82, 0xAEC4, 0xB625, 0xB7AD, 0xBEE4, 0xC0D8, 0xC15C, 
+    0xC2AD, 0xC5FE, 0xCC3C, 0xCF13, 0xB2AA, 0xBD50, 0xC29D, 0xC597, 0xC5D1, 0xC7BF, 
+    0xCF70, 0xD0B9, 0xD320, 0xD3FC, 0xD6A1, 0xAD49, 0xAEBD, 0xAED1, 0xB528, 0xB560, 
+    0xB72C, 0xB771, 0xC570, 0xC60C, 0xCC1C, 0xCF85, 0xCFF5, 0xAE70, 0xB01D, 0xB989, 
+    0xBA69, 0xC248, 0xC270, 0xC300, 0xC595, 0xCBE7, 0xCFFC, 0xD565, 0xAD04, 0xAF3F, 
+    0xAF80, 0xB0C7, 0xB797, 0xBB47, 0xBBF9, 0xBEE3, 0xBF40, 0xC309, 0xC660, 0xC6EC, 
+    0xD0D4, 0xD32C, 0xB234, 0xB365, 0xB544, 0xB755, 0xB8FB, 0xBD48, 0xC464, 0xC6F0, 
+    0xC6F9, 0xC74D, 0xC887, 0xC9CA, 0xCC48, 0xCC55, 0xD17C, 0xD301, 0xAD7F, 0xAF41, 
+    0xB07D, 0xB0B1, 0xB308, 0xB311, 0xB36B, 0xB86C, 0xBA84, 0xBC0D, 0xBE7D, 0xC605, 
+    0xC717, 0xC954, 0xC999, 0xCBD4, 0xD0B4, 0xD295, 0xD384, 0xD601, 0xAD2D, 0xAD90, 
+    0xB010, 0xB51B, 0xB739, 0xBC99, 0xBCD5, 0xC370, 0xC3DC, 0xC3E0, 0xC5E5, 0xC634, 
+    0xC6E9, 0xC7A3, 0xCB10, 0xCCB8, 0xCF69, 0xD30D, 0xD3AB, 0xD489, 0xAC40, 0xAF5D, 
+    0xAFC9, 0xB11D, 0xB158, 0xB764, 0xB9F4, 0xBC38, 0xBD04, 0xBDF0, 0xC2EF, 0xC36C, 
+    0xC9DA, 0xD1A1, 0xD380, 0xD6D7, 0xAD7C, 0xAE4D, 0xAFCD, 0xB301, 0xB55C, 0xBA49, 
+    0xBD90, 0xBD91, 0xBE10, 0xC0C0, 0xC410, 0xC58C, 0xC5E3, 0xCE94, 0xCE98, 0xCEF9, 
+    0xD058, 0xD0E4, 0xD390, 0xD391, 0xD6FC, 0xACEA, 0xADD3, 0xAE7C, 0xB968, 0xBBA4, 
+    0xBF50, 0xC178, 0xC250, 0xC2E3, 0xC530, 0xC58D, 0xC5E0, 0xC74F, 0xCA09, 0xCC39, 
+    0xCC4C, 0xCD18, 0xCE87, 0xCF24, 0xD0EC, 0xD15D, 0xD22D, 0xD578, 0xD5C9, 0xADC4, 
+    0xB10B, 0xB25C, 0xB2FB, 0xB3D4, 0xB463, 0xB5D0, 0xB975, 0xBC09, 0xBCB3, 0xBCD0, 
+    0xC0BF, 0xC18E, 0xC30C, 0xC574, 0xC648, 0xC7A4, 0xC7E4, 0xC98C, 0xC9E0, 0xCB48, 
+    0xCD78, 0xD0C9, 0xD230, 0xD515, 0xAC38, 0xAC9C, 0xAC9F, 0xAE7D, 0xB11C, 0xB205, 
+    0xB2F7, 0xB310, 0xB313, 0xB4E6, 0xB524, 0xB5B4, 0xB6F4, 0xB7B4, 0xB9F8, 0xBA4E, 
+    0xC204, 0xC27C, 0xC324, 0xC3F4, 0xC553, 0xC7A6, 0xC7C8, 0xC9E2, 0xCC10, 0xCE91, 
+    0xCF78, 0xD38C, 0xD3AD, 0xD54C, 0xD5E8, 0xD6C5, 0xD720, 0xAC17, 0xAD75, 0xB0D8, 
+    0xB138, 0xB2DD, 0xB5B1, 0xB5C4, 0xB6F8, 0xB738, 0xB74C, 0xB754, 0xB7A0, 0xB8FD, 
+    0xB918, 0xB95C, 0xB9E3, 0xB9F7, 0xBA55, 0xBB44, 0xBDD4, 0xBE64, 0xBE80, 0xBFC5, 
+    0xC0D0, 0xC0DB, 0xC0F7, 0xC0F9, 0xC14C, 0xC318, 0xC388, 0xC74A, 0xC9E4, 0xC9ED, 
+    0xCC27, 0xCC3B, 0xCEE5, 0xD000, 0xD0E0, 0xD264, 0xD31F, 0xD3C4, 0xD3C8, 0xD4F8, 
+    0xD5DD, 0xD613, 0xD719, 0xAC1B, 0xAC2C, 0xAC58, 0xACEF, 0xAE6C, 0xAFCB, 0xB125, 
+    0xB189, 0xB3A0, 0xB4B9, 0xBBAC, 0xBBC8, 0xBC08, 0xBCB1, 0xBED1, 0xBED8, 0xBF1B, 
+    0xC1F3, 0xC21F, 0xC231, 0xC315, 0xC3D9, 0xC3ED, 0xC42C, 0xC575, 0xC5CA, 0xC6DC, 
+    0xC733, 0xC7BC, 0xC7BD, 0xC83C, 0xC9F0, 0xCAC4, 0xCE30, 0xCE84, 0xCEF5, 0xCF2D, 
+    0xCFF0, 0xD004, 0xD0B7, 0xD284, 0xD2C9, 0xD30E, 0xD4CC, 0xD56B, 0xD584, 0xD6E4, 
+    0xD71C, 0xAC30, 0xAC4D, 0xAC5C, 0xAD88, 0xADC8, 0xADD1, 0xAE45, 0xAE79, 0xAE84, 
+    0xAF30, 0xB01C, 0xB08F, 0xB119, 0xB15C, 0xB18B, 0xB260, 0xB269, 0xB2DB, 0xB381, 
+    0xB554, 0xB561, 0xB618, 0xB796, 0xB7A9, 0xB9CF, 0xBA64, 0xBA71, 0xBAC4, 0xBB4D, 
+    0xBB63, 0xBCF6, 0xBD40, 0xBD4C, 0xBE84, 0xBEE5, 0xBF09, 0xBF18, 0xBFCD, 0xC0DC, 
+    0xC0F4, 0xC149, 0xC14D, 0xC229, 0xC298, 0xC2A5, 0xC329, 0xC408, 0xC54E, 0xC573, 
+    0xC651, 0xC698, 0xC6CD, 0xC705, 0xC75C, 0xC82D, 0xC831, 0xC8D4, 0xC8D7, 0xC90F, 
+    0xC961, 0xC96C, 0xCA68, 0xCA84, 0xCA98, 0xCB14, 0xCC57, 0xCC60, 0xCE04, 0xCE75, 
+    0xCE89, 0xCF20, 0xCFC4, 0xD0EF, 0xD0F0, 0xD141, 0xD23D, 0xD291, 0xD325, 0xD330, 
+    0xD33B, 0xD37D, 0xD399, 0xD482, 0xD57C, 0xD5F9, 0xD763, 0xD79D, 
+};
+
+// 글리프 인덱스 재배치 테이블 (트램펄린에서 ldrh 한 번으로 조회)
+// 순번 = (lead - 0xB0) * 94 + (trail - 0xA1), 베이크하지 않은 글자는 '?'
+__attribute__((used))
+static const uint16_t ksx1001_glyph_remap[KSX1001_REMAP_COUNT] = {
+    0x0104, 0x017C, 0x0175, 0x0366, 0x01FB, 0x0553, 0x003F, 0x01AD, 0x0206, 0x0388, 0x0527, 0x029E, 0x01CF, 0x0336, 0x064D, 0x016B, 
+    0x0469, 0x067B, 0x01B1, 0x0443, 0x003F, 0x04E5, 0x067C, 0x003F, 0x04FB, 0x06AB, 0x04E9, 0x062C, 0x003F, 0x003F, 0x05D6, 0x003F, 
+    0x06AC, 0x0403, 0x067D, 0x06AD, 0x011E, 0x02BF, 0x0156, 0x040B, 0x018A, 0x003F, 0x0217, 0x0262, 0x012D, 0x003F, 0x003F, 0x003F, 
+    0x0490, 0x003F, 0x003F, 0x0116, 0x0316, 0x0522, 0x062D, 0x003F, 0x062E, 0x0149, 0x003F, 0x0222, 0x01B8, 0x03F3, 0x0226, 0x003F, 
+    0x01CB, 0x0499, 0x048C, 0x003F, 0x02FD, 0x018D, 0x03A1, 0x01A4, 0x003F, 0x003F, 0x003F, 0x003F, 0x010E, 0x03B2, 0x0310, 0x0323, 
+    0x0231, 0x05FB, 0x003F, 0x067E, 0x03AF, 0x04BA, 0x01D0, 0x0184, 0x003F, 0x015C, 0x0506, 0x0191, 0x0590, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x0285, 0x003F, 0x02C6, 0x003F, 0x003F, 0x003F, 0x05C2, 0x022C, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0579, 
+    0x01EE, 0x003F, 0x003F, 0x003F, 0x003F, 0x0145, 0x0299, 0x0176, 0x0409, 0x01B9, 0x064E, 0x0434, 0x003F, 0x05E6, 0x050F, 0x05AE, 
+    0x02CD, 0x0563, 0x06AE, 0x003F, 0x025B, 0x05C3, 0x003F, 0x003F, 0x0452, 0x003F, 0x0204, 0x003F, 0x0613, 0x06AF, 0x003F, 0x06B0, 
+    0x05FC, 0x03AE, 0x0400, 0x003F, 0x010A, 0x0369, 0x01EB, 0x003F, 0x02B5, 0x049A, 0x016E, 0x0263, 0x0483, 0x0558, 0x003F, 0x0110, 
+    0x003F, 0x022F, 0x003F, 0x01B3, 0x003F, 0x04AD, 0x041D, 0x03C0, 0x06B1, 0x003F, 0x0308, 0x015F, 0x05E7, 0x04BB, 0x0328, 0x0458, 
+    0x003F, 0x045B, 0x03BA, 0x003F, 0x003F, 0x0441, 0x0475, 0x02A5, 0x003F, 0x067F, 0x0585, 0x003F, 0x06B2, 0x003F, 0x05FD, 0x062F, 
+    0x06B3, 0x003F, 0x003F, 0x02AE, 0x057A, 0x0510, 0x003F, 0x0564, 0x003F, 0x0476, 0x04A3, 0x003F, 0x057B, 0x01DE, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x035A, 0x003F, 0x003F, 0x003F, 0x0473, 0x003F, 0x003F, 0x0380, 0x03AC, 0x06B4, 0x003F, 0x043F, 0x051B, 
+    0x054B, 0x0591, 0x05AF, 0x049C, 0x0396, 0x003F, 0x04D5, 0x003F, 0x003F, 0x05D7, 0x02D2, 0x003F, 0x003F, 0x0592, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x032B, 0x0474, 0x032C, 0x03F4, 0x04BC, 0x0318, 0x05D8, 0x0680, 0x05E8, 0x003F, 0x0422, 0x003F, 
+    0x0465, 0x003F, 0x046A, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x03B3, 0x05C4, 0x0554, 0x06B5, 0x0586, 0x003F, 0x0327, 
+    0x003F, 0x041F, 0x03ED, 0x02F6, 0x003F, 0x044D, 0x02B7, 0x04F2, 0x046E, 0x003F, 0x020F, 0x0234, 0x05B0, 0x04A4, 0x043A, 0x03DC, 
+    0x04C1, 0x06B6, 0x04F3, 0x0115, 0x03DD, 0x0559, 0x01AE, 0x003F, 0x01A9, 0x04AE, 0x003F, 0x01C9, 0x0319, 0x0382, 0x0251, 0x037A, 
+    0x03A7, 0x03E5, 0x05B1, 0x04F4, 0x012E, 0x003F, 0x035D, 0x02F9, 0x0389, 0x0399, 0x0593, 0x02E7, 0x039F, 0x0292, 0x003F, 0x003F, 
+    0x064F, 0x003F, 0x01EC, 0x0152, 0x04C4, 0x0614, 0x0280, 0x0271, 0x003F, 0x049D, 0x031E, 0x06B7, 0x003F, 0x0630, 0x05D9, 0x033E, 
+    0x0135, 0x0681, 0x0368, 0x050C, 0x003F, 0x0536, 0x0487, 0x0650, 0x003F, 0x0195, 0x047E, 0x02EC, 0x003F, 0x0410, 0x003F, 0x0461, 
+    0x026A, 0x05DA, 0x06B8, 0x003F, 0x01A5, 0x0398, 0x039A, 0x0290, 0x003F, 0x0269, 0x0682, 0x06B9, 0x02F0, 0x030A, 0x02DE, 0x039B, 
+    0x003F, 0x003F, 0x04C5, 0x0357, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0432, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x01AB, 0x0631, 0x0223, 0x003F, 0x0456, 0x003F, 0x0491, 0x003F, 0x003F, 0x0462, 0x059E, 0x003F, 0x0540, 0x0615, 0x06BA, 0x003F, 
+    0x06BB, 0x0383, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0229, 0x02ED, 0x0103, 0x0273, 0x037D, 0x003F, 0x0541, 0x003F, 0x003F, 
+    0x01C4, 0x03D5, 0x056E, 0x0450, 0x003F, 0x003F, 0x0107, 0x04BD, 0x02F1, 0x039C, 0x003F, 0x020A, 0x0359, 0x06BC, 0x0651, 0x04F5, 
+    0x0101, 0x0329, 0x0511, 0x0190, 0x03A8, 0x0203, 0x0492, 0x047F, 0x003F, 0x0537, 0x02A6, 0x0252, 0x0632, 0x003F, 0x0139, 0x003F, 
+    0x0616, 0x0426, 0x0124, 0x05E9, 0x0538, 0x05B2, 0x0633, 0x05B3, 0x0634, 0x055A, 0x003F, 0x003F, 0x014E, 0x02BB, 0x003F, 0x01C3, 
+    0x003F, 0x035C, 0x003F, 0x0507, 0x0320, 0x059F, 0x051C, 0x031A, 0x05B4, 0x03B1, 0x014F, 0x055B, 0x049E, 0x04C6, 0x003F, 0x06BD, 
+    0x003F, 0x003F, 0x054C, 0x0528, 0x003F, 0x003F, 0x0683, 0x003F, 0x003F, 0x003F, 0x0113, 0x0282, 0x02BD, 0x04EA, 0x0198, 0x003F, 
+    0x003F, 0x0617, 0x02FA, 0x003F, 0x015D, 0x0529, 0x003F, 0x003F, 0x003F, 0x003F, 0x0225, 0x022B, 0x0169, 0x01D9, 0x0218, 0x046F, 
+    0x0297, 0x003F, 0x003F, 0x017E, 0x036C, 0x0358, 0x0283, 0x035B, 0x0419, 0x0618, 0x0339, 0x037E, 0x03DA, 0x003F, 0x003F, 0x0291, 
+    0x003F, 0x003F, 0x003F, 0x0433, 0x0684, 0x03BB, 0x003F, 0x03B7, 0x003F, 0x003F, 0x013F, 0x023B, 0x0164, 0x02CC, 0x0117, 0x0635, 
+    0x044E, 0x03E1, 0x029F, 0x0332, 0x003F, 0x0177, 0x0354, 0x036E, 0x05C5, 0x0405, 0x0636, 0x02CE, 0x003F, 0x057C, 0x04D2, 0x04FC, 
+    0x0215, 0x03A2, 0x047A, 0x0390, 0x0523, 0x003F, 0x003F, 0x05A0, 0x02E4, 0x003F, 0x0180, 0x003F, 0x046B, 0x06BE, 0x05EA, 0x003F, 
+    0x003F, 0x057D, 0x06BF, 0x0232, 0x0508, 0x027A, 0x0302, 0x003F, 0x003F, 0x003F, 0x0652, 0x003F, 0x0637, 0x003F, 0x01F6, 0x03F6, 
+    0x003F, 0x003F, 0x0653, 0x003F, 0x003F, 0x003F, 0x0619, 0x003F, 0x003F, 0x003F, 0x0242, 0x0309, 0x003F, 0x06C0, 0x0565, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x04F6, 0x0435, 0x003F, 0x055C, 0x03EB, 0x003F, 0x0493, 0x003F, 0x0393, 0x0638, 0x0654, 0x0453, 
+    0x003F, 0x003F, 0x02E8, 0x0420, 0x057E, 0x045C, 0x0542, 0x0655, 0x05C6, 0x02A7, 0x044B, 0x003F, 0x0656, 0x0657, 0x05A1, 0x03D7, 
+    0x05DB, 0x003F, 0x003F, 0x057F, 0x003F, 0x003F, 0x0126, 0x027B, 0x022E, 0x0347, 0x0193, 0x0344, 0x03E6, 0x032F, 0x01D5, 0x003F, 
+    0x06C1, 0x0594, 0x015A, 0x0423, 0x034E, 0x0658, 0x04EB, 0x06C2, 0x03F9, 0x036B, 0x0566, 0x0639, 0x03FC, 0x003F, 0x003F, 0x0342, 
+    0x0159, 0x04C7, 0x01D6, 0x02D1, 0x019B, 0x02F3, 0x049F, 0x03C6, 0x0391, 0x01AA, 0x0173, 0x03BC, 0x02FC, 0x0480, 0x02B3, 0x003F, 
+    0x04F7, 0x003F, 0x0147, 0x01A0, 0x0259, 0x03DF, 0x04FD, 0x0350, 0x051D, 0x0253, 0x01E4, 0x0312, 0x003F, 0x003F, 0x003F, 0x0118, 
+    0x0211, 0x0243, 0x02E2, 0x05B5, 0x02EF, 0x0418, 0x03F7, 0x003F, 0x003F, 0x003F, 0x003F, 0x03FA, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x01E7, 0x003F, 0x003F, 0x003F, 0x003F, 0x0374, 0x01F5, 0x03E8, 0x02FE, 0x04B2, 0x04EC, 0x04F8, 0x05A2, 0x0659, 
+    0x0512, 0x065A, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0289, 0x04D6, 0x065B, 0x04A7, 0x05FE, 0x003F, 
+    0x003F, 0x0346, 0x014D, 0x061A, 0x0182, 0x011B, 0x01C7, 0x033F, 0x0463, 0x0587, 0x003F, 0x003F, 0x0464, 0x0119, 0x027E, 0x01BC, 
+    0x01EF, 0x01CA, 0x0275, 0x03E2, 0x0340, 0x0127, 0x020B, 0x0121, 0x01C0, 0x06C3, 0x0138, 0x047C, 0x003F, 0x047D, 0x0385, 0x03D8, 
+    0x01F3, 0x020D, 0x0379, 0x065C, 0x0214, 0x03C2, 0x03DB, 0x003F, 0x05DC, 0x0524, 0x065D, 0x063A, 0x02DA, 0x0446, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x01F1, 0x0293, 0x02AC, 0x034D, 0x003F, 0x0337, 0x05EB, 0x03D6, 0x0304, 0x063B, 0x003F, 0x0249, 0x065E, 0x055D, 
+    0x038A, 0x06C4, 0x003F, 0x04ED, 0x003F, 0x0588, 0x01B0, 0x06C5, 0x0128, 0x02B9, 0x003F, 0x05B6, 0x014B, 0x026B, 0x003F, 0x0141, 
+    0x0200, 0x044F, 0x0459, 0x024E, 0x003F, 0x031C, 0x052A, 0x01AC, 0x0417, 0x06C6, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x0375, 0x003F, 0x003F, 0x003F, 0x003F, 0x0130, 0x03B5, 0x03BD, 0x013E, 0x0333, 0x0154, 0x003F, 0x003F, 
+    0x065F, 0x051E, 0x0595, 0x0477, 0x06C7, 0x003F, 0x01BB, 0x0294, 0x0245, 0x054D, 0x06C8, 0x003F, 0x003F, 0x003F, 0x003F, 0x05FF, 
+    0x003F, 0x0685, 0x003F, 0x003F, 0x045D, 0x003F, 0x0686, 0x003F, 0x003F, 0x0167, 0x0596, 0x0267, 0x0237, 0x02A9, 0x003F, 0x0687, 
+    0x061B, 0x04FE, 0x043B, 0x05B7, 0x0424, 0x0415, 0x016A, 0x0288, 0x02DD, 0x003F, 0x01A7, 0x01AF, 0x018B, 0x037C, 0x003F, 0x0478, 
+    0x033A, 0x04E6, 0x04E1, 0x018F, 0x0513, 0x01DC, 0x02F7, 0x040A, 0x05DD, 0x0397, 0x003F, 0x051F, 0x003F, 0x050D, 0x04B8, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x0183, 0x04E2, 0x01F7, 0x003F, 0x02AF, 0x003F, 0x029B, 0x0170, 0x0360, 0x05C7, 0x003F, 0x01EA, 0x003F, 
+    0x03AD, 0x003F, 0x01BE, 0x003F, 0x0688, 0x061C, 0x003F, 0x03D9, 0x03D3, 0x02D3, 0x0239, 0x0233, 0x0481, 0x003F, 0x061D, 0x01B2, 
+    0x05C8, 0x003F, 0x003F, 0x012B, 0x01FF, 0x06C9, 0x01FC, 0x01E0, 0x05DE, 0x0326, 0x003F, 0x02EB, 0x01F9, 0x003F, 0x02D4, 0x003F, 
+    0x06CA, 0x05A3, 0x003F, 0x06CB, 0x056F, 0x003F, 0x0421, 0x003F, 0x003F, 0x0142, 0x02B8, 0x0181, 0x003F, 0x01A8, 0x0345, 0x003F, 
+    0x05EC, 0x05ED, 0x0539, 0x0496, 0x02E9, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0660, 0x003F, 0x003F, 0x003F, 0x003F, 0x05DF, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0274, 0x003F, 0x05EE, 0x030B, 0x003F, 0x003F, 0x003F, 0x0161, 0x03EC, 0x03A6, 0x0311, 
+    0x003F, 0x052B, 0x0447, 0x04DB, 0x0436, 0x040C, 0x025D, 0x0284, 0x04C8, 0x0661, 0x0295, 0x003F, 0x003F, 0x003F, 0x003F, 0x052C, 
+    0x049B, 0x003F, 0x0355, 0x05B8, 0x0662, 0x06CC, 0x003F, 0x003F, 0x0543, 0x003F, 0x003F, 0x003F, 0x003F, 0x0555, 0x0386, 0x0689, 
+    0x03F1, 0x04A5, 0x068A, 0x003F, 0x0597, 0x0567, 0x06CD, 0x003F, 0x003F, 0x03A9, 0x06CE, 0x06CF, 0x003F, 0x068B, 0x003F, 0x003F, 
+    0x0598, 0x003F, 0x003F, 0x003F, 0x0600, 0x03E9, 0x003F, 0x003F, 0x0514, 0x0663, 0x03FE, 0x06D0, 0x0236, 0x03E3, 0x0444, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x0330, 0x0321, 0x04AF, 0x048D, 0x0484, 0x04CF, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x011A, 0x03D4, 0x003F, 0x026D, 0x003F, 0x01A3, 0x003F, 0x032E, 0x0352, 0x04BE, 0x061E, 0x05EF, 0x013B, 0x0515, 0x01FE, 0x024F, 
+    0x043C, 0x0664, 0x0568, 0x003F, 0x0665, 0x06D1, 0x0150, 0x0265, 0x003F, 0x048E, 0x04D0, 0x06D2, 0x003F, 0x0666, 0x0667, 0x04A0, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x011D, 0x01E5, 0x0430, 0x003F, 0x017F, 0x003F, 0x01CC, 0x003F, 0x003F, 0x02B4, 0x03F5, 0x03B4, 
+    0x042B, 0x0151, 0x003F, 0x0163, 0x0556, 0x0427, 0x0408, 0x0488, 0x06D3, 0x040F, 0x0668, 0x06D4, 0x0331, 0x003F, 0x03E4, 0x0569, 
+    0x003F, 0x003F, 0x003F, 0x024C, 0x003F, 0x0305, 0x003F, 0x0601, 0x003F, 0x0144, 0x0187, 0x061F, 0x020E, 0x038F, 0x003F, 0x04BF, 
+    0x003F, 0x0454, 0x033D, 0x0509, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x03AA, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0264, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x068C, 0x0494, 0x003F, 0x003F, 0x063C, 0x003F, 0x003F, 0x003F, 0x003F, 0x0122, 0x02CA, 0x0219, 
+    0x068D, 0x01B4, 0x022D, 0x06D5, 0x03F0, 0x03B8, 0x054E, 0x068E, 0x024B, 0x048F, 0x0589, 0x0602, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x02E0, 0x04FF, 0x058A, 0x04A1, 0x063D, 0x0313, 0x0376, 0x003F, 0x0449, 0x003F, 0x003F, 0x06D6, 0x003F, 0x0570, 0x012C, 
+    0x06D7, 0x01FD, 0x02AA, 0x056A, 0x0335, 0x0123, 0x0428, 0x0279, 0x011F, 0x01DA, 0x0125, 0x0603, 0x0174, 0x02FF, 0x019A, 0x0246, 
+    0x05E0, 0x04DC, 0x019C, 0x0220, 0x0516, 0x003F, 0x0471, 0x058B, 0x003F, 0x0599, 0x0620, 0x0361, 0x042C, 0x003F, 0x068F, 0x0669, 
+    0x003F, 0x063E, 0x003F, 0x003F, 0x06D8, 0x003F, 0x02D7, 0x03E0, 0x05E1, 0x05C9, 0x003F, 0x003F, 0x04EE, 0x0455, 0x0517, 0x0381, 
+    0x066A, 0x003F, 0x003F, 0x04C9, 0x0690, 0x05CA, 0x0437, 0x05CB, 0x003F, 0x003F, 0x003F, 0x0691, 0x063F, 0x003F, 0x003F, 0x06D9, 
+    0x05F0, 0x003F, 0x0692, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x05A4, 0x054F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0221, 0x041A, 0x03D1, 0x02D6, 0x003F, 0x003F, 0x02C4, 0x04D7, 0x0525, 0x003F, 0x003F, 
+    0x003F, 0x02D8, 0x03CF, 0x0301, 0x0604, 0x003F, 0x0531, 0x050A, 0x003F, 0x010D, 0x01E2, 0x0140, 0x0404, 0x0148, 0x0153, 0x003F, 
+    0x06DA, 0x0640, 0x02C0, 0x0362, 0x0377, 0x0189, 0x0349, 0x003F, 0x02A8, 0x02C5, 0x0412, 0x03FB, 0x0544, 0x0580, 0x003F, 0x06DB, 
+    0x0621, 0x0693, 0x0120, 0x01E8, 0x0485, 0x04E7, 0x0532, 0x05F1, 0x0605, 0x003F, 0x0257, 0x058C, 0x0571, 0x022A, 0x003F, 0x003F, 
+    0x003F, 0x0105, 0x02A3, 0x0196, 0x04CA, 0x0287, 0x01F8, 0x04DD, 0x003F, 0x02B2, 0x025F, 0x013C, 0x028C, 0x0143, 0x03E7, 0x0694, 
+    0x053A, 0x052D, 0x0109, 0x0572, 0x025A, 0x0266, 0x0606, 0x003F, 0x05F2, 0x05CC, 0x0133, 0x0188, 0x04F9, 0x01DB, 0x0205, 0x003F, 
+    0x003F, 0x028D, 0x04B0, 0x056B, 0x0545, 0x0201, 0x0186, 0x05B9, 0x03BE, 0x003F, 0x017B, 0x0581, 0x003F, 0x003F, 0x003F, 0x0348, 
+    0x003F, 0x0137, 0x0272, 0x021A, 0x023E, 0x003F, 0x0438, 0x003F, 0x03EA, 0x05CD, 0x03C8, 0x025C, 0x0518, 0x003F, 0x0160, 0x003F, 
+    0x0278, 0x0622, 0x003F, 0x06DC, 0x003F, 0x0207, 0x02E5, 0x01E1, 0x003F, 0x059A, 0x003F, 0x003F, 0x003F, 0x02A4, 0x003F, 0x0416, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x010C, 0x036F, 0x06DD, 0x003F, 0x003F, 0x003F, 0x003F, 0x0168, 0x0136, 0x041E, 0x0179, 
+    0x01D2, 0x003F, 0x003F, 0x01C8, 0x04B3, 0x02F5, 0x02AD, 0x019D, 0x06DE, 0x0166, 0x02A0, 0x0695, 0x003F, 0x02F4, 0x003F, 0x03D2, 
+    0x05CE, 0x059B, 0x05A5, 0x003F, 0x05A6, 0x003F, 0x015E, 0x06DF, 0x0216, 0x03C3, 0x003F, 0x003F, 0x05BA, 0x0497, 0x016D, 0x0384, 
+    0x052E, 0x0440, 0x003F, 0x003F, 0x0696, 0x0546, 0x003F, 0x0129, 0x042E, 0x010F, 0x0106, 0x066B, 0x0155, 0x05A7, 0x0607, 0x0261, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x010B, 0x06E0, 0x003F, 0x003F, 0x003F, 0x0100, 0x033B, 0x0132, 0x013D, 0x03AB, 
+    0x003F, 0x02A1, 0x01F4, 0x015B, 0x04B4, 0x0112, 0x0472, 0x030E, 0x052F, 0x011C, 0x0194, 0x0300, 0x023C, 0x003F, 0x01DD, 0x003F, 
+    0x0208, 0x0255, 0x05CF, 0x0623, 0x014A, 0x0641, 0x019F, 0x04A8, 0x003F, 0x003F, 0x0697, 0x0698, 0x0573, 0x003F, 0x029D, 0x0642, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0624, 0x003F, 0x003F, 0x0165, 0x014C, 0x0131, 0x0209, 0x0370, 0x020C, 0x0276, 
+    0x0470, 0x0134, 0x04CB, 0x012F, 0x0526, 0x02C9, 0x04B5, 0x003F, 0x06E1, 0x0547, 0x06E2, 0x01B7, 0x0699, 0x003F, 0x003F, 0x003F, 
+    0x021F, 0x003F, 0x003F, 0x017A, 0x01BD, 0x0254, 0x0401, 0x003F, 0x01F0, 0x04D8, 0x003F, 0x01DF, 0x003F, 0x05A8, 0x017D, 0x03CD, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0298, 0x003F, 0x003F, 0x06E3, 0x003F, 0x06E4, 0x003F, 0x01A2, 
+    0x003F, 0x003F, 0x003F, 0x012A, 0x0162, 0x0247, 0x01A6, 0x003F, 0x003F, 0x04CC, 0x03A3, 0x06E5, 0x0171, 0x01E6, 0x02F8, 0x003F, 
+    0x0343, 0x003F, 0x05BB, 0x003F, 0x003F, 0x06E6, 0x003F, 0x06E7, 0x003F, 0x003F, 0x003F, 0x0322, 0x036D, 0x0625, 0x0363, 0x040D, 
+    0x05BC, 0x003F, 0x025E, 0x0102, 0x0192, 0x016C, 0x003F, 0x01A1, 0x05A9, 0x031D, 0x01BA, 0x026E, 0x030C, 0x030F, 0x04DE, 0x05E2, 
+    0x02CF, 0x0341, 0x0626, 0x0643, 0x066C, 0x0406, 0x003F, 0x066D, 0x003F, 0x069A, 0x0550, 0x02D9, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x0608, 0x003F, 0x035E, 0x003F, 0x003F, 0x003F, 0x003F, 0x02BE, 0x042D, 0x0520, 0x0431, 0x003F, 0x003F, 0x003F, 0x003F, 0x0533, 
+    0x06E8, 0x003F, 0x06E9, 0x06EA, 0x04D3, 0x01E9, 0x003F, 0x069B, 0x003F, 0x003F, 0x003F, 0x003F, 0x0387, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x05D0, 0x06EB, 0x003F, 0x003F, 0x003F, 0x003F, 0x0627, 0x050E, 0x003F, 0x053B, 0x003F, 0x053C, 0x003F, 
+    0x04E8, 0x003F, 0x003F, 0x003F, 0x003F, 0x05BD, 0x03C4, 0x058D, 0x003F, 0x03A5, 0x02C3, 0x0644, 0x0482, 0x0582, 0x003F, 0x04FA, 
+    0x0413, 0x066E, 0x01D7, 0x02C1, 0x034A, 0x02AB, 0x02CB, 0x02A2, 0x0609, 0x066F, 0x056C, 0x0286, 0x018E, 0x02C8, 0x0281, 0x05AA, 
+    0x060A, 0x003F, 0x05AB, 0x06EC, 0x04A2, 0x0425, 0x06ED, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0199, 0x038B, 0x028A, 0x031B, 
+    0x0479, 0x0371, 0x038E, 0x003F, 0x024D, 0x018C, 0x003F, 0x05D1, 0x0551, 0x003F, 0x003F, 0x04D9, 0x003F, 0x026F, 0x003F, 0x02DB, 
+    0x003F, 0x003F, 0x003F, 0x0248, 0x038D, 0x03F8, 0x003F, 0x060B, 0x003F, 0x055E, 0x03BF, 0x003F, 0x003F, 0x003F, 0x003F, 0x0224, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0628, 0x003F, 0x01ED, 0x02EE, 0x04CD, 0x0260, 0x03C9, 0x044C, 0x003F, 0x0241, 
+    0x0394, 0x04C0, 0x0519, 0x003F, 0x0307, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x06EE, 0x003F, 0x003F, 0x003F, 0x003F, 
+    0x03C7, 0x039E, 0x003F, 0x003F, 0x069C, 0x003F, 0x003F, 0x031F, 0x0157, 0x0411, 0x01F2, 0x003F, 0x0303, 0x003F, 0x023A, 0x0429, 
+    0x04EF, 0x042A, 0x021D, 0x06EF, 0x027D, 0x02B6, 0x069D, 0x003F, 0x060C, 0x06F0, 0x030D, 0x0645, 0x05F3, 0x05F4, 0x0500, 0x0548, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x02D0, 0x0670, 0x0501, 0x003F, 0x046C, 0x053D, 0x069E, 0x041C, 0x0549, 0x05F5, 
+    0x043D, 0x003F, 0x043E, 0x03CE, 0x003F, 0x003F, 0x056D, 0x003F, 0x028B, 0x06F1, 0x060D, 0x003F, 0x069F, 0x003F, 0x0395, 0x003F, 
+    0x003F, 0x0227, 0x003F, 0x0414, 0x04C2, 0x0489, 0x055F, 0x0530, 0x05D2, 0x0574, 0x003F, 0x003F, 0x0646, 0x003F, 0x0583, 0x03CB, 
+    0x003F, 0x003F, 0x003F, 0x06F2, 0x03FD, 0x003F, 0x003F, 0x04F0, 0x06A0, 0x003F, 0x003F, 0x0584, 0x058E, 0x0671, 0x06A1, 0x003F, 
+    0x04B9, 0x003F, 0x040E, 0x04A9, 0x03EE, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0521, 0x003F, 0x05F6, 0x003F, 0x01E3, 0x003F, 
+    0x0228, 0x0317, 0x028E, 0x053E, 0x0306, 0x0230, 0x0460, 0x01C2, 0x0372, 0x05BE, 0x03B0, 0x06A2, 0x0575, 0x01D4, 0x034F, 0x0353, 
+    0x02BC, 0x0629, 0x02DC, 0x0277, 0x0402, 0x059C, 0x047B, 0x0250, 0x0235, 0x0672, 0x05F7, 0x060E, 0x0560, 0x06F3, 0x06F4, 0x04DA, 
+    0x003F, 0x003F, 0x0178, 0x0448, 0x041B, 0x038C, 0x003F, 0x0445, 0x06F5, 0x003F, 0x003F, 0x04D4, 0x01C5, 0x046D, 0x0324, 0x0557, 
+    0x02BA, 0x060F, 0x003F, 0x003F, 0x0552, 0x003F, 0x05AC, 0x003F, 0x003F, 0x021C, 0x05E3, 0x050B, 0x04E3, 0x04AA, 0x03C5, 0x003F, 
+    0x01D1, 0x003F, 0x003F, 0x003F, 0x003F, 0x0334, 0x003F, 0x003F, 0x003F, 0x003F, 0x01CD, 0x0610, 0x062A, 0x0498, 0x048A, 0x06F6, 
+    0x003F, 0x045E, 0x003F, 0x003F, 0x0673, 0x0486, 0x003F, 0x06A3, 0x003F, 0x003F, 0x06F7, 0x05BF, 0x0466, 0x003F, 0x003F, 0x003F, 
+    0x003F, 0x0185, 0x024A, 0x039D, 0x003F, 0x02FB, 0x003F, 0x044A, 0x06A4, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0240, 
+    0x04B6, 0x02F2, 0x03DE, 0x04DF, 0x05AD, 0x003F, 0x042F, 0x01B5, 0x05D3, 0x06A5, 0x0238, 0x02C7, 0x003F, 0x003F, 0x048B, 0x0674, 
+    0x0576, 0x03B6, 0x06F8, 0x0202, 0x045A, 0x059D, 0x06F9, 0x003F, 0x003F, 0x06FA, 0x003F, 0x0534, 0x003F, 0x003F, 0x02E6, 0x06FB, 
+    0x05E4, 0x05C0, 0x0647, 0x003F, 0x003F, 0x05F8, 0x05F9, 0x02EA, 0x06FC, 0x0325, 0x0314, 0x003F, 0x003F, 0x05D4, 0x0648, 0x0407, 
+    0x026C, 0x0495, 0x0675, 0x003F, 0x0676, 0x027F, 0x037B, 0x003F, 0x003F, 0x003F, 0x0212, 0x02E1, 0x04B7, 0x051A, 0x0577, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x003F, 0x0244, 0x003F, 0x003F, 0x003F, 0x003F, 0x0367, 0x0502, 0x0503, 0x003F, 0x02B1, 
+    0x06FD, 0x029C, 0x05D5, 0x0535, 0x0373, 0x003F, 0x003F, 0x06A6, 0x003F, 0x003F, 0x003F, 0x003F, 0x0561, 0x003F, 0x003F, 0x0677, 
+    0x003F, 0x003F, 0x01D3, 0x03F2, 0x029A, 0x0457, 0x062B, 0x003F, 0x0197, 0x0504, 0x03C1, 0x019E, 0x0649, 0x053F, 0x03CC, 0x04AB, 
+    0x0108, 0x023D, 0x0114, 0x013A, 0x058F, 0x01B6, 0x0158, 0x06A7, 0x01BF, 0x0111, 0x0451, 0x0611, 0x06FE, 0x06A8, 0x003F, 0x04B1, 
+    0x0146, 0x01CE, 0x003F, 0x0268, 0x028F, 0x0612, 0x0439, 0x04E4, 0x003F, 0x01C1, 0x003F, 0x03FF, 0x0678, 0x0338, 0x04E0, 0x064A, 
+    0x034B, 0x054A, 0x003F, 0x0505, 0x06FF, 0x0258, 0x05C1, 0x0256, 0x0351, 0x0467, 0x02C2, 0x0679, 0x03A0, 0x01D8, 0x0364, 0x003F, 
+    0x003F, 0x003F, 0x01C6, 0x02DF, 0x0210, 0x03CA, 0x003F, 0x04D1, 0x0442, 0x003F, 0x04AC, 0x003F, 0x0172, 0x021E, 0x01FA, 0x0296, 
+    0x003F, 0x02B0, 0x003F, 0x003F, 0x003F, 0x04C3, 0x003F, 0x021B, 0x034C, 0x003F, 0x003F, 0x003F, 0x0562, 0x0578, 0x027C, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x023F, 0x064B, 0x02E3, 0x033C, 0x04CE, 0x036A, 0x05E5, 0x003F, 0x003F, 0x06A9, 0x0315, 0x003F, 0x003F, 
+    0x05FA, 0x003F, 0x003F, 0x003F, 0x003F, 0x032D, 0x067A, 0x06AA, 0x064C, 0x003F, 0x04A6, 0x003F, 0x003F, 0x03A4, 0x003F, 0x003F, 
+    0x003F, 0x003F, 0x003F, 0x0392, 0x037F, 0x0378, 0x0356, 0x003F, 0x003F, 0x03D0, 0x0468, 0x032A, 0x03B9, 0x0700, 0x02D5, 0x03EF, 
+    0x0270, 0x04F1, 0x003F, 0x003F, 0x003F, 0x003F, 0x016F, 0x003F, 0x035F, 0x0365, 0x0213, 0x045F, 0x003F, 0x0701, 
 };
 
 /**
@@ -178,26 +339,9 @@ static const uint32_t korean_unicodes[KOREAN_CHAR_COUNT] = {
  * @return 글리프 인덱스 (256+), 미지원 문자는 '?' 반환
  */
 static inline uint16_t cp949_to_glyph_index(uint8_t lead, uint8_t trail) {
-    // CP949 → 유니코드 변환 (cp949_table_hangul.h 사용)
-    uint16_t unicode = cp949_hangul_to_ucs2(lead, trail);
-    
-    if (unicode == 0xFFFD || unicode < 0xAC00 || unicode > 0xD7A3) {
-        return '?';
-    }
-    
-    // 유니코드 → 글리프 인덱스 (이진 탐색)
-    int left = 0, right = KOREAN_CHAR_COUNT - 1;
-    while (left <= right) {
-        int mid = (left + right) / 2;
-        if (korean_unicodes[mid] == unicode) {
-            return 256 + mid;
-        } else if (korean_unicodes[mid] < unicode) {
-            left = mid + 1;
-        } else {
-            right = mid - 1;
-        }
+    if (lead >= 0xB0 && lead <= 0xC8 && trail >= 0xA1 && trail <= 0xFE) {
+        return ksx1001_glyph_remap[(lead - 0xB0) * 94 + (trail - 0xA1)];
     }
-    
     return '?';  // 미지원 문자
 }
 
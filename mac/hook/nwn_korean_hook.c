@@ -38,6 +38,10 @@
 #include "cp949_table_hangul.h"
 // KS X 1001 한글 유니코드 테이블 (실제 완성형 2350자)
 #include "ksx1001_hangul.h"
+#ifdef KOREAN_GLYPH_SUBSET
+// 코퍼스에서 쓰이는 한글만 베이크 (translate/tools/gen_glyph_table.py로 생성)
+#include "korean_glyph_table.h"
+#endif
 
 // ============================================================================
 // 상수 정의
@@ -64,8 +68,19 @@
 #define GLYPH_BASE_INDEX  256
 // KS X 1001 완성형 한글: 2350자 (lead 0xB0~0xC8, trail 0xA1~0xFE)
 // 총 글리프: 256(기본) + 25*94 = 2606
+#ifdef KOREAN_GLYPH_SUBSET
+// 서브셋: 256(기본) + 사용 한글, CP949 → 글리프 인덱스는 ksx1001_glyph_remap으로 조회
+#define HANGUL_GLYPH_COUNT  KOREAN_CHAR_COUNT
+#define TOTAL_GLYPH_COUNT  KOREAN_GLYPH_TOTAL
+#else
 #define HANGUL_GLYPH_COUNT  KSX1001_HANGUL_COUNT  // 2350
 #define TOTAL_GLYPH_COUNT  (256 + 25 * 94)  // 2606
+#endif
+
+#ifdef KOREAN_GLYPH_SUBSET
+// install.py가 dylib에서 이 문자열로 서브셋 빌드를 식별 (재배치 테이블 트램폴린 필요)
+__attribute__((used)) static const char glyph_subset_marker[] = "NWN_KOREAN_GLYPH_SUBSET";
+#endif
 
 // ============================================================================
 // 타입 정의
@@ -246,6 +261,11 @@ static void init_korean_chars(uint32_t* original_chars) {
     // 원본 256자 복사
     memcpy(korean_chars, original_chars, 256 * sizeof(uint32_t));
 
+#ifdef KOREAN_GLYPH_SUBSET
+    // 생성된 베이크 목록을 그대로 배치 (글리프 인덱스 = 256 + 목록 위치)
+    memcpy(korean_chars + 256, korean_unicodes, KOREAN_CHAR_COUNT * sizeof(uint32_t));
+    int glyph_idx = 256 + KOREAN_CHAR_COUNT;
+#else
     // KS X 1001 완성형 한글 2350자를 CP949 lead/trail 순서대로 배치
     // 글리프 인덱스 = 256 + (lead - 0xB0) * 94 + (trail - 0xA1)
     // 이렇게 해야 TextOut에서 CP949 코드로 직접 글리프 인덱스 계산 가능
@@ -263,14 +283,20 @@ static void init_korean_chars(uint32_t* original_chars) {
             glyph_idx++;
         }
     }
+#endif
 
     FILE* log = fopen("/tmp/nwn_korean.log", "a");
     if (log) {
         fprintf(log, "[Bake] Initialized %d characters (256 base + %d Korean slots)\n",
                 TOTAL_GLYPH_COUNT, glyph_idx - 256);
         // 샘플 출력
+#ifdef KOREAN_GLYPH_SUBSET
+        fprintf(log, "[Bake] Sample: glyph[256]=U+%04X, glyph[%d]=U+%04X (last)\n",
+                korean_chars[256], TOTAL_GLYPH_COUNT - 1, korean_chars[TOTAL_GLYPH_COUNT - 1]);
+#else
         fprintf(log, "[Bake] Sample: glyph[256]=U+%04X (가), glyph[1512]=U+%04X (시)\n",
                 korean_chars[256], korean_chars[256 + (0xBD - 0xB0) * 94 + (0xC3 - 0xA1)]);
+#endif
         fclose(log);
     }
 }
@@ -374,6 +400,7 @@ void* my_AurGetTTFTexture(void* ttf_obj, uint32_t* chars, int count, void* out,
  *
  * 글리프 인덱스 = 256 + (lead - 0xB0) * 94 + (trail - 0xA1)
  */
+#ifndef KOREAN_GLYPH_SUBSET
 static inline uint16_t cp949_to_glyph_index(uint8_t lead, uint8_t trail) {
     // 완성형 범위 체크
     if (lead >= 0xB0 && lead <= 0xC8 && trail >= 0xA1 && trail <= 0xFE) {
@@ -381,6 +408,7 @@ static inline uint16_t cp949_to_glyph_index(uint8_t lead, uint8_t trail) {
     }
     return '?';  // 미지원
 }
+#endif
 
 // ============================================================================
 // Phase 3.5: Decode 함수 (어셈블리에서 호출)
@@ -420,7 +448,7 @@ uint64_t decode_cp949_impl(uint8_t* str_ptr, uint8_t current_byte, int* out_incr
         // trail byte 체크 (0xA1~0xFE)
         if (trail >= 0xA1 && trail <= 0xFE) {
             // 글리프 인덱스 계산: 256 + (lead - 0xB0) * 94 + (trail - 0xA1)
-            uint16_t glyph_idx = GLYPH_BASE_INDEX + (current_byte - 0xB0) * 94 + (trail - 0xA1);
+            uint16_t glyph_idx = cp949_to_glyph_index(current_byte, trail);
             *out_increment = 1;  // 2바이트 처리했으므로 w28 += 1
             return glyph_idx;
         }
@@ -488,8 +516,15 @@ void decode_glyph_asm(void) {
         // w10 = w10 + w9
         "add w10, w10, w9\n"
 
+#ifdef KOREAN_GLYPH_SUBSET
+        // x1 = ksx1001_glyph_remap[w10]
+        "adrp x9, _ksx1001_glyph_remap@PAGE\n"
+        "add x9, x9, _ksx1001_glyph_remap@PAGEOFF\n"
+        "ldrh w1, [x9, w10, uxtw #1]\n"
+#else
         // x1 = 256 + w10
         "add x1, x10, #256\n"
+#endif
 
         // w28 += 1 (2바이트 처리)
         "add w28, w28, #1\n"
@@ -1128,6 +1163,19 @@ static void init_korean_hook(void) {
         }
     }
 
+#ifdef KOREAN_GLYPH_SUBSET
+    // 4.3: 바이너리 트램폴린용 글리프 재배치 테이블 공개
+    // install.py의 트램폴린은 이 포인터가 NULL이 아니면 ksx1001_glyph_remap으로 글리프 인덱스를 조회
+    #define ARM64_GLYPH_REMAP_PTR_OFFSET  0x115b220  // nk_hook_ptr 다음 8바이트 (__DATA 패딩)
+
+    const uint16_t** remap_ptr = (const uint16_t**)((uintptr_t)nwmain_base + ARM64_GLYPH_REMAP_PTR_OFFSET);
+    *remap_ptr = ksx1001_glyph_remap;
+    if (log) {
+        fprintf(log, "Phase 4.3: glyph remap %p published at %p (%d Korean glyphs)\n",
+                (const void*)ksx1001_glyph_remap, (void*)remap_ptr, KOREAN_CHAR_COUNT);
+    }
+#endif
+
     // 완료
     if (log) {
         fprintf(log, "\n=== Korean Hook Ready ===\n");
@@ -198,6 +198,14 @@ ARM64_CALCWIDTH_LDRB_OFFSET = 0xa2cc0   # ldrb w24, [x1] 위치
 ARM64_CALCWIDTH_RETURN_OFFSET = 0xa2cc4  # ldrb 다음 명령어
 ARM64_CALCWIDTH_TRAMPOLINE_OFFSET = 0x10B7E00  # NK 트램폴린 뒤
 
+# 글리프 재배치 테이블 포인터 (NK 함수 포인터 다음 8바이트, __DATA 패딩)
+# 서브셋 훅(KOREAN_GLYPH_SUBSET)이 ksx1001_glyph_remap 주소를 기록하면
+# 트램폴린이 KS X 1001 순번 → 글리프 인덱스를 테이블에서 조회하고,
+# NULL이면 기존처럼 256 + 순번으로 계산합니다.
+ARM64_GLYPH_REMAP_PTR_OFFSET = 0x115b220
+# 서브셋 dylib 식별 문자열 (nwn_korean_hook.c의 glyph_subset_marker)
+GLYPH_SUBSET_MARKER = b"NWN_KOREAN_GLYPH_SUBSET"
+
 # ============================================================================
 # 유틸리티 함수
 # ============================================================================
@@ -256,10 +264,30 @@ def encode_bcond(cond: int, offset: int) -> int:
     return (0b01010100 << 24) | (imm19 << 5) | cond
 
 
-def generate_trampoline() -> bytes:
+def glyph_lookup_code(pc: int, rank_reg: int, dest_reg: int, tmp_reg: int,
+                      fallback_add: int) -> list[int]:
+    """KS X 1001 순번 → 글리프 인덱스 명령어열 (6개)
+
+    adrp/ldr로 재배치 테이블 포인터를 읽어 NULL이 아니면 ldrh로 조회하고,
+    NULL이면 fallback_add(기존 add #256)를 실행합니다.
+    pc: 첫 명령어(adrp)의 위치
+    """
+    ptr_page = ARM64_GLYPH_REMAP_PTR_OFFSET & ~0xFFF
+    ptr_offset = ARM64_GLYPH_REMAP_PTR_OFFSET & 0xFFF
+    return [
+        encode_adrp(tmp_reg, pc, ptr_page),                                   # adrp xT, ptr_page
+        0xF9400000 | ((ptr_offset // 8) << 10) | (tmp_reg << 5) | tmp_reg,    # ldr xT, [xT, #off]
+        0xB4000000 | ((12 // 4) << 5) | tmp_reg,                              # cbz xT, fallback
+        0x78605800 | (rank_reg << 16) | (tmp_reg << 5) | dest_reg,            # ldrh wD, [xT, wR, uxtw #1]
+        int.from_bytes(encode_b(0, 8), 'little'),                             # b done
+        fallback_add,                                                         # fallback: add D, R, #256
+    ]
+
+
+def generate_trampoline(glyph_remap: bool = True) -> bytes:
     """CP949 디코딩 트램폴린 생성 (레거시 UI용)"""
     code = []
-    exit_idx = 18
+    exit_idx = 23 if glyph_remap else 18
 
     code.append(0xD53B420C)  # mrs x12, nzcv
     code.append(0xAA1903E1)  # mov x1, x25
@@ -277,7 +305,13 @@ def generate_trampoline() -> bytes:
     code.append(0x1B0F7DCE)  # mul w14, w14, w15
     code.append(0x510285AD)  # sub w13, w13, #0xA1
     code.append(0x0B0D01CE)  # add w14, w14, w13
-    code.append(0x910401C1)  # add x1, x14, #256
+    if glyph_remap:
+        # x1 = remap ? remap[w14] : 256 + w14
+        code.extend(glyph_lookup_code(ARM64_TRAMPOLINE_OFFSET + len(code) * 4,
+                                      rank_reg=14, dest_reg=1, tmp_reg=15,
+                                      fallback_add=0x910401C1))
+    else:
+        code.append(0x910401C1)  # add x1, x14, #256
     code.append(0x1100079C)  # add w28, w28, #1
     code.append(0xD51B420C)  # msr nzcv, x12
 
@@ -368,7 +402,7 @@ def generate_nk_trampoline() -> bytes:
     return b''.join(instr.to_bytes(4, 'little') for instr in code)
 
 
-def generate_calcwidth_trampoline() -> bytes:
+def generate_calcwidth_trampoline(glyph_remap: bool = True) -> bytes:
     """CalculateVisibleStringLengthAndWidth용 CP949 디코딩 트램폴린
 
     원본 코드 (0xa2cbc~0xa2cc4):
@@ -392,7 +426,7 @@ def generate_calcwidth_trampoline() -> bytes:
         4. 원래 코드로 복귀
     """
     code = []
-    exit_idx = 17  # 종료 위치 인덱스
+    exit_idx = 22 if glyph_remap else 17  # 종료 위치 인덱스
 
     # 0: ldrb w24, [x1] - 원본 명령어
     code.append(0x39400038)
@@ -443,7 +477,13 @@ def generate_calcwidth_trampoline() -> bytes:
     code.append(0x0B09014A)
 
     # 15: add w24, w10, #256 - 결과를 w24에 저장 (글리프 인덱스)
-    code.append(0x11040158)
+    #     재배치 테이블이 있으면 w24 = remap[w10] (15~20)
+    if glyph_remap:
+        code.extend(glyph_lookup_code(ARM64_CALCWIDTH_TRAMPOLINE_OFFSET + len(code) * 4,
+                                      rank_reg=10, dest_reg=24, tmp_reg=11,
+                                      fallback_add=0x11040158))
+    else:
+        code.append(0x11040158)
 
     # 16: add w27, w27, #1 - 2바이트 처리했으므로 인덱스 +1
     code.append(0x1100077B)
@@ -526,6 +566,15 @@ def install():
         print(f"오류: {e}")
         return False
 
+    # 재배치 테이블 포인터 자리가 비어 있을 때만 테이블 조회 트램폴린 사용.
+    # 서브셋 dylib는 256 + 순번 트램폴린으로는 엉뚱한 글리프를 그리므로 설치하지 않음
+    remap_ptr_offset = arm64_offset + ARM64_GLYPH_REMAP_PTR_OFFSET
+    glyph_remap = bytes(data[remap_ptr_offset:remap_ptr_offset+8]) == bytes(8)
+    if not glyph_remap and GLYPH_SUBSET_MARKER in DYLIB_SRC.read_bytes():
+        print("오류: 글리프 재배치 포인터 자리가 비어 있지 않아 서브셋 dylib를 쓸 수 없습니다")
+        print("      서브셋 없이 다시 빌드하세요 (make, 또는 build_release.py에서 --glyph-subset 제외)")
+        return False
+
     for patch in PATCHES:
         file_offset = arm64_offset + patch['offset']
         current = bytes(data[file_offset:file_offset+4])
@@ -547,7 +596,10 @@ def install():
     expected_mov = bytes.fromhex('e10319aa')
     expected_b = encode_b(ARM64_TEXTOUT_MOV_OFFSET, ARM64_TRAMPOLINE_OFFSET)
 
-    trampoline = generate_trampoline()
+    if not glyph_remap:
+        print("  [!] 글리프 재배치 포인터 자리가 비어 있지 않음 - 코드 순서 글리프만 지원")
+
+    trampoline = generate_trampoline(glyph_remap)
     trampoline_offset = arm64_offset + ARM64_TRAMPOLINE_OFFSET
 
     if bytes(data[mov_offset:mov_offset+4]) == expected_mov:
@@ -598,7 +650,7 @@ def install():
     expected_calcwidth_ldrb = bytes.fromhex('38004039')  # little-endian
     expected_calcwidth_b = encode_b(ARM64_CALCWIDTH_LDRB_OFFSET, ARM64_CALCWIDTH_TRAMPOLINE_OFFSET)
 
-    calcwidth_trampoline = generate_calcwidth_trampoline()
+    calcwidth_trampoline = generate_calcwidth_trampoline(glyph_remap)
 
     current_calcwidth = bytes(data[calcwidth_ldrb_offset:calcwidth_ldrb_offset+4])
     if current_calcwidth == expected_calcwidth_ldrb:
@@ -0,0 +1,213 @@
+"""
+번역문(Text) 문자 빈도/커버리지 통계
+
+파일마다 Text 컬럼을 한 번 읽어 코드 포인트와 줄 길이 히스토그램을 Counter로 만들고,
+.cache/에 파일별 결과와 합계를 함께 저장합니다. 다음 실행에서는 바뀐 파일만 다시 읽어
+합계에서 이전 값을 빼고 새 값을 더하므로, 코퍼스 크기와 무관하게 빠르게 갱신됩니다.
+아직 CSV에 반영되지 않은 저널 편집은 캐시에 넣지 않고 합계에 덮어 계산합니다.
+글리프 배치(tools/gen_glyph_table.py)와 폰트 서브셋의 입력으로 사용합니다.
+"""
+
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+from corpus import corpus_signature, read_cache, write_cache
+from csv_rows import open_rows
+from edit_journal import pending_edits
+from ksx1001 import KSX1001_SET, is_hangul_syllable
+
+CACHE_NAME = 'char_stats.json'
+# 파일별 통계 (바뀐 파일이 있을 때만 읽음)
+FILES_CACHE_NAME = 'char_stats_files.json'
+CACHE_VERSION = 1
+
+
+def char_category(char: str) -> str:
+    """통계용 문자 분류"""
+    if is_hangul_syllable(char):
+        return 'hangul'
+    if char.isascii():
+        return 'ascii'
+    category = unicodedata.category(char)
+    if category[0] in 'PS':
+        return 'symbol'
+    if category[0] == 'Z' or category[0] == 'C':
+        return 'space_control'
+    return 'other'
+
+
+class CharStats:
+    """코드 포인트/줄 길이 히스토그램"""
+
+    def __init__(self, chars: Counter | None = None, line_lengths: Counter | None = None,
+                 rows: int = 0):
+        self.chars = chars if chars is not None else Counter()
+        self.line_lengths = line_lengths if line_lengths is not None else Counter()
+        self.rows = rows
+
+    @classmethod
+    def from_texts(cls, texts: list[str]) -> 'CharStats':
+        """Counter의 C 구현으로 문자와 줄 길이를 셈 (리터럴 '\\n'은 줄바꿈으로 처리)"""
+        joined = '\n'.join(texts).replace('\\n', '\n')
+        chars = Counter(joined)
+        # 구분자로 넣은 줄바꿈은 빼고, 실제 줄바꿈만 남김
+        if texts:
+            chars['\n'] -= len(texts) - 1
+            if chars['\n'] <= 0:
+                del chars['\n']
+        line_lengths = Counter(map(len, joined.split('\n'))) if texts else Counter()
+        return cls(chars, line_lengths, len(texts))
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'CharStats':
+        with open_rows(path, ('Text',)) as reader:
+            texts = [text for text, in reader]
+        return cls.from_texts(texts)
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'CharStats':
+        return cls(Counter(data['chars']),
+                   Counter({int(length): count for length, count in data['line_lengths'].items()}),
+                   data['rows'])
+
+    def to_json(self) -> dict:
+        return {
+            'chars': dict(self.chars),
+            'line_lengths': {str(length): count for length, count in self.line_lengths.items()},
+            'rows': self.rows,
+        }
+
+    def add(self, other: 'CharStats') -> None:
+        self.chars.update(other.chars)
+        self.line_lengths.update(other.line_lengths)
+        self.rows += other.rows
+
+    def remove(self, other: 'CharStats') -> None:
+        self.chars.subtract(other.chars)
+        self.line_lengths.subtract(other.line_lengths)
+        self.rows -= other.rows
+        # 0 이하가 된 항목 제거
+        self.chars = +self.chars
+        self.line_lengths = +self.line_lengths
+
+    def hangul(self) -> Counter:
+        """한글 음절 빈도"""
+        return Counter({char: count for char, count in self.chars.items()
+                        if is_hangul_syllable(char)})
+
+    def symbols(self) -> Counter:
+        """문장 부호/기호 빈도 (ASCII 포함)"""
+        return Counter({char: count for char, count in self.chars.items()
+                        if unicodedata.category(char)[0] in 'PS'})
+
+    def summary(self) -> dict:
+        """요약: 분류별 합계, 완성형 커버리지, 상위 N자 누적 비율"""
+        totals: Counter = Counter()
+        kinds: Counter = Counter()
+        for char, count in self.chars.items():
+            category = char_category(char)
+            totals[category] += count
+            kinds[category] += 1
+
+        hangul = self.hangul()
+        hangul_total = sum(hangul.values())
+        ranked = [count for _, count in hangul.most_common()]
+        coverage = {}
+        for top in (100, 500, 1000, 1500, 2000):
+            covered = sum(ranked[:top])
+            coverage[str(top)] = round(covered / hangul_total, 6) if hangul_total else 0.0
+
+        lines = sum(self.line_lengths.values())
+        return {
+            'rows': self.rows,
+            'chars': sum(self.chars.values()),
+            'distinct_chars': len(self.chars),
+            'category_totals': dict(totals),
+            'category_distinct': dict(kinds),
+            'hangul_distinct': len(hangul),
+            'ksx1001_used': sum(1 for char in hangul if char in KSX1001_SET),
+            'non_ksx1001_hangul': sorted(char for char in hangul if char not in KSX1001_SET),
+            'hangul_top_coverage': coverage,
+            'lines': lines,
+            'max_line_length': max(self.line_lengths, default=0),
+            'mean_line_length': (round(sum(length * count for length, count in self.line_lengths.items())
+                                       / lines, 2) if lines else 0.0),
+        }
+
+
+def corpus_stats(files: list[Path]) -> tuple[CharStats, int]:
+    """코퍼스 전체 통계 (저널 편집 포함)
+
+    Returns:
+        (합계 통계, 다시 읽은 파일 수)
+    """
+    edits = pending_edits()  # CSV보다 먼저 읽음
+    total, changed = _csv_stats(files)
+    for path in files:
+        if path.name in edits:
+            _apply_edits(total, path, edits[path.name])
+    return total, changed
+
+
+def _apply_edits(total: CharStats, path: Path, edits: dict[str, dict[str, str]]) -> None:
+    """편집된 행의 CSV 번역문 통계를 빼고 편집 후 번역문 통계를 더함"""
+    old, new = [], []
+    with open_rows(path, ('StrRef', 'Text')) as reader:
+        for strref, text in reader:
+            changes = edits.get(strref)
+            if changes and 'Text' in changes:
+                old.append(text)
+                new.append(changes['Text'].replace('\r\n', '\n'))
+    total.remove(CharStats.from_texts(old))
+    total.add(CharStats.from_texts(new))
+
+
+def _csv_stats(files: list[Path]) -> tuple[CharStats, int]:
+    """CSV 기준 코퍼스 전체 통계 (파일별 캐시로 증분 갱신)
+
+    합계와 파일 시그니처만 담은 캐시를 먼저 읽고, 바뀐 파일이 있을 때만
+    파일별 통계 캐시를 읽어 해당 파일의 이전 값을 빼고 새 값을 더합니다.
+
+    Returns:
+        (합계 통계, 다시 읽은 파일 수)
+    """
+    root = str(files[0].parent.resolve()) if files else ''
+    signatures = corpus_signature(files)
+
+    data = read_cache(CACHE_NAME)
+    if not data or data.get('version') != CACHE_VERSION or data.get('root') != root:
+        data = None
+    elif data['signatures'] == signatures:
+        return CharStats.from_json(data['total']), 0
+
+    per_file = read_cache(FILES_CACHE_NAME) if data else None
+    if per_file is None:
+        # 파일별 캐시가 없으면 합계도 믿을 수 없으므로 처음부터 계산
+        data = None
+        per_file = {}
+    total = CharStats.from_json(data['total']) if data else CharStats()
+    old_signatures = data['signatures'] if data else {}
+
+    changed = 0
+    for name in list(old_signatures):
+        if name in signatures and old_signatures[name] == signatures[name]:
+            continue
+        if name in per_file:
+            total.remove(CharStats.from_json(per_file.pop(name)))
+    for path in files:
+        if old_signatures.get(path.name) == signatures[path.name] and path.name in per_file:
+            continue
+        stats = CharStats.from_file(path)
+        total.add(stats)
+        per_file[path.name] = stats.to_json()
+        changed += 1
+
+    write_cache(FILES_CACHE_NAME, per_file)
+    write_cache(CACHE_NAME, {
+        'version': CACHE_VERSION,
+        'root': root,
+        'signatures': signatures,
+        'total': total.to_json(),
+    })
+    return total, changed
@@ -0,0 +1,62 @@
+"""
+번역 코퍼스(dialog_translated/) 공용 경로와 헬퍼
+
+여러 도구가 같은 캐시 디렉토리와 파일 시그니처 규칙을 쓰도록 모아 둡니다.
+"""
+
+import json
+from pathlib import Path
+
+from csv_rows import open_rows
+from record_store import RecordStore
+
+TRANSLATE_DIR = Path(__file__).parent
+DIALOG_DIR = TRANSLATE_DIR / "dialog_translated"
+# 인덱스/검사 결과 캐시 (gitignore)
+CACHE_DIR = TRANSLATE_DIR / ".cache"
+
+
+def csv_files(dialog_dir: Path = DIALOG_DIR) -> list[Path]:
+    """코퍼스 CSV 파일 목록 (이름순)"""
+    return sorted(dialog_dir.glob("*.csv"))
+
+
+def file_signature(path: Path) -> list[int]:
+    """파일 변경 감지용 시그니처 [mtime_ns, size]"""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def corpus_signature(files: list[Path]) -> dict[str, list[int]]:
+    """파일명 → 시그니처"""
+    return {path.name: file_signature(path) for path in files}
+
+
+def load_records(files: list[Path]) -> RecordStore:
+    """CSV 파일들을 병합 순서대로 RecordStore에 로드 (출력 없음)"""
+    records = RecordStore()
+    for path in files:
+        with open_rows(path) as reader:
+            records.extend(reader.fieldnames, reader, path.name)
+    return records
+
+
+def read_cache(name: str) -> dict | None:
+    """캐시 JSON 읽기 (없거나 손상되면 None)"""
+    path = CACHE_DIR / name
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name: str, data: dict) -> Path:
+    """캐시 JSON 저장 (임시 파일에 쓴 뒤 교체)"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / name
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    tmp_path.replace(path)
+    return path
@@ -0,0 +1,148 @@
+"""
+TLK 인코딩 사전 검사 (CP949 / CP1252)
+
+TLK 인코더(csv_to_tlk.py의 _encode_text)는 한글이 있는 문자열을 CP949로,
+없는 문자열을 CP1252로 인코딩하고, 실패하면 문자열 전체를 UTF-8로 바꿔 씁니다.
+게임에서 깨지는 이 경우를 빌드 전에 찾기 위해 같은 규칙으로 텍스트를 인코딩별로
+이어 붙여 한 번에 인코딩하고, 등록한 오류 처리기로 실패한 문자와 위치를 모읍니다.
+"""
+
+import codecs
+import unicodedata
+from bisect import bisect_right
+from typing import Iterable
+
+from ksx1001 import contains_hangul
+
+# 인코더가 CP949 인코딩 전에 항상 치환하는 문자
+ENCODE_SUBSTITUTIONS = {
+    '\u2014': '-',   # em dash
+    '\u2013': '-',   # en dash
+    '\u00a0': ' ',   # non-breaking space
+}
+
+# 보고서에 제안할 치환 (인코더는 적용하지 않음)
+SUGGESTED_SUBSTITUTIONS = {
+    '\u2212': '-',   # minus sign
+    '\u2011': '-',   # non-breaking hyphen
+    '\u2010': '-',   # hyphen
+    '\u2009': ' ',   # thin space
+    '\u202f': ' ',   # narrow no-break space
+    '\u200b': '',    # zero width space
+    '\ufeff': '',    # BOM
+    '•': '·',   # bullet (CP949에 없음)
+    '〜': '～',  # wave dash
+    '・': '·',   # katakana middle dot
+    **ENCODE_SUBSTITUTIONS,
+}
+
+_ERROR_HANDLER = 'tlk_preflight'
+# 오류 처리기가 채우는 (오프셋, 문자) 목록 (encode 호출마다 비움)
+_failures: list[tuple[int, str]] = []
+
+
+def _record_failure(error: UnicodeEncodeError) -> tuple[str, int]:
+    """인코딩할 수 없는 구간을 기록하고 건너뜀"""
+    for offset in range(error.start, error.end):
+        _failures.append((offset, error.object[offset]))
+    return '', error.end
+
+
+codecs.register_error(_ERROR_HANDLER, _record_failure)
+
+
+def apply_encode_substitutions(text: str) -> str:
+    """인코더와 같은 기본 치환 적용 (문자 수 변화 없음)"""
+    for char, replacement in ENCODE_SUBSTITUTIONS.items():
+        text = text.replace(char, replacement)
+    return text
+
+
+def tlk_encoding(text: str) -> str:
+    """인코더가 이 문자열에 쓰는 인코딩"""
+    return 'cp949' if contains_hangul(text) else 'cp1252'
+
+
+def is_encodable(text: str) -> bool:
+    """인코더가 UTF-8로 대체하지 않고 인코딩할 수 있는지 (행 하나 검사용)"""
+    if text.isascii():
+        return True
+    encoding = tlk_encoding(text)
+    if encoding == 'cp949':
+        text = apply_encode_substitutions(text)
+    try:
+        text.encode(encoding)
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def suggest_substitution(char: str, encoding: str) -> str:
+    """인코딩 가능한 대체 문자열 제안 ('' = 삭제)"""
+    for candidate in (SUGGESTED_SUBSTITUTIONS.get(char), unicodedata.normalize('NFKC', char)):
+        if candidate is None or candidate == char:
+            continue
+        try:
+            candidate.encode(encoding)
+        except UnicodeEncodeError:
+            continue
+        return candidate
+    return ''
+
+
+def _encode_failures(texts: list[str], encoding: str) -> list[tuple[int, int, str]]:
+    """텍스트들을 '\\n'으로 이어 한 번에 인코딩 → (텍스트 번호, 오프셋, 문자)"""
+    if not texts:
+        return []
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text) + 1
+
+    joined = '\n'.join(texts)
+    if encoding == 'cp949':
+        joined = apply_encode_substitutions(joined)
+    _failures.clear()
+    joined.encode(encoding, errors=_ERROR_HANDLER)
+    failures = []
+    for offset, char in _failures:
+        index = bisect_right(starts, offset) - 1
+        failures.append((index, offset - starts[index], char))
+    _failures.clear()
+    return failures
+
+
+def find_encoding_failures(strrefs: Iterable[str], texts: Iterable[str],
+                           sources: Iterable[str]) -> list[dict]:
+    """TLK 인코딩에 실패할 문자 목록
+
+    Returns:
+        {'strref', 'file', 'offset', 'char', 'encoding', 'suggestion'} 목록 (입력 순서)
+    """
+    rows = []
+    groups: dict[str, list[str]] = {'cp949': [], 'cp1252': []}
+    members: dict[str, list[int]] = {'cp949': [], 'cp1252': []}
+    for strref, text, source in zip(strrefs, texts, sources):
+        if not text or text.isascii():
+            continue
+        encoding = tlk_encoding(text)
+        members[encoding].append(len(rows))
+        groups[encoding].append(text)
+        rows.append((strref, source))
+
+    failures = []
+    for encoding, group in groups.items():
+        for index, offset, char in _encode_failures(group, encoding):
+            row = members[encoding][index]
+            strref, source = rows[row]
+            failures.append((row, offset, {
+                'strref': strref,
+                'file': source,
+                'offset': offset,
+                'char': char,
+                'encoding': encoding,
+                'suggestion': suggest_substitution(char, encoding),
+            }))
+    failures.sort(key=lambda failure: failure[:2])
+    return [failure for _, _, failure in failures]
@@ -0,0 +1,145 @@
+"""
+인덱스 기반 CSV 행 로더
+
+csv.DictReader는 행마다 dict를 만들기 때문에 대화 CSV 전체를 읽을 때 비용이 큽니다.
+헤더에서 컬럼 위치를 한 번만 계산하고(BOM 제거 포함), csv.reader 행을
+튜플(또는 namedtuple)로 넘겨줍니다. 필요한 컬럼만 골라 읽을 수도 있습니다.
+
+사용 예:
+    with open_rows(path, ('StrRef', 'Text')) as reader:
+        for strref, text in reader:
+            ...
+"""
+
+import csv
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+
+def normalize_field(name: str) -> str:
+    """헤더 이름에서 BOM 문자 제거"""
+    return name.lstrip('\ufeff')
+
+
+@lru_cache(maxsize=None)
+def row_type(fields: tuple[str, ...]):
+    """필드 조합별 namedtuple 클래스 (캐시)"""
+    return namedtuple('Row', fields)
+
+
+class RowReader:
+    """csv.reader 기반 행 리더
+
+    Args:
+        f: 열린 텍스트 파일
+        fields: 읽을 컬럼 (None이면 헤더 전체). 헤더에 없는 컬럼은 빈 문자열
+        named: True면 namedtuple 행 반환
+    """
+
+    def __init__(self, f, fields: Sequence[str] | None = None, named: bool = False):
+        self._reader = csv.reader(f)
+        header = next(self._reader, [])
+        self.fieldnames: list[str] = [normalize_field(name) for name in header]
+        self.fields: tuple[str, ...] = tuple(fields) if fields is not None else tuple(self.fieldnames)
+
+        # 중복 컬럼은 DictReader와 같이 마지막 위치 사용
+        positions = {name: pos for pos, name in enumerate(self.fieldnames)}
+        missing = len(self.fieldnames)
+        indexes = [positions.get(name, missing) for name in self.fields]
+
+        # 없는 컬럼은 행 끝에 덧붙인 빈 칸을 가리킴
+        self._width = max(indexes, default=-1) + 1
+        if not indexes:
+            self._getter = lambda row: ()
+        elif len(indexes) == 1:
+            single = indexes[0]
+            self._getter = lambda row: (row[single],)
+        else:
+            self._getter = itemgetter(*indexes)
+        self._make = row_type(self.fields)._make if named else None
+
+    @property
+    def line_num(self) -> int:
+        return self._reader.line_num
+
+    def index(self, field: str) -> int:
+        """반환되는 행 튜플에서 필드 위치"""
+        return self.fields.index(field)
+
+    def __iter__(self) -> Iterator[tuple]:
+        getter = self._getter
+        width = self._width
+        make = self._make
+        for row in self._reader:
+            if not row:
+                continue  # 빈 줄은 DictReader와 동일하게 건너뜀
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            values = getter(row)
+            yield make(values) if make else values
+
+
+@contextmanager
+def open_rows(path: Path, fields: Sequence[str] | None = None, named: bool = False,
+              keep_newlines: bool = False):
+    """CSV 파일을 열어 RowReader 반환
+
+    keep_newlines: 필드 안의 줄바꿈(\\r\\n)을 그대로 유지. 파일을 다시 써야 하는 도구는
+    True로 읽어야 수정하지 않은 행이 바뀌지 않습니다.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='' if keep_newlines else None) as f:
+        yield RowReader(f, fields, named)
+
+
+def load_rows(path: Path, fields: Sequence[str] | None = None, named: bool = False,
+              keep_newlines: bool = False) -> tuple[list[str], list[tuple]]:
+    """CSV 파일 전체를 (헤더, 행 리스트)로 로드"""
+    with open_rows(path, fields, named, keep_newlines) as reader:
+        return reader.fieldnames, list(reader)
+
+
+def read_row_at(path: Path, offset: int, fields: Sequence[str] | None = None,
+                named: bool = False, keep_newlines: bool = False) -> tuple | None:
+    """바이트 오프셋에서 시작하는 한 행만 읽기 (파일 전체를 파싱하지 않음)
+
+    offset은 행의 첫 줄 시작 위치여야 합니다 (strref_index.py가 기록한 값).
+    """
+    return read_rows_at(path, [offset], fields, named, keep_newlines)[0]
+
+
+def read_rows_at(path: Path, offsets: Iterable[int], fields: Sequence[str] | None = None,
+                 named: bool = False, keep_newlines: bool = False) -> list[tuple | None]:
+    """여러 오프셋의 행을 파일을 한 번 열어 읽기 (오프셋마다 이동해 한 행씩 파싱)"""
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8-sig')
+
+        def lines():
+            for line in iter(f.readline, b''):
+                line = line.decode('utf-8')
+                yield line if keep_newlines else line.replace('\r\n', '\n')
+
+        # 오프셋마다 새 리더 (파일 끝을 넘는 오래된 오프셋이 뒤의 오프셋을 막지 않도록)
+        rows = []
+        for offset in offsets:
+            f.seek(offset)
+            rows.append(next(iter(RowReader(chain([header], lines()), fields, named)), None))
+        return rows
+
+
+def write_rows(path: Path, fieldnames: Sequence[str], rows: Iterable[Sequence[str]]) -> None:
+    """CSV 파일 저장 (같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 교체)"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
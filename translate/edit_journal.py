@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+편집 저널: 편집기 저장을 추가 전용 로그로 기록
+
+편집기가 한 줄을 고칠 때마다 CSV 전체를 다시 쓰지 않도록, 저장은 저널 파일에
+JSON 한 줄을 덧붙이고 fsync하는 것으로 끝납니다. 백그라운드 압축기(JournalCompactor)가
+모인 편집을 파일별로 묶어 CSV에 반영하고, 다 반영한 저널은 지웁니다.
+CSV는 바뀐 행의 바이트만 갈아 끼운 뒤 임시 파일에 쓰고 원자적으로 교체하므로,
+나머지 행은 그대로이고 도중에 중단되어도 파일이 깨지지 않습니다.
+
+압축은 저널을 .compacting으로 이름을 바꾼 뒤 진행합니다. 그동안의 저장은 새 저널에
+쌓이고, 중단되면 다음 압축이 .compacting부터 다시 반영합니다 (값 덮어쓰기라 반복해도 같음).
+기록은 쓰기 잠금을 공유로 잡고, 압축기는 이름 변경과 마지막 확인/삭제 때만 배타로 잡으므로
+다른 프로세스의 기록이 삭제될 파일에 들어가지 않습니다.
+병합(merge_dialog_files.py)과 편집기는 CSV 위에 아직 반영되지 않은 편집을 덮어 읽으므로
+저장 즉시 빌드에 보입니다.
+
+사용법:
+    python3 edit_journal.py             # 반영 대기 중인 편집 표시
+    python3 edit_journal.py --compact   # 지금 CSV에 반영
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, ContextManager, Iterable, Sequence
+
+from corpus import DIALOG_DIR, TRANSLATE_DIR
+from csv_rows import normalize_field
+from strref_index import scan_offsets
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+JOURNAL_PATH = TRANSLATE_DIR / "edit_journal.jsonl"
+# 백그라운드 압축 간격(초)과 즉시 압축할 편집 수
+COMPACT_INTERVAL = 30.0
+COMPACT_BATCH = 200
+
+# 같은 프로세스 안의 기록/이름 변경 직렬화
+_lock = threading.Lock()
+
+
+def compacting_path(journal: Path = JOURNAL_PATH) -> Path:
+    return journal.with_name(journal.name + '.compacting')
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path, shared: bool = False):
+    """OS 파일 잠금 (Windows는 공유 잠금이 없어 항상 배타)"""
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 10초 동안 재시도한 뒤 실패
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def journal_lock(journal: Path = JOURNAL_PATH):
+    """프로세스 간 압축 직렬화 (편집기와 API 서버가 같은 저널을 압축할 수 있음)"""
+    return _file_lock(journal.with_name(journal.name + '.lock'))
+
+
+def write_lock(journal: Path = JOURNAL_PATH, shared: bool = False):
+    """저널 기록 잠금: 기록은 공유로 열기~fsync 동안, 압축기는 배타로 이름 변경과 삭제 때만"""
+    return _file_lock(journal.with_name(journal.name + '.write.lock'), shared)
+
+
+def append_edits(edits: Iterable[tuple[str, str, str]], field: str = 'Text',
+                 journal: Path = JOURNAL_PATH) -> int:
+    """(파일명, StrRef, 값) 편집들을 한 번의 쓰기와 fsync로 기록 → 기록한 수"""
+    now = round(time.time(), 3)
+    lines = [json.dumps({'file': name, 'strref': strref, 'field': field, 'value': value,
+                         'time': now}, ensure_ascii=False) + '\n'
+             for name, strref, value in edits]
+    if not lines:
+        return 0
+    data = ''.join(lines).encode('utf-8')
+    with _lock, write_lock(journal, shared=True):
+        with open(journal, 'a+b') as f:
+            # 이전 기록이 중단되어 줄바꿈 없이 끝났으면 새 줄에서 시작
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    return len(lines)
+
+
+def read_journal(path: Path) -> list[dict]:
+    """저널 레코드 (기록 도중 중단되어 줄바꿈 없이 끝난 마지막 줄은 무시)"""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def pending_edits(journal: Path = JOURNAL_PATH) -> dict[str, dict[str, dict[str, str]]]:
+    """CSV에 아직 반영되지 않은 편집: 파일명 → StrRef → {필드: 값} (나중 기록 우선)
+
+    압축기가 그 사이에 이름을 바꿔도 빠뜨리지 않도록 저널을 먼저 읽고,
+    적용은 오래된 .compacting부터 합니다. CSV보다 먼저 읽어야 합니다.
+    """
+    current = read_journal(journal)
+    older = read_journal(compacting_path(journal))
+    edits: dict[str, dict[str, dict[str, str]]] = {}
+    for record in older + current:
+        edits.setdefault(record['file'], {}).setdefault(record['strref'], {})[record['field']] = record['value']
+    return edits
+
+
+def apply_row_edits(row: tuple, fields: Sequence[str], changes: dict[str, str]) -> tuple:
+    """행 튜플에 편집 반영 (namedtuple이면 같은 타입 유지)"""
+    values = list(row)
+    for field, value in changes.items():
+        if field in fields:
+            values[fields.index(field)] = value
+    return row._make(values) if hasattr(row, '_make') else tuple(values)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # 쓰기마다 고유한 임시 파일 (같은 파일을 동시에 쓰는 쪽과 임시 파일을 공유하지 않음)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_name, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def apply_file_edits(path: Path, changes: dict[str, dict[str, str]]) -> int:
+    """CSV에서 편집된 행의 바이트만 바꿔 원자적으로 저장 → 바꾼 행 수"""
+    data = path.read_bytes()
+    header_end = data.find(b'\n') + 1 or len(data)
+    header = next(csv.reader([data[:header_end].decode('utf-8-sig')]), [])
+    positions = {normalize_field(name): pos for pos, name in enumerate(header)}
+
+    entries = scan_offsets(path)
+    bounds = [start for _, start in entries] + [len(data)]
+    parts = []
+    last = 0
+    count = 0
+    for i, (strref, start) in enumerate(entries):
+        edits = changes.get(strref)
+        if not edits:
+            continue
+        end = bounds[i + 1]
+        chunk = data[start:end].decode('utf-8')
+        row = next(row for row in csv.reader(io.StringIO(chunk, newline='')) if row)
+        row += [''] * (len(header) - len(row))
+        for field, value in edits.items():
+            if field in positions:
+                row[positions[field]] = value
+
+        terminator = '\r\n' if chunk.endswith('\r\n') else '\n'
+        out = io.StringIO()
+        csv.writer(out, lineterminator=terminator).writerow(row)
+        text = out.getvalue()
+        if not chunk.endswith('\n'):
+            text = text[:-len(terminator)]  # 줄바꿈 없이 끝나는 마지막 행
+
+        parts.append(data[last:start])
+        parts.append(text.encode('utf-8'))
+        last = end
+        count += 1
+
+    if count:
+        parts.append(data[last:])
+        _write_atomic(path, b''.join(parts))
+    return count
+
+
+def compact_journal(dialog_dir: Path = DIALOG_DIR, journal: Path = JOURNAL_PATH) -> dict[str, int]:
+    """저널 편집을 CSV에 반영하고 저널 삭제 → 파일명별 바꾼 행 수"""
+    with journal_lock(journal):
+        return _compact_locked(dialog_dir, journal)
+
+
+def _compact_locked(dialog_dir: Path, journal: Path) -> dict[str, int]:
+    compacting = compacting_path(journal)
+    # 이름 변경 전에 다른 프로세스의 기록이 끝나기를 기다림 (이후 기록은 새 저널로 감)
+    with _lock, write_lock(journal):
+        if not compacting.exists():
+            if not journal.exists():
+                return {}
+            os.replace(journal, compacting)
+
+    applied: dict[str, int] = {}
+    done = 0
+    while True:
+        records = read_journal(compacting)
+        if len(records) <= done:
+            # 마지막 확인과 삭제 사이에 .compacting에 기록이 끼어들지 않도록 배타 잠금
+            with _lock, write_lock(journal):
+                records = read_journal(compacting)
+                if len(records) <= done:
+                    compacting.unlink(missing_ok=True)
+                    break
+            continue
+        changes: dict[str, dict[str, dict[str, str]]] = {}
+        for record in records[done:]:
+            changes.setdefault(record['file'], {}).setdefault(record['strref'], {})[record['field']] = record['value']
+        for name, file_changes in changes.items():
+            path = dialog_dir / name
+            if not path.exists():
+                print(f"  [저널] 파일 없음, 편집 {len(file_changes)}건 건너뜀: {name}")
+                continue
+            applied[name] = applied.get(name, 0) + apply_file_edits(path, file_changes)
+        done = len(records)
+    return applied
+
+
+class JournalCompactor(threading.Thread):
+    """일정 간격마다, 또는 편집이 batch개 쌓이면 바로 저널을 CSV에 반영하는 데몬 스레드"""
+
+    def __init__(self, interval: float = COMPACT_INTERVAL, batch: int = COMPACT_BATCH,
+                 dialog_dir: Path = DIALOG_DIR, journal: Path = JOURNAL_PATH,
+                 on_compact: Callable[[dict[str, int]], None] | None = None,
+                 lock: ContextManager | None = None):
+        super().__init__(name='journal-compactor', daemon=True)
+        self.interval = interval
+        self.batch = batch
+        self.dialog_dir = dialog_dir
+        self.journal = journal
+        self.on_compact = on_compact
+        # 압축 중 CSV를 오프셋으로 읽는 쪽과 겹치지 않게 할 잠금 (선택)
+        self.lock = lock or contextlib.nullcontext()
+        self.pending = 0
+        self._wake = threading.Event()
+
+    def notify(self, count: int = 1) -> None:
+        """저장 후 호출 (batch개가 쌓이면 바로 압축)"""
+        self.pending += count
+        if self.pending >= self.batch:
+            self._wake.set()
+
+    def run(self) -> None:
+        while True:
+            # 시작하자마자 이전 실행에서 남은 저널부터 반영
+            try:
+                with self.lock:
+                    applied = compact_journal(self.dialog_dir, self.journal)
+                if applied and self.on_compact:
+                    self.on_compact(applied)
+            except Exception as e:
+                print(f"[저널 압축 실패] {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.pending = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='편집 저널 상태 확인 및 CSV 반영')
+    parser.add_argument('--compact', action='store_true',
+                        help='반영 대기 중인 편집을 지금 CSV에 반영')
+    args = parser.parse_args()
+
+    edits = pending_edits()
+    total = sum(len(rows) for rows in edits.values())
+    print(f"반영 대기 편집: {total}행 ({len(edits)}개 파일)")
+    for name, rows in sorted(edits.items()):
+        print(f"  {name}: {len(rows)}행")
+
+    if args.compact and total:
+        applied = compact_journal()
+        print(f"CSV 반영 완료: {sum(applied.values())}행 ({len(applied)}개 파일)")
+
+
+if __name__ == '__main__':
+    main()
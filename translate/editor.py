@@ -9,30 +9,36 @@ dialog_translated/ 디렉토리의 CSV 파일들을 편집하는 웹 UI입니다
     streamlit run editor.py
 """
 
-import csv
+import re
 import streamlit as st
 from pathlib import Path
 
+from corpus import corpus_signature, csv_files, file_signature, load_records
+from edit_journal import JournalCompactor, append_edits, apply_row_edits, pending_edits
+from fuzzy_memory import FuzzyMemory, fuzzy_memory
+from ksx1001 import invalid_hangul
+from row_cache import RowCache
+from row_flags import RULES, RowFlags, row_flags, row_rules
+from row_pages import PagedRows
+from search_index import SearchIndex
+from strref_index import StrRefIndex, strref_index
+from translation_memory import TranslationMemory
+from workspace import WORKSPACE_PATH, Workspace
+
 TRANSLATE_DIR = Path(__file__).parent
 DIALOG_DIR = TRANSLATE_DIR / "dialog_translated"
 PAGE_SIZE = 15
 
-
-def get_ksx1001_hangul():
-    """KS X 1001에 정의된 완성형 한글 2,350자를 반환"""
-    hangul_chars = set()
-    for first in range(0xB0, 0xC9):
-        for second in range(0xA1, 0xFF):
-            if first == 0xC8 and second > 0xFE:
-                continue
-            try:
-                byte_seq = bytes([first, second])
-                char = byte_seq.decode('euc-kr')
-                if '\uAC00' <= char <= '\uD7A3':
-                    hangul_chars.add(char)
-            except:
-                pass
-    return hangul_chars
+# 전체 검색 모드에서 사용하는 컬럼 (필요한 컬럼만 읽음)
+SEARCH_FIELDS = ('StrRef', 'Text', 'TextEng', 'SpeakerType', 'SpeakerName')
+# 전체 검색 역색인 컬럼
+INDEX_FIELDS = ('Text', 'TextEng')
+SEARCH_SCOPES = {"번역문": ('Text',), "원문": ('TextEng',), "둘 다": ('Text', 'TextEng')}
+SEARCH_MODES = {"포함": 'contains', "대소문자 구분": 'exact', "정규식": 'regex'}
+# 행마다 보여 줄 유사 번역 수
+SUGGESTION_COUNT = 3
+# 검증 필터 → 규칙 이름 (빈 튜플 = 필터 없음)
+ISSUE_FILTERS = {"전체": (), "문제 있음": tuple(RULES), **{label: (rule,) for rule, label in RULES.items()}}
 
 
 @st.cache_data
@@ -41,79 +47,254 @@ def load_csv_files():
     return sorted([f.name for f in DIALOG_DIR.glob("*.csv")])
 
 
-def load_csv(filename: str) -> list[dict]:
-    """CSV 파일 로드"""
-    filepath = DIALOG_DIR / filename
-    rows = []
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+@st.cache_resource
+def load_translation_memory() -> TranslationMemory:
+    """동일 원문 인덱스 (propagate_translations.py와 같은 캐시 사용, 없으면 생성)
 
+    편집기는 TextEng를 수정하지 않으므로 캐시가 조금 오래되어도 형제 관계는 유효합니다.
+    """
+    memory = TranslationMemory.load()
+    if memory is None:
+        files = csv_files(DIALOG_DIR)
+        memory = TranslationMemory.build(load_records(files), corpus_signature(files))
+        memory.save()
+    return memory
 
-@st.cache_data
-def load_all_csv() -> list[tuple[str, dict]]:
-    """모든 CSV 파일 로드 (파일명, 레코드) 튜플 리스트"""
-    all_rows = []
-    for csv_file in sorted(DIALOG_DIR.glob("*.csv")):
-        with open(csv_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                all_rows.append((csv_file.name, row))
-    return all_rows
-
-
-def save_csv(filename: str, rows: list[dict]):
-    """CSV 파일 저장"""
-    filepath = DIALOG_DIR / filename
-    if not rows:
-        return
 
-    fieldnames = list(rows[0].keys())
-    with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+@st.cache_resource
+def load_strref_index() -> StrRefIndex:
+    """StrRef → (파일, 행, 오프셋) 인덱스 (캐시에서 로드 후 바뀐 파일만 갱신)"""
+    return strref_index(DIALOG_DIR)
 
 
-def save_record(filename: str, strref: str, new_text: str):
-    """단일 레코드 저장"""
-    filepath = DIALOG_DIR / filename
-    rows = load_csv(filename)
+@st.cache_resource
+def load_fuzzy_memory() -> FuzzyMemory:
+    """유사 원문 번역 메모리 (캐시에서 로드 후 바뀐 파일만 다시 읽음, 색인은 메모리에)"""
+    memory = fuzzy_memory(DIALOG_DIR)
+    memory.ensure_index()
+    return memory
 
-    for row in rows:
-        if row.get('StrRef') == strref:
-            row['Text'] = new_text
-            break
 
-    save_csv(filename, rows)
+@st.cache_resource
+def load_row_flags() -> RowFlags:
+    """행별 검증 플래그 (캐시에서 로드 후 바뀐 파일만 다시 계산)"""
+    return row_flags(DIALOG_DIR)
 
 
-def check_ksx1001(text: str, ksx1001_hangul: set) -> list[str]:
-    """완성형 범위를 벗어나는 한글 찾기"""
-    invalid = []
-    for char in text:
-        if '\uAC00' <= char <= '\uD7A3' and char not in ksx1001_hangul:
-            invalid.append(char)
-    return invalid
-
-
-def find_by_strref(strref: str) -> tuple[str, int, dict] | None:
-    """StrRef로 레코드 찾기"""
-    for csv_file in DIALOG_DIR.glob("*.csv"):
-        rows = load_csv(csv_file.name)
-        for idx, row in enumerate(rows):
-            if row.get('StrRef') == strref:
-                return csv_file.name, idx, row
+@st.cache_resource
+def start_compactor() -> JournalCompactor:
+    """편집 저널을 CSV에 반영하는 백그라운드 스레드 (프로세스당 하나)"""
+    compactor = JournalCompactor()
+    compactor.start()
+    return compactor
+
+
+@st.cache_resource
+def open_workspace() -> Workspace:
+    """SQLite 작업공간 (열 때 바뀐 CSV만 다시 가져옴)"""
+    workspace = Workspace()
+    workspace.import_csv(DIALOG_DIR)
+    return workspace
+
+
+def active_workspace() -> Workspace | None:
+    """사이드바에서 작업공간을 켰으면 작업공간, 아니면 None (CSV 직접 편집)"""
+    if st.session_state.get('use_workspace') and WORKSPACE_PATH.exists():
+        return open_workspace()
     return None
 
 
+@st.cache_resource
+def search_row_cache() -> RowCache:
+    """전체 검색 모드 행 캐시 (SEARCH_FIELDS만 읽음)"""
+    return RowCache(DIALOG_DIR, SEARCH_FIELDS)
+
+
+@st.cache_resource
+def paged_rows_holder() -> dict:
+    """파일명 → (소스 키, PagedRows)"""
+    return {}
+
+
+def load_pages(filename: str) -> PagedRows:
+    """단일 파일 모드 페이지 소스 (파일이 바뀌었을 때만 새로 만듦, 저널 편집 반영)
+
+    행 수와 행 위치는 StrRef 인덱스에서 가져오므로 파일을 열 때 행을 파싱하지 않습니다.
+    """
+    holder = paged_rows_holder()
+    workspace = active_workspace()
+    if workspace is not None:
+        key = ('workspace',)
+    else:
+        key = ('csv', tuple(file_signature(DIALOG_DIR / filename)))
+    cached = holder.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    if workspace is not None:
+        pages = PagedRows.from_workspace(workspace, filename, PAGE_SIZE)
+    else:
+        offsets = load_strref_index().entries(filename)
+        pages = PagedRows.from_csv(DIALOG_DIR / filename, offsets, pending_edits().get(filename), PAGE_SIZE)
+    holder[filename] = (key, pages)
+    return pages
+
+
+def load_all_csv() -> list[tuple[str, tuple]]:
+    """모든 CSV 파일의 (파일명, SEARCH_FIELDS 순서의 값 튜플) 리스트, 저널 편집 반영"""
+    workspace = active_workspace()
+    if workspace is not None:
+        return workspace.all_rows()
+    return search_row_cache().all_rows()
+
+
+@st.cache_resource
+def search_index_holder() -> dict:
+    """전체 검색 색인 보관 (처음 검색할 때 생성)"""
+    return {}
+
+
+def load_search_index() -> SearchIndex:
+    """전체 검색 역색인 (load_all_csv 순서의 행 번호)
+
+    행 배치가 바뀌었을 때만 다시 만들고, 저장이나 파일 변경으로 값이 바뀐 행은
+    행 캐시의 on_change로 그 행만 갱신합니다.
+    """
+    holder = search_index_holder()
+    cache = search_row_cache()
+    all_rows = cache.all_rows()
+    if holder.get('version') != cache.layout_version:
+        positions = [SEARCH_FIELDS.index(field) for field in INDEX_FIELDS]
+        index = SearchIndex.build(INDEX_FIELDS, ([row[pos] for pos in positions] for _, row in all_rows))
+        cache.on_change = lambda row_id, row: index.update(row_id, [row[pos] for pos in positions])
+        holder['index'] = index
+        holder['version'] = cache.layout_version
+    return holder['index']
+
+
+def save_records(filename: str, texts: dict[str, str]):
+    """번역문 저장 (편집 저널에 기록하고 캐시된 행만 갱신, CSV는 백그라운드 압축기가 반영)
+
+    작업공간 모드에서는 작업공간에만 저장하고, CSV에는 내보낼 때 반영합니다.
+    """
+    workspace = active_workspace()
+    if workspace is not None:
+        workspace.update_texts(filename, texts)
+    else:
+        count = append_edits((filename, strref, text) for strref, text in texts.items())
+        start_compactor().notify(count)
+        # 검증 플래그는 CSV 시그니처 기준이므로 CSV가 바뀌는 저널 저장일 때만 갱신
+        flags = load_row_flags()
+        flags.update_texts(filename, texts, load_strref_index().entries(filename))
+        flags.save()
+    load_fuzzy_memory().update_texts(filename, texts, load_strref_index().entries(filename))
+    cached = paged_rows_holder().get(filename)
+    if cached is not None:
+        for strref, text in texts.items():
+            cached[1].patch(strref, {'Text': text})
+    if workspace is None:
+        search_row_cache().patch_many(filename, {strref: {'Text': text} for strref, text in texts.items()})
+
+
+def save_record(filename: str, strref: str, new_text: str):
+    """단일 레코드 저장"""
+    save_records(filename, {strref: new_text})
+
+
+def check_ksx1001(text: str) -> list[str]:
+    """완성형 범위를 벗어나는 한글 찾기"""
+    return invalid_hangul(text)
+
+
+def issue_filter_box(key: str, counts: dict[str, int]) -> tuple[str, ...]:
+    """검증 필터 선택 (counts: 필터 이름 → 문제 행 수) → 규칙 이름 목록"""
+    option = st.selectbox(
+        "검증 필터",
+        list(ISSUE_FILTERS),
+        format_func=lambda name: f"{name} ({counts[name]})" if name in counts else name,
+        key=key
+    )
+    return ISSUE_FILTERS[option]
+
+
+def issue_counts(flags: RowFlags, names: list[str]) -> dict[str, int]:
+    """파일들의 검증 필터별 문제 행 수 (비트 수 세기)"""
+    counts = dict.fromkeys(ISSUE_FILTERS, 0)
+    del counts["전체"]
+    for name in names:
+        for rule, count in flags.counts(name).items():
+            counts[RULES[rule]] += count
+        counts["문제 있음"] += flags.issue_count(name)
+    return counts
+
+
+def flagged_rows(flags: RowFlags, rules: tuple[str, ...]) -> set[tuple[str, str]]:
+    """규칙에 걸린 (파일명, StrRef) 집합 (비트셋의 행 번호를 StrRef 인덱스로 변환)"""
+    strrefs = load_strref_index()
+    flagged = set()
+    for name in load_csv_files():
+        rows = flags.rows(name, rules)
+        if rows:
+            entries = strrefs.entries(name)
+            flagged.update((name, entries[row][0]) for row in rows)
+    return flagged
+
+
+def show_suggestions(fuzzy: FuzzyMemory, text_eng: str, strref: str):
+    """비슷한 원문의 기존 번역 표시"""
+    suggestions = fuzzy.suggest(text_eng, SUGGESTION_COUNT, exclude=strref)
+    if not suggestions:
+        return
+    with st.expander(f"💡 유사 번역 {len(suggestions)}개"):
+        for suggestion in suggestions:
+            more = f" 외 {suggestion['count'] - 1}개" if suggestion['count'] > 1 else ""
+            st.markdown(f"**{suggestion['score']:.0%}** {suggestion['source']}")
+            st.code(suggestion['text'], language=None)
+            st.caption(f"{suggestion['file']} / StrRef {suggestion['strref']}{more}")
+
+
+def show_issues(text: str, text_eng: str):
+    """행의 검증 문제 표시 (완성형 오류는 문자까지, 보이는 행만 검사)"""
+    invalid_chars = check_ksx1001(text)
+    if invalid_chars:
+        st.error(f"⚠️ {', '.join(set(invalid_chars))}")
+    others = [RULES[rule] for rule in row_rules(text, text_eng) if rule != 'ksx1001']
+    if others:
+        st.warning(' · '.join(others))
+
+
+def show_siblings(memory: TranslationMemory, text_eng: str, strref: str):
+    """영어 원문이 같은 다른 StrRef 표시"""
+    siblings = memory.siblings(text_eng, strref)
+    if not siblings:
+        return
+    shown = ', '.join(f"{sib_strref} ({sib_file})" for sib_strref, sib_file in siblings[:5])
+    more = f" 외 {len(siblings) - 5}개" if len(siblings) > 5 else ""
+    st.caption(f"🔁 동일 원문 {len(siblings)}개: {shown}{more}")
+
+
+def find_by_strref(strref: str) -> tuple[str, int, tuple] | None:
+    """StrRef로 레코드 찾기 (인덱스에서 위치를 찾아 그 행만 읽음, 저널 편집 반영)"""
+    workspace = active_workspace()
+    if workspace is not None:
+        return workspace.get(strref)
+    result = load_strref_index().read(strref, named=True)
+    if result is None:
+        return None
+    filename, idx, row = result
+    changes = pending_edits().get(filename, {}).get(strref)
+    if changes:
+        row = apply_row_edits(row, row._fields, changes)
+    return filename, idx, row
+
+
 def main():
     st.set_page_config(page_title="NWN:EE 번역 편집기", layout="wide")
     st.title("NWN:EE 번역 편집기")
 
-    ksx1001_hangul = get_ksx1001_hangul()
+    memory = load_translation_memory()
+    flags = load_row_flags()
+    start_compactor()
+    fuzzy = None
 
     # 사이드바
     with st.sidebar:
@@ -124,6 +305,24 @@ def main():
             ["단일 파일", "전체 검색"],
             horizontal=True
         )
+        if st.checkbox("유사 번역 제안", value=True, key="show_suggestions",
+                       help="편집 중인 행과 원문이 비슷한 기존 번역을 보여 줍니다."):
+            with st.spinner("번역 메모리 로드 중..."):
+                fuzzy = load_fuzzy_memory()
+
+        if WORKSPACE_PATH.exists():
+            st.toggle("SQLite 작업공간", value=True, key="use_workspace",
+                      help="작업공간(workspace.sqlite3)에서 읽고 저장합니다. CSV에는 내보낼 때 반영됩니다.")
+            workspace = active_workspace()
+            if workspace is not None:
+                dirty = sum(workspace.status()['dirty'].values())
+                st.caption(f"내보내지 않은 편집: {dirty}행")
+                if dirty and st.button("📤 CSV로 내보내기"):
+                    exported = workspace.export_csv(DIALOG_DIR)
+                    st.success(f"내보내기 완료: {len(exported)}개 파일")
+                    st.rerun()
+        else:
+            st.caption("SQLite 작업공간: `python3 workspace.py import`로 만들면 사용할 수 있습니다.")
 
         st.divider()
         st.header("검색")
@@ -137,6 +336,7 @@ def main():
                 st.success(f"발견: {filename}")
                 st.session_state['selected_file'] = filename
                 st.session_state['search_strref'] = strref_input
+                st.session_state['single_page'] = idx // PAGE_SIZE + 1
                 st.session_state['view_mode'] = "단일 파일"
             else:
                 st.error("찾을 수 없음")
@@ -148,7 +348,8 @@ def main():
             selected_file = st.selectbox(
                 "파일 선택",
                 csv_files,
-                index=csv_files.index(st.session_state.get('selected_file', csv_files[0])) if st.session_state.get('selected_file') in csv_files else 0
+                index=csv_files.index(st.session_state.get('selected_file', csv_files[0])) if st.session_state.get('selected_file') in csv_files else 0,
+                format_func=lambda name: f"{name} (⚠️ {issues})" if (issues := flags.issue_count(name)) else name
             )
             st.caption(f"총 {len(csv_files)}개 파일")
         else:
@@ -156,68 +357,57 @@ def main():
 
     # 메인 영역
     if view_mode == "단일 파일" and selected_file:
-        # 단일 파일 모드
-        rows = load_csv(selected_file)
-
-        # 검색된 StrRef로 스크롤
+        # 단일 파일 모드 (보이는 페이지와 다음 페이지의 행만 읽음)
+        pages = load_pages(selected_file)
         search_strref = st.session_state.get('search_strref', '')
-        highlight_idx = None
-        if search_strref:
-            for idx, row in enumerate(rows):
-                if row.get('StrRef') == search_strref:
-                    highlight_idx = idx
-                    break
 
-        st.subheader(f"📄 {selected_file} ({len(rows)}개 레코드)")
+        st.subheader(f"📄 {selected_file} ({pages.count}개 레코드)")
 
         # 필터
         col1, col2 = st.columns([3, 1])
         with col1:
             text_filter = st.text_input("텍스트 필터", placeholder="검색어 입력...", key="single_filter")
         with col2:
-            show_invalid_only = st.checkbox("완성형 오류만", key="single_invalid")
-
-        # 필터링
-        filtered_rows = []
-        for idx, row in enumerate(rows):
-            text = row.get('Text', '')
-
-            if text_filter and text_filter.lower() not in text.lower():
-                continue
-
-            invalid_chars = check_ksx1001(text, ksx1001_hangul)
-            if show_invalid_only and not invalid_chars:
-                continue
-
-            filtered_rows.append((idx, row, invalid_chars))
-
-        total_filtered = len(filtered_rows)
-        st.caption(f"표시: {total_filtered}개")
-
-        # 페이지네이션
-        if total_filtered > PAGE_SIZE:
-            total_pages = (total_filtered + PAGE_SIZE - 1) // PAGE_SIZE
-            page = st.number_input("페이지", min_value=1, max_value=total_pages, value=1, key="single_page")
+            issue_rules = issue_filter_box("single_issue", issue_counts(flags, [selected_file]))
+
+        # 검증 필터는 비트셋의 행 번호, 텍스트 필터는 요청한 페이지를 채울 만큼만 검사
+        candidates = flags.rows(selected_file, issue_rules) if issue_rules else None
+        predicate = None
+        if text_filter:
+            lowered_filter = text_filter.lower()
+
+            def predicate(text: str) -> bool:
+                return lowered_filter in text.lower()
+
+        requested = st.session_state.get('single_page', 1)
+        window, total_filtered, total_pages, exact = pages.page(
+            requested - 1, (text_filter, issue_rules), predicate, candidates)
+        if exact and requested > total_pages:
+            st.session_state['single_page'] = total_pages
+        more = "" if exact else "+"
+        st.caption(f"표시: {total_filtered}{more}개")
+
+        # 페이지네이션 (필터 결과를 끝까지 검사하기 전에는 페이지 수가 늘어날 수 있음)
+        if total_filtered > PAGE_SIZE or not exact:
+            page = st.number_input("페이지", min_value=1, max_value=total_pages if exact else None,
+                                   key="single_page")
             start_idx = (page - 1) * PAGE_SIZE
-            end_idx = min(start_idx + PAGE_SIZE, total_filtered)
-            st.caption(f"페이지 {page}/{total_pages} (항목 {start_idx + 1}-{end_idx})")
-            page_rows = filtered_rows[start_idx:end_idx]
-        else:
-            page_rows = filtered_rows
+            end_idx = start_idx + len(window)
+            st.caption(f"페이지 {page}/{total_pages}{more} (항목 {start_idx + 1}-{end_idx})")
 
         # 편집 폼
         modified = False
-        edited_rows = list(rows)
+        edited_texts = {}
 
-        for idx, row, invalid_chars in page_rows:
-            strref = row.get('StrRef', '')
-            text = row.get('Text', '')
-            text_eng = row.get('TextEng', '')
-            speaker_type = row.get('SpeakerType', '')
-            speaker_name = row.get('SpeakerName', '')
-            dlg = row.get('DLG', '')
+        for idx, row in window:
+            strref = row.StrRef
+            text = row.Text
+            text_eng = row.TextEng
+            speaker_type = row.SpeakerType
+            speaker_name = row.SpeakerName
+            dlg = row.DLG
 
-            is_highlighted = (idx == highlight_idx)
+            is_highlighted = (strref == search_strref)
             container = st.container(border=True)
 
             with container:
@@ -233,8 +423,7 @@ def main():
                 with meta_cols[2]:
                     st.caption(f"Type: {speaker_type}")
                 with meta_cols[3]:
-                    if invalid_chars:
-                        st.error(f"⚠️ {', '.join(set(invalid_chars))}")
+                    show_issues(text, text_eng)
 
                 # 영어 원문
                 if text_eng:
@@ -245,6 +434,9 @@ def main():
                         height=80,
                         disabled=True
                     )
+                    show_siblings(memory, text_eng, strref)
+                    if fuzzy is not None:
+                        show_suggestions(fuzzy, text_eng, strref)
 
                 # 한글 번역
                 new_text = st.text_area(
@@ -255,15 +447,14 @@ def main():
                 )
 
                 if new_text != text:
-                    edited_rows[idx] = {**row, 'Text': new_text}
+                    edited_texts[strref] = new_text
                     modified = True
 
         if modified:
             st.divider()
             if st.button("💾 저장", type="primary", key="single_save"):
-                save_csv(selected_file, edited_rows)
+                save_records(selected_file, edited_texts)
                 st.success("저장 완료!")
-                st.cache_data.clear()
                 st.rerun()
 
     elif view_mode == "전체 검색":
@@ -274,29 +465,49 @@ def main():
         with col1:
             text_filter = st.text_input("텍스트 검색 (필수)", placeholder="검색어 입력...", key="all_filter")
         with col2:
-            show_invalid_only = st.checkbox("완성형 오류만", key="all_invalid")
-
-        if not text_filter and not show_invalid_only:
-            st.info("검색어를 입력하거나 '완성형 오류만'을 선택하세요.")
+            issue_rules = issue_filter_box("all_issue", issue_counts(flags, load_csv_files()))
+
+        opt_cols = st.columns(3)
+        with opt_cols[0]:
+            scope = st.radio("검색 대상", list(SEARCH_SCOPES), horizontal=True, key="all_scope")
+        with opt_cols[1]:
+            mode = st.radio("검색 방식", list(SEARCH_MODES), horizontal=True, key="all_mode")
+        with opt_cols[2]:
+            ranked = st.checkbox("관련도순 정렬", value=True, key="all_ranked",
+                                 help="일치 횟수가 많고 짧은 텍스트부터 (끄면 파일 순서)")
+
+        if not text_filter and not issue_rules:
+            st.info("검색어를 입력하거나 검증 필터를 선택하세요.")
             return
 
-        # 로딩
-        with st.spinner("전체 파일 검색 중..."):
-            all_rows = load_all_csv()
-
-        # 필터링
-        filtered = []
-        for filename, row in all_rows:
-            text = row.get('Text', '')
-
-            if text_filter and text_filter.lower() not in text.lower():
-                continue
-
-            invalid_chars = check_ksx1001(text, ksx1001_hangul)
-            if show_invalid_only and not invalid_chars:
-                continue
+        # 역색인으로 후보를 좁혀 검색 (처음 한 번 색인 생성, 작업공간 모드는 SQLite 색인)
+        workspace = active_workspace()
+        if text_filter and workspace is not None:
+            try:
+                candidates = workspace.search(text_filter, SEARCH_SCOPES[scope], SEARCH_MODES[mode], ranked)
+            except re.error as e:
+                st.error(f"정규식 오류: {e}")
+                return
+        elif text_filter:
+            with st.spinner("전체 파일 로드 중..."):
+                all_rows = load_all_csv()
+            with st.spinner("검색 색인 생성 중..."):
+                index = load_search_index()
+            try:
+                matches = index.search(text_filter, SEARCH_SCOPES[scope], SEARCH_MODES[mode], ranked)
+            except re.error as e:
+                st.error(f"정규식 오류: {e}")
+                return
+            candidates = [all_rows[i] for i in matches]
+        else:
+            with st.spinner("전체 파일 로드 중..."):
+                candidates = load_all_csv()
 
-            filtered.append((filename, row, invalid_chars))
+        # 검증 필터 (비트셋에서 찾은 행만 남김)
+        if issue_rules:
+            flagged = flagged_rows(flags, issue_rules)
+            candidates = [(filename, row) for filename, row in candidates if (filename, row[0]) in flagged]
+        filtered = candidates
 
         total_count = len(filtered)
         st.caption(f"검색 결과: {total_count}개")
@@ -317,12 +528,8 @@ def main():
         # 현재 페이지 표시
         page_items = filtered[start_idx:end_idx]
 
-        for filename, row, invalid_chars in page_items:
-            strref = row.get('StrRef', '')
-            text = row.get('Text', '')
-            text_eng = row.get('TextEng', '')
-            speaker_type = row.get('SpeakerType', '')
-            speaker_name = row.get('SpeakerName', '')
+        for filename, row in page_items:
+            strref, text, text_eng, speaker_type, speaker_name = row
 
             container = st.container(border=True)
             with container:
@@ -335,8 +542,7 @@ def main():
                 with meta_cols[2]:
                     st.caption(f"Speaker: {speaker_name}")
                 with meta_cols[3]:
-                    if invalid_chars:
-                        st.error(f"⚠️ {', '.join(set(invalid_chars))}")
+                    show_issues(text, text_eng)
 
                 # 영어 원문
                 if text_eng:
@@ -347,6 +553,9 @@ def main():
                         height=80,
                         disabled=True
                     )
+                    show_siblings(memory, text_eng, strref)
+                    if fuzzy is not None:
+                        show_suggestions(fuzzy, text_eng, strref)
 
                 # 한글 번역
                 new_text = st.text_area(
@@ -360,7 +569,6 @@ def main():
                     if st.button("💾 저장", key=f"save_{filename}_{strref}"):
                         save_record(filename, strref, new_text)
                         st.success(f"저장: {filename} StrRef {strref}")
-                        st.cache_data.clear()
                         st.rerun()
 
 
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+번역 편집기 헤드리스 HTTP API (JSON, 표준 라이브러리만 사용)
+
+편집기(editor.py)와 같은 데이터 계층(StrRef 인덱스, 행 캐시와 검색 역색인, 편집 저널,
+검증 플래그)을 한 프로세스에서 메모리에 올려 두고 스크립트/QA 도구가 CSV를 직접
+파싱하지 않고 읽고 쓰게 합니다. --workspace면 SQLite 작업공간(workspace.py)을 씁니다.
+
+쓰기는 그룹 커밋입니다: 동시에 들어온 갱신 요청들을 기록 스레드가 모아 저널에 한 번
+쓰고 fsync한 뒤, 캐시를 고치고 각 요청에 응답합니다. CSV 반영은 편집기와 같은
+백그라운드 압축기가 합니다.
+
+엔드포인트:
+    GET  /status
+    GET  /rows/<StrRef>
+    POST /rows/batch      {"strrefs": ["1", "2", ...]}
+    POST /rows/update     {"edits": [{"strref": "1", "text": "..."}, ...]}
+    GET  /search?q=...&fields=Text,TextEng&mode=contains|exact|regex&ranked=1&limit=100
+    GET  /validation[?file=NAME]
+
+사용법:
+    python3 editor_api.py                  # http://127.0.0.1:8765
+    python3 editor_api.py --port 9000 --workspace
+"""
+
+import argparse
+import json
+import queue
+import re
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from corpus import DIALOG_DIR, csv_files
+from edit_journal import JournalCompactor, append_edits, apply_row_edits, pending_edits
+from row_cache import RowCache
+from row_flags import RULES, row_flags
+from search_index import SEARCH_MODES, SearchIndex
+from strref_index import strref_index
+from workspace import WORKSPACE_PATH, Workspace
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# 검색 결과 기본/최대 개수
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 5000
+# 한 요청의 최대 StrRef/편집 수
+MAX_BATCH = 50000
+# 검증 플래그 캐시 저장 간격(초). 저널 편집은 압축 후 파일 단위로 다시 계산되므로 매번 저장하지 않음
+FLAGS_SAVE_INTERVAL = 30.0
+
+SEARCH_FIELDS = ('StrRef', 'Text', 'TextEng', 'SpeakerType', 'SpeakerName')
+INDEX_FIELDS = ('Text', 'TextEng')
+
+
+class EditBatcher(threading.Thread):
+    """갱신 요청들을 모아 한 번에 기록하는 스레드 (그룹 커밋)"""
+
+    def __init__(self, commit):
+        super().__init__(name='edit-batcher', daemon=True)
+        self.commit = commit
+        self._queue: queue.Queue = queue.Queue()
+
+    def submit(self, edits: list[tuple]) -> None:
+        """편집들을 기록하고 반영될 때까지 대기"""
+        done = threading.Event()
+        item = [edits, done, None]
+        self._queue.put(item)
+        done.wait()
+        if item[2] is not None:
+            raise item[2]
+
+    def run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.commit([edit for item in items for edit in item[0]])
+            except Exception as e:
+                for item in items:
+                    item[2] = e
+            for item in items:
+                item[1].set()
+
+
+class EditorData:
+    """편집기 데이터 계층 (스레드 간 공유, 잠금으로 직렬화)"""
+
+    def __init__(self, dialog_dir: Path = DIALOG_DIR, workspace: Workspace | None = None):
+        self.dialog_dir = dialog_dir
+        self.workspace = workspace
+        self.lock = threading.RLock()
+        self.strrefs = strref_index(dialog_dir)
+        self.flags = row_flags(dialog_dir)
+        self.rows = RowCache(dialog_dir, SEARCH_FIELDS)
+        self.index: SearchIndex | None = None
+        self._index_version = None
+        self._flags_saved = time.monotonic()
+        self.compactor = None
+        if workspace is None:
+            self.compactor = JournalCompactor(dialog_dir=dialog_dir, lock=self.lock)
+            self.compactor.start()
+        self.batcher = EditBatcher(self._commit)
+        self.batcher.start()
+
+    def preload(self) -> None:
+        """첫 요청이 기다리지 않도록 검색 역색인을 미리 생성"""
+        if self.workspace is None:
+            with self.lock:
+                self._search_index()
+
+    # 읽기
+
+    def get_many(self, strrefs: list[str]) -> dict[str, dict | None]:
+        """StrRef → 행 (헤더 필드 + file, row), 없으면 None"""
+        results = {}
+        with self.lock:
+            edits = pending_edits() if self.workspace is None else {}
+            for strref in strrefs:
+                if self.workspace is not None:
+                    found = self.workspace.get(strref)
+                else:
+                    found = self.strrefs.read(strref, named=True)
+                if found is None:
+                    results[strref] = None
+                    continue
+                name, index, row = found
+                changes = edits.get(name, {}).get(strref)
+                if changes:
+                    row = apply_row_edits(row, row._fields, changes)
+                results[strref] = {'file': name, 'row': index, **row._asdict()}
+        return results
+
+    def _search_index(self) -> tuple[SearchIndex, list[tuple[str, tuple]]]:
+        """검색 역색인 (행 배치가 바뀌었을 때만 다시 만듦)"""
+        all_rows = self.rows.all_rows()
+        if self.index is None or self._index_version != self.rows.layout_version:
+            positions = [SEARCH_FIELDS.index(field) for field in INDEX_FIELDS]
+            index = SearchIndex.build(INDEX_FIELDS, ([row[pos] for pos in positions] for _, row in all_rows))
+            self.rows.on_change = lambda row_id, row: index.update(row_id, [row[pos] for pos in positions])
+            self.index = index
+            self._index_version = self.rows.layout_version
+        return self.index, all_rows
+
+    def search(self, query: str, fields: tuple[str, ...], mode: str, ranked: bool,
+               limit: int) -> tuple[int, list[dict]]:
+        """(전체 결과 수, 앞쪽 limit개 결과)
+
+        Raises:
+            ValueError: 알 수 없는 필드/모드
+            re.error: 잘못된 정규식
+        """
+        if not fields or any(field not in INDEX_FIELDS for field in fields):
+            raise ValueError(f"fields는 {', '.join(INDEX_FIELDS)} 중에서 선택: {','.join(fields)}")
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"알 수 없는 검색 모드: {mode}")
+        with self.lock:
+            if self.workspace is not None:
+                matches = self.workspace.search(query, fields, mode, ranked)
+            else:
+                index, all_rows = self._search_index()
+                matches = [all_rows[i] for i in index.search(query, fields, mode, ranked)]
+        results = [{'file': name, **dict(zip(SEARCH_FIELDS, row))} for name, row in matches[:limit]]
+        return len(matches), results
+
+    def validation(self, name: str | None = None) -> dict:
+        """검증 규칙별 문제 행 수 (파일을 주면 규칙별 StrRef 목록까지)"""
+        with self.lock:
+            if name is not None:
+                if not (self.dialog_dir / name).is_file():
+                    raise KeyError(name)
+                entries = self.strrefs.entries(name)
+                return {
+                    'file': name,
+                    'counts': self.flags.counts(name),
+                    'strrefs': {rule: [entries[row][0] for row in self.flags.rows(name, (rule,))]
+                                for rule in RULES},
+                }
+            totals = dict.fromkeys(RULES, 0)
+            files = {}
+            for path in csv_files(self.dialog_dir):
+                counts = self.flags.counts(path.name)
+                for rule, count in counts.items():
+                    totals[rule] += count
+                if any(counts.values()):
+                    files[path.name] = counts
+            return {'rules': RULES, 'totals': totals, 'files': files}
+
+    def status(self) -> dict:
+        with self.lock:
+            return {
+                'backend': 'workspace' if self.workspace is not None else 'csv',
+                'files': len(self.strrefs.files),
+                'rows': sum(len(entry['rows']) for entry in self.strrefs.files.values()),
+                'pending_edits': sum(len(rows) for rows in pending_edits().values()),
+            }
+
+    # 쓰기
+
+    def update(self, edits: list[tuple[str, str]]) -> tuple[int, list[str]]:
+        """(StrRef, 번역문) 편집 → (기록한 수, 찾지 못한 StrRef 목록)"""
+        located = []
+        missing = []
+        with self.lock:
+            fresh = set()
+            for strref, text in edits:
+                location = self.strrefs.lookup(strref)
+                if location is not None and location[0] not in fresh:
+                    # 압축으로 파일이 바뀌었으면 오프셋을 다시 훑은 뒤 조회
+                    fresh.add(location[0])
+                    self.strrefs.entries(location[0])
+                    location = self.strrefs.lookup(strref)
+                if location is None:
+                    missing.append(strref)
+                else:
+                    located.append((location[0], strref, text))
+        if located:
+            self.batcher.submit(located)
+        return len(located), missing
+
+    def _commit(self, edits: list[tuple[str, str, str]]) -> None:
+        """모은 편집을 한 번에 기록하고 캐시 갱신 (기록 스레드)"""
+        by_file: dict[str, dict[str, str]] = {}
+        for name, strref, text in edits:
+            by_file.setdefault(name, {})[strref] = text
+        with self.lock:
+            if self.workspace is not None:
+                # CSV 기준인 행 캐시와 검증 플래그는 건드리지 않음 (내보낸 뒤 시그니처로 다시 계산)
+                for name, texts in by_file.items():
+                    self.workspace.update_texts(name, texts)
+                return
+            count = append_edits(edits)
+            self.compactor.notify(count)
+            for name, texts in by_file.items():
+                self.rows.patch_many(name, {strref: {'Text': text} for strref, text in texts.items()})
+                # 요청 이후 압축으로 파일이 바뀌었을 수 있으므로 행 위치는 여기서 다시 조회
+                offsets = self.strrefs.entries(name)
+                self.flags.entry(name)
+                self.flags.update_texts(name, texts, offsets)
+            if time.monotonic() - self._flags_saved > FLAGS_SAVE_INTERVAL:
+                self.save()
+
+    def save(self) -> None:
+        """검증 플래그 캐시 저장"""
+        with self.lock:
+            self.flags.save()
+            self._flags_saved = time.monotonic()
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = 'NWNKoreanEditorAPI/1'
+    data: EditorData
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, {'error': message})
+
+    def _body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            raise ValueError(f"JSON 본문 오류: {e}") from None
+        if not isinstance(body, dict):
+            raise ValueError("JSON 본문은 객체여야 합니다")
+        return body
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if url.path == '/status':
+                self._send(HTTPStatus.OK, self.data.status())
+            elif url.path.startswith('/rows/'):
+                strref = unquote(url.path[len('/rows/'):])
+                row = self.data.get_many([strref])[strref]
+                if row is None:
+                    self._error(HTTPStatus.NOT_FOUND, f"StrRef 없음: {strref}")
+                else:
+                    self._send(HTTPStatus.OK, row)
+            elif url.path == '/search':
+                if not query.get('q'):
+                    raise ValueError("q (검색어)가 필요합니다")
+                limit = min(int(query.get('limit', DEFAULT_LIMIT)), MAX_LIMIT)
+                total, results = self.data.search(
+                    query['q'], tuple(query.get('fields', 'Text').split(',')),
+                    query.get('mode', 'contains'), query.get('ranked', '1') != '0', limit)
+                self._send(HTTPStatus.OK, {'total': total, 'results': results})
+            elif url.path == '/validation':
+                self._send(HTTPStatus.OK, self.data.validation(query.get('file')))
+            else:
+                self._error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {url.path}")
+        except KeyError as e:
+            self._error(HTTPStatus.NOT_FOUND, f"파일 없음: {e.args[0]}")
+        except (ValueError, re.error) as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        try:
+            body = self._body()
+            if url.path == '/rows/batch':
+                strrefs = body.get('strrefs')
+                if not isinstance(strrefs, list) or len(strrefs) > MAX_BATCH:
+                    raise ValueError(f"strrefs는 최대 {MAX_BATCH}개의 목록이어야 합니다")
+                self._send(HTTPStatus.OK, {'rows': self.data.get_many([str(s) for s in strrefs])})
+            elif url.path == '/rows/update':
+                edits = body.get('edits')
+                if not isinstance(edits, list) or len(edits) > MAX_BATCH:
+                    raise ValueError(f"edits는 최대 {MAX_BATCH}개의 목록이어야 합니다")
+                pairs = []
+                for edit in edits:
+                    if not isinstance(edit, dict) or not isinstance(edit.get('text'), str) or 'strref' not in edit:
+                        raise ValueError('편집은 {"strref": ..., "text": "..."} 형식이어야 합니다')
+                    pairs.append((str(edit['strref']), edit['text']))
+                updated, missing = self.data.update(pairs)
+                self._send(HTTPStatus.OK, {'updated': updated, 'missing': missing})
+            else:
+                self._error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {url.path}")
+        except ValueError as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='번역 편집기 헤드리스 HTTP API')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'바인드 주소 (기본: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'포트 (기본: {DEFAULT_PORT})')
+    parser.add_argument('--workspace', action='store_true',
+                        help='SQLite 작업공간(workspace.sqlite3)에서 읽고 쓰기')
+    args = parser.parse_args()
+
+    workspace = None
+    if args.workspace:
+        if not WORKSPACE_PATH.exists():
+            print("오류: 작업공간이 없습니다. 먼저 'python3 workspace.py import'를 실행하세요.")
+            sys.exit(1)
+        workspace = Workspace()
+        workspace.import_csv(DIALOG_DIR)
+
+    print("데이터 로드 중...")
+    Handler.data = EditorData(DIALOG_DIR, workspace)
+    Handler.data.preload()
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"API 서버: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Handler.data.save()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+유사 원문 번역 메모리 (퍼지 검색)
+
+번역된 행의 영어 원문(TextEng)을 소문자 단어로 나눠 역색인을 만들고, 편집 중인 행의
+원문과 드문 단어를 많이 공유하는 후보를 IDF 점수로 고른 뒤 문자 3-gram 유사도로
+다시 정렬해 비슷한 원문과 그 한국어 번역을 돌려줍니다. 아주 흔한 단어(the, you 등)는
+후보 수집에 쓰지 않으므로 검색이 코퍼스 크기에 비례하지 않습니다.
+
+번역된 행 목록은 파일 시그니처와 함께 .cache/에 저장해 두고(오프라인 빌드), 다음에는
+바뀐 파일만 다시 읽습니다. 편집기 저장은 update()로 그 행만 교체합니다. 교체된 이전
+행은 무효 표시만 하고, 무효 행이 많아지면 색인을 다시 만듭니다.
+
+사용법:
+    python3 fuzzy_memory.py                       # 캐시 생성/갱신
+    python3 fuzzy_memory.py "Where is the ring?"  # 유사 원문 검색
+"""
+
+import argparse
+import math
+import re
+from pathlib import Path
+
+from corpus import DIALOG_DIR, csv_files, file_signature, read_cache, write_cache
+from csv_rows import open_rows, read_rows_at
+from edit_journal import pending_edits
+from translation_memory import is_translated, normalize_source
+
+CACHE_NAME = 'fuzzy_memory.json'
+CACHE_VERSION = 1
+
+WORD = re.compile(r"[a-z0-9']+")
+# 이 비율보다 많은 원문에 나오는 단어는 후보 수집에서 제외
+COMMON_WORD_RATIO = 0.02
+# 후보 수집에 쓰는 검색어 단어 수 (드문 순)
+QUERY_WORDS = 8
+# 3-gram 유사도로 다시 정렬할 후보 수
+RERANK_CANDIDATES = 60
+MIN_SIMILARITY = 0.4
+# 무효 행이 이 비율을 넘으면 색인을 다시 만듦
+REBUILD_RATIO = 0.25
+
+
+def trigrams(text: str) -> set[str]:
+    """정규화/소문자 원문의 문자 3-gram"""
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    """3-gram 집합의 Dice 계수"""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class FuzzyMemory:
+    """파일명 → {'signature', 'rows': [[StrRef, TextEng, Text], ...]} (번역된 행만)"""
+
+    def __init__(self, files: dict[str, dict] | None = None, dialog_dir: Path = DIALOG_DIR):
+        self.files = files if files is not None else {}
+        self.dialog_dir = dialog_dir
+        self._index_ready = False
+
+    @classmethod
+    def load(cls, dialog_dir: Path = DIALOG_DIR) -> 'FuzzyMemory':
+        """캐시에서 로드 (없거나 다른 디렉토리면 빈 메모리)"""
+        data = read_cache(CACHE_NAME)
+        root = str(dialog_dir.resolve())
+        if not data or data.get('version') != CACHE_VERSION or data.get('root') != root:
+            return cls(dialog_dir=dialog_dir)
+        return cls(data['files'], dialog_dir)
+
+    def save(self) -> None:
+        write_cache(CACHE_NAME, {
+            'version': CACHE_VERSION,
+            'root': str(self.dialog_dir.resolve()),
+            'files': self.files,
+        })
+
+    def refresh(self, paths: list[Path] | None = None) -> int:
+        """시그니처가 바뀐 파일만 다시 읽고 없어진 파일은 제거 → 다시 읽은 파일 수"""
+        if paths is None:
+            paths = csv_files(self.dialog_dir)
+        names = {path.name for path in paths}
+        removed = [name for name in self.files if name not in names]
+        for name in removed:
+            del self.files[name]
+
+        edits = None
+        changed = 0
+        for path in paths:
+            entry = self.files.get(path.name)
+            if entry is None or entry['signature'] != file_signature(path):
+                if edits is None:
+                    edits = pending_edits()
+                self.files[path.name] = {
+                    'signature': file_signature(path),
+                    'rows': self._read_file(path, edits.get(path.name)),
+                }
+                changed += 1
+        if changed or removed:
+            self._index_ready = False
+        return changed
+
+    @staticmethod
+    def _read_file(path: Path, edits: dict[str, dict[str, str]] | None) -> list[list[str]]:
+        rows = []
+        with open_rows(path, ('StrRef', 'TextEng', 'Text')) as reader:
+            for strref, text_eng, text in reader:
+                if edits and strref in edits:
+                    text = edits[strref].get('Text', text)
+                if text_eng.strip() and is_translated(text, text_eng):
+                    rows.append([strref, text_eng, text])
+        return rows
+
+    # 색인
+
+    def _build_index(self) -> None:
+        """메모리 행 전체로 단어 역색인 생성 (행 번호 = self.entries 위치)"""
+        self.entries: list[tuple[str, str, str, str] | None] = []
+        self.lowered: list[str] = []
+        self.postings: dict[str, list[int]] = {}
+        self.positions: dict[str, int] = {}
+        self.dead = 0
+        for name in sorted(self.files):
+            for strref, text_eng, text in self.files[name]['rows']:
+                self._add(name, strref, text_eng, text)
+        self._index_ready = True
+
+    def _add(self, name: str, strref: str, text_eng: str, text: str) -> None:
+        row = len(self.entries)
+        lowered = normalize_source(text_eng).lower()
+        self.entries.append((name, strref, text_eng, text))
+        self.lowered.append(lowered)
+        self.positions[strref] = row
+        for word in set(WORD.findall(lowered)):
+            self.postings.setdefault(word, []).append(row)
+
+    def ensure_index(self) -> None:
+        """색인이 없거나 파일이 다시 읽혔으면 생성"""
+        if not self._index_ready:
+            self._build_index()
+
+    def update(self, name: str, strref: str, text_eng: str, text: str) -> None:
+        """저장한 행 교체 (캐시 파일은 CSV가 바뀐 뒤 refresh에서 갱신)"""
+        self.ensure_index()
+        old = self.positions.pop(strref, None)
+        if old is not None:
+            self.entries[old] = None
+            self.dead += 1
+        if text_eng.strip() and is_translated(text, text_eng):
+            self._add(name, strref, text_eng, text)
+        if self.dead > len(self.entries) * REBUILD_RATIO:
+            self._sync_files()
+            self._build_index()
+
+    def update_texts(self, name: str, texts: dict[str, str], offsets: list[list]) -> None:
+        """저장한 번역문 반영 (offsets: StrRef 인덱스의 [[StrRef, 오프셋], ...]에서 원문을 읽음)"""
+        positions = {strref: row for row, (strref, _) in enumerate(offsets)}
+        strrefs = [strref for strref in texts if strref in positions]
+        engs = read_rows_at(self.dialog_dir / name, [offsets[positions[strref]][1] for strref in strrefs],
+                            ('TextEng',))
+        for strref, eng in zip(strrefs, engs):
+            if eng is not None:
+                self.update(name, strref, eng[0], texts[strref])
+
+    def _sync_files(self) -> None:
+        """색인의 살아 있는 행으로 파일별 행 목록 재구성 (시그니처 유지)"""
+        rows: dict[str, list[list[str]]] = {name: [] for name in self.files}
+        for entry in self.entries:
+            if entry is not None and entry[0] in rows:
+                name, strref, text_eng, text = entry
+                rows[name].append([strref, text_eng, text])
+        for name, file_rows in rows.items():
+            self.files[name]['rows'] = file_rows
+
+    # 검색
+
+    def suggest(self, text_eng: str, k: int = 5, exclude: str | None = None) -> list[dict]:
+        """비슷한 원문의 번역 상위 k개
+
+        같은 원문과 번역 조합은 하나로 묶고 개수를 셉니다.
+
+        Returns:
+            {'score', 'source', 'text', 'strref', 'file', 'count'} 목록 (유사도 순)
+        """
+        self.ensure_index()
+        lowered = normalize_source(text_eng).lower()
+        words = set(WORD.findall(lowered))
+        if not words:
+            return []
+
+        total = len(self.entries) or 1
+        common = max(1, int(total * COMMON_WORD_RATIO))
+        postings = [(word, self.postings[word]) for word in words if word in self.postings]
+        postings.sort(key=lambda item: len(item[1]))
+        rare = [item for item in postings if len(item[1]) <= common][:QUERY_WORDS]
+        if not rare:
+            # 흔한 단어뿐인 짧은 문장은 가장 드문 단어 하나만 사용
+            rare = postings[:1]
+
+        scores: dict[int, float] = {}
+        for _, rows in rare:
+            weight = math.log(total / len(rows))
+            for row in rows:
+                scores[row] = scores.get(row, 0.0) + weight
+
+        query_grams = trigrams(lowered)
+        best = sorted(scores, key=scores.get, reverse=True)[:RERANK_CANDIDATES * 2]
+        ranked = []
+        for row in best:
+            entry = self.entries[row]
+            if entry is None or entry[1] == exclude:
+                continue
+            score = similarity(query_grams, trigrams(self.lowered[row]))
+            if score >= MIN_SIMILARITY:
+                ranked.append((score, row))
+            if len(ranked) >= RERANK_CANDIDATES:
+                break
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+
+        results: dict[tuple[str, str], dict] = {}
+        for score, row in ranked:
+            name, strref, source, text = self.entries[row]
+            key = (self.lowered[row], text)
+            if key in results:
+                results[key]['count'] += 1
+                continue
+            if len(results) >= k:
+                continue
+            results[key] = {'score': round(score, 3), 'source': source, 'text': text,
+                            'strref': strref, 'file': name, 'count': 1}
+        return list(results.values())
+
+
+def fuzzy_memory(dialog_dir: Path = DIALOG_DIR) -> FuzzyMemory:
+    """캐시된 메모리를 로드해 바뀐 파일만 다시 읽음 (다시 읽었으면 저장)"""
+    memory = FuzzyMemory.load(dialog_dir)
+    if memory.refresh():
+        memory.save()
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description='유사 원문 번역 메모리 생성/검색')
+    parser.add_argument('query', nargs='?', help='검색할 영어 원문 (없으면 캐시 생성/갱신만)')
+    parser.add_argument('-k', type=int, default=5, help='제안 수 (기본: 5)')
+    args = parser.parse_args()
+
+    memory = fuzzy_memory()
+    rows = sum(len(entry['rows']) for entry in memory.files.values())
+    print(f"번역 메모리: 번역된 행 {rows}개 ({len(memory.files)}개 파일)")
+    if not args.query:
+        return
+
+    for suggestion in memory.suggest(args.query, args.k):
+        more = f" 외 {suggestion['count'] - 1}개" if suggestion['count'] > 1 else ""
+        print(f"\n[{suggestion['score']:.2f}] {suggestion['source']}")
+        print(f"  → {suggestion['text']}")
+        print(f"  ({suggestion['file']} / StrRef {suggestion['strref']}{more})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+KS X 1001 완성형 한글 테이블 (검사기, 편집기, TLK 인코더 공용)
+
+U+AC00~U+D7A3 한글 음절 11,172자에 대한 완성형 포함 비트맵과 2,350자 목록을
+ksx1001_table.py에 미리 계산해 두므로 import 시 계산이 없습니다.
+
+글리프 슬롯은 훅(mac/hook/nwn_korean_hook.c)과 같은 규칙을 따릅니다:
+    슬롯 = 256 + (lead - 0xB0) * 94 + (trail - 0xA1)
+완성형 한글은 CP949 코드 순서가 유니코드 순서와 같으므로 슬롯 = 256 + 순위입니다.
+
+테이블 재생성:
+    python3 ksx1001.py --generate
+"""
+
+import re
+import sys
+from bisect import bisect_left
+from pathlib import Path
+
+from ksx1001_table import KSX1001_BITMAP, KSX1001_HANGUL
+
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+HANGUL_SYLLABLE_COUNT = HANGUL_LAST - HANGUL_FIRST + 1  # 11172
+
+GLYPH_BASE_INDEX = 256
+LEAD_FIRST = 0xB0
+TRAIL_FIRST = 0xA1
+TRAIL_COUNT = 94
+
+KSX1001_SET = frozenset(KSX1001_HANGUL)
+
+
+def _non_ksx1001_class() -> str:
+    """완성형 목록의 틈을 범위로 묶은 문자 클래스 (완성형이 아닌 한글 음절 8,822자)"""
+    ranges = []
+    start = HANGUL_FIRST
+    for code in map(ord, KSX1001_HANGUL):
+        if code > start:
+            ranges.append(f'{chr(start)}-{chr(code - 1)}')
+        start = code + 1
+    if start <= HANGUL_LAST:
+        ranges.append(f'{chr(start)}-{chr(HANGUL_LAST)}')
+    return '[' + ''.join(ranges) + ']'
+
+
+# 완성형이 아닌 한글 음절 한 글자 (finditer로 한 번에 위치까지 찾음)
+NON_KSX1001_PATTERN = re.compile(_non_ksx1001_class())
+
+# TLK 인코더의 한글 포함 판정 범위 (기존 동작과 동일하게 U+D7AF까지)
+_HANGUL_TEXT = re.compile('[\uac00-\ud7af]')
+
+
+def is_ksx1001(char: str) -> bool:
+    """한글 음절이 완성형에 포함되는지 (비트맵 조회)"""
+    offset = ord(char) - HANGUL_FIRST
+    if offset < 0 or offset >= HANGUL_SYLLABLE_COUNT:
+        return False
+    return bool(KSX1001_BITMAP[offset >> 3] & (1 << (offset & 7)))
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return '\uAC00' <= char <= '\uD7A3'
+
+
+def contains_hangul(text: str) -> bool:
+    """한글(U+AC00~U+D7AF)이 하나라도 있는지"""
+    return _HANGUL_TEXT.search(text) is not None
+
+
+def invalid_hangul(text: str) -> list[str]:
+    """완성형 범위를 벗어나는 한글 음절 (등장 순서, 중복 포함)"""
+    return NON_KSX1001_PATTERN.findall(text)
+
+
+def glyph_rank(char: str) -> int:
+    """완성형 한글의 순위 (0~2349), 완성형이 아니면 -1"""
+    rank = bisect_left(KSX1001_HANGUL, char)
+    if rank < len(KSX1001_HANGUL) and KSX1001_HANGUL[rank] == char:
+        return rank
+    return -1
+
+
+def glyph_slot(char: str) -> int:
+    """훅에서 쓰는 글리프 인덱스 (256 + 순위), 완성형이 아니면 -1"""
+    rank = glyph_rank(char)
+    return GLYPH_BASE_INDEX + rank if rank >= 0 else -1
+
+
+def cp949_bytes(rank: int) -> tuple[int, int]:
+    """순위 → CP949 (lead, trail)"""
+    return LEAD_FIRST + rank // TRAIL_COUNT, TRAIL_FIRST + rank % TRAIL_COUNT
+
+
+def _decode_ksx1001_hangul() -> list[str]:
+    """EUC-KR 한글 영역(0xB0A1~0xC8FE)을 디코딩해 완성형 2,350자 계산 (재생성용)"""
+    chars = []
+    for lead in range(0xB0, 0xC9):
+        for trail in range(0xA1, 0xFF):
+            try:
+                char = bytes([lead, trail]).decode('euc-kr')
+            except UnicodeDecodeError:
+                continue
+            if is_hangul_syllable(char):
+                chars.append(char)
+    return chars
+
+
+def generate_table(output: Path) -> None:
+    """ksx1001_table.py 생성"""
+    chars = _decode_ksx1001_hangul()
+    bitmap = bytearray((HANGUL_SYLLABLE_COUNT + 7) // 8)
+    for char in chars:
+        offset = ord(char) - HANGUL_FIRST
+        bitmap[offset >> 3] |= 1 << (offset & 7)
+
+    lines = [
+        '"""',
+        'KS X 1001 완성형 한글 테이블',
+        '자동 생성됨 - 수정하지 마세요 (python3 ksx1001.py --generate)',
+        '"""',
+        '',
+        '# U+AC00부터 11172비트: 완성형이면 1 (LSB 우선)',
+        'KSX1001_BITMAP = bytes.fromhex(',
+    ]
+    hex_text = bitmap.hex()
+    for i in range(0, len(hex_text), 96):
+        lines.append(f"    '{hex_text[i:i + 96]}'")
+    lines.append(')')
+    lines.append('')
+    lines.append(f'# 완성형 한글 {len(chars)}자 (CP949 코드 순서 = 유니코드 순서 = 글리프 슬롯 순서)')
+    lines.append('KSX1001_HANGUL = (')
+    for i in range(0, len(chars), 47):
+        lines.append(f"    '{''.join(chars[i:i + 47])}'")
+    lines.append(')')
+
+    with open(output, 'w', encoding='utf-8', newline='\r\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    print(f"생성 완료: {output} ({len(chars)}자)")
+
+
+if __name__ == '__main__':
+    if '--generate' in sys.argv:
+        generate_table(Path(__file__).parent / 'ksx1001_table.py')
+    else:
+        print(f"KS X 1001 완성형 한글: {len(KSX1001_HANGUL)}자")
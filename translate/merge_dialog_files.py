@@ -8,34 +8,35 @@ import csv
 import re
 import sys
 from pathlib import Path
-from collections import OrderedDict
 
 # csv_to_tlk 모듈 import (상위 디렉토리에 있음)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from csv_to_tlk import CSVToTLKConverter
+from cp949_preflight import find_encoding_failures
+from csv_rows import open_rows
+from edit_journal import pending_edits
+from profiling import PhaseProfiler
+from record_store import RecordStore
+from row_flags import is_empty_translation
+from token_parity import check_token_parity
 
 
-def validate_records(all_records):
+def validate_records(all_records: RecordStore):
     """병합된 레코드의 데이터 품질 검증"""
     print("\n=== 데이터 품질 검증 ===")
 
     issues = []
     korean_pattern = re.compile(r'[\uac00-\ud7af]')
 
-    for strref, record in all_records.items():
-        text = record.get('Text', '')
-        text_eng = record.get('TextEng', '')
-
-        # 1. Text가 비어있지만 TextEng가 있는 경우
-        if not text and text_eng and text_eng.strip():
-            # 숫자만 있는 코드는 제외 (예: 100767, 453_452)
-            text_eng_stripped = text_eng.strip()
-            if not text_eng_stripped.isdigit() and not re.match(r'^\d+_\d+$', text_eng_stripped):
-                issues.append({
-                    'strref': strref,
-                    'type': 'empty_text',
-                    'message': f"Text 비어있음, TextEng: {text_eng[:50]}..."
-                })
+    columns = zip(all_records.column('StrRef'), all_records.column('Text'), all_records.column('TextEng'))
+    for strref, text, text_eng in columns:
+        # 1. Text가 비어있지만 TextEng가 있는 경우 (숫자만 있는 코드는 제외)
+        if is_empty_translation(text, text_eng):
+            issues.append({
+                'strref': strref,
+                'type': 'empty_text',
+                'message': f"Text 비어있음, TextEng: {text_eng[:50]}..."
+            })
 
         # 2. TextEng에 한글이 포함된 경우 (데이터 손상)
         #    단, Text에 번역이 있으면 실제 문제는 아닐 수 있음 (경고만)
@@ -65,11 +66,41 @@ def validate_records(all_records):
                     'message': f"미번역: {text[:50]}..."
                 })
 
+    # 4. 엔진 토큰(<FirstName>, <CUSTOMxxx> 등) 불일치
+    token_mismatches = check_token_parity(
+        all_records.column('StrRef'), all_records.column('Text'), all_records.column('TextEng'),
+        all_records.column('DLG'), all_records.sources
+    )
+    for mismatch in token_mismatches:
+        details = []
+        if mismatch['missing']:
+            details.append(f"누락 {' '.join(mismatch['missing'])}")
+        if mismatch['extra']:
+            details.append(f"추가 {' '.join(mismatch['extra'])}")
+        issues.append({
+            'strref': mismatch['strref'],
+            'type': 'token_mismatch',
+            'message': f"[{mismatch['file']} / {mismatch['dlg']}] {', '.join(details)}"
+        })
+
+    # 5. TLK 인코딩(CP949/CP1252) 불가 문자 - 빌드 시 문자열 전체가 UTF-8로 대체됨
+    for failure in find_encoding_failures(all_records.column('StrRef'), all_records.column('Text'),
+                                          all_records.sources):
+        suggestion = f"'{failure['suggestion']}'" if failure['suggestion'] else '삭제'
+        issues.append({
+            'strref': failure['strref'],
+            'type': 'encoding_failure',
+            'message': (f"[{failure['file']}] '{failure['char']}' (U+{ord(failure['char']):04X}, "
+                        f"{failure['encoding']}) 위치 {failure['offset']} → 제안: {suggestion}")
+        })
+
     # 결과 출력
     empty_text = [i for i in issues if i['type'] == 'empty_text']
     korean_in_eng = [i for i in issues if i['type'] == 'korean_in_texteng']
     korean_in_eng_warn = [i for i in issues if i['type'] == 'korean_in_texteng_warning']
     untranslated = [i for i in issues if i['type'] == 'untranslated']
+    token_mismatch = [i for i in issues if i['type'] == 'token_mismatch']
+    encoding_failure = [i for i in issues if i['type'] == 'encoding_failure']
 
     if empty_text:
         print(f"\n[오류] Text가 비어있는 항목: {len(empty_text)}개")
@@ -89,6 +120,20 @@ def validate_records(all_records):
     if untranslated:
         print(f"\n[정보] 미번역 항목 (Text == TextEng): {len(untranslated)}개")
 
+    if token_mismatch:
+        print(f"\n[경고] 엔진 토큰 불일치 (Text vs TextEng): {len(token_mismatch)}개")
+        for issue in token_mismatch[:10]:
+            print(f"  StrRef {issue['strref']}: {issue['message']}")
+        if len(token_mismatch) > 10:
+            print(f"  ... 외 {len(token_mismatch) - 10}개")
+
+    if encoding_failure:
+        print(f"\n[경고] TLK 인코딩 불가 문자 (UTF-8로 대체됨): {len(encoding_failure)}개")
+        for issue in encoding_failure[:10]:
+            print(f"  StrRef {issue['strref']}: {issue['message']}")
+        if len(encoding_failure) > 10:
+            print(f"  ... 외 {len(encoding_failure) - 10}개")
+
     critical_issues = len(empty_text) + len(korean_in_eng)
     if critical_issues == 0:
         print("\n✓ 심각한 데이터 문제 없음")
@@ -98,8 +143,9 @@ def validate_records(all_records):
     return issues
 
 
-def merge_dialog_files():
+def merge_dialog_files(profiler: PhaseProfiler | None = None):
     """분할된 대화 파일들을 병합"""
+    profiler = profiler or PhaseProfiler()
 
     # 입력 디렉토리들
     dialog_translated_dir = Path("dialog_translated")
@@ -108,8 +154,8 @@ def merge_dialog_files():
     # 출력 파일
     output_file = Path("dialog.csv")
 
-    # 모든 레코드를 StrRef 기준으로 정렬하기 위한 딕셔너리
-    all_records = {}
+    # 모든 레코드를 StrRef 기준으로 모아두는 컬럼 저장소
+    all_records = RecordStore()
     all_fieldnames = set()
 
     print("=== 분할된 파일들 병합 시작 ===")
@@ -117,36 +163,39 @@ def merge_dialog_files():
     # 1. dialog_translated 디렉토리의 모든 CSV 파일 처리
     if dialog_translated_dir.exists():
         print(f"\ndialog_translated 디렉토리 처리 중...")
-        dialog_files = list(dialog_translated_dir.glob("*.csv"))
+        with profiler.phase('discovery'):
+            dialog_files = list(dialog_translated_dir.glob("*.csv"))
         print(f"발견된 파일: {len(dialog_files)}개")
+        profiler.note('files', len(dialog_files))
 
-        for csv_file in dialog_files:
-            try:
-                with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
+        # 편집기가 저장했지만 아직 CSV에 반영되지 않은 편집 (압축기와 겹쳐도 빠지지 않도록 CSV보다 먼저 읽음)
+        journal_edits = pending_edits()
 
-                    # 모든 필드명 수집 (BOM 문자 제거)
-                    if reader.fieldnames:
-                        # BOM 문자를 제거하고 필드명 정규화
-                        normalized_fieldnames = [field.lstrip('\ufeff') for field in reader.fieldnames]
-                        all_fieldnames.update(normalized_fieldnames)
+        with profiler.phase('csv_parse'):
+            for csv_file in dialog_files:
+                try:
+                    with open_rows(csv_file) as reader:
+                        # 모든 필드명 수집 (BOM 문자는 로더에서 제거됨)
+                        all_fieldnames.update(reader.fieldnames)
 
-                    record_count = 0
-                    for row in reader:
-                        strref = row.get('StrRef', '')
-                        if strref:
-                            # BOM이 포함된 키를 정규화
-                            normalized_row = {k.lstrip('\ufeff'): v for k, v in row.items()}
-                            all_records[strref] = normalized_row
-                            record_count += 1
+                        record_count = all_records.extend(reader.fieldnames, reader, csv_file.name)
 
-                    print(f"  {csv_file.name}: {record_count}개 레코드")
+                        print(f"  {csv_file.name}: {record_count}개 레코드")
 
-            except Exception as e:
-                print(f"  오류 - {csv_file.name}: {e}")
+                except Exception as e:
+                    print(f"  오류 - {csv_file.name}: {e}")
+
+        if journal_edits:
+            applied = sum(all_records.set_value(strref, field, value)
+                          for rows in journal_edits.values()
+                          for strref, changes in rows.items()
+                          for field, value in changes.items())
+            print(f"\n편집 저널: 미반영 편집 {applied}건 적용")
 
     # 3. 데이터 품질 검증
-    validate_records(all_records)
+    with profiler.phase('validation'):
+        validate_records(all_records)
+    profiler.note('records', len(all_records))
 
     # 4. StrRef 기준으로 정렬하여 출력
     print(f"\n병합된 총 레코드: {len(all_records)}개")
@@ -159,35 +208,37 @@ def merge_dialog_files():
         # 필드명 정렬 (StrRef가 먼저 오도록)
         fieldnames = ['StrRef'] + sorted([f for f in all_fieldnames if f != 'StrRef'])
 
-        # StrRef를 숫자로 정렬
-        sorted_strrefs = sorted(all_records.keys(), key=lambda x: int(x) if x.isdigit() else float('inf'))
-
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
+        # StrRef 숫자 순 정렬 (저장소에 캐시되어 TLK 단계에서도 재사용)
+        with profiler.phase('sort'):
+            all_records.sorted_order()
 
-            for strref in sorted_strrefs:
-                # 모든 필드에 대해 기본값 설정
-                row_data = {field: all_records[strref].get(field, '') for field in fieldnames}
-                writer.writerow(row_data)
+        # StrRef 숫자 순으로 컬럼에서 바로 행 튜플 생성 (없는 필드는 빈 값)
+        with profiler.phase('csv_write'), open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(all_records.iter_sorted(fieldnames))
 
         print(f"\n병합 완료: {output_file}")
         print(f"총 {len(all_records)}개 레코드가 StrRef 순으로 정렬되어 저장됨")
         print(f"총 필드 수: {len(fieldnames)}개")
 
-        return output_file
+        return output_file, all_records
     else:
         print("병합할 데이터가 없습니다.")
         return None
 
 
-def create_tlk_from_csv(csv_path: Path, tlk_path: Path, debug_mode: bool = False):
+def create_tlk_from_csv(csv_path: Path, tlk_path: Path, debug_mode: bool = False,
+                        records: RecordStore | None = None,
+                        profiler: PhaseProfiler | None = None):
     """CSV 파일에서 TLK 파일 생성 (csv_to_tlk 모듈 사용)
 
     Args:
         csv_path: 입력 CSV 파일 경로
         tlk_path: 출력 TLK 파일 경로
         debug_mode: True면 텍스트 앞에 [StrRef] 추가 (검수용)
+        records: 병합 단계의 레코드 저장소 (주어지면 CSV를 다시 읽지 않음)
+        profiler: 단계별 프로파일러 (reference_load/encode/tlk_write 측정)
     """
     print(f"\n=== TLK 파일 생성 시작 ===")
 
@@ -199,9 +250,14 @@ def create_tlk_from_csv(csv_path: Path, tlk_path: Path, debug_mode: bool = False
         encoding='auto',
         reference_tlk=reference_tlk if reference_tlk.exists() else None,
         language_id=0,  # 원본과 동일하게
-        debug_mode=debug_mode
+        debug_mode=debug_mode,
+        profiler=profiler
     )
-    converter.load_csv()
+    with converter._phase('tlk_load'):
+        if records is not None:
+            converter.load_records(records)
+        else:
+            converter.load_csv()
     converter.write_tlk(tlk_path)
 
     if debug_mode:
@@ -214,11 +270,27 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='분할된 대화 파일들을 병합하고 TLK 생성')
     parser.add_argument('-d', '--debug', action='store_true',
                         help='검수 모드: 텍스트 앞에 [StrRef] 추가 (예: [21]안녕하세요)')
+    parser.add_argument('--profile', nargs='?', const='profile_report.json', metavar='REPORT',
+                        help='단계별 시간/CPU/메모리 측정 후 JSON 리포트 저장 (기본: profile_report.json)')
+    parser.add_argument('--cprofile', metavar='PSTATS',
+                        help='cProfile 덤프 저장 (예: merge.pstats, --profile 없이 주면 기본 리포트도 저장)')
     args = parser.parse_args()
+    if args.cprofile and not args.profile:
+        args.profile = 'profile_report.json'
 
-    csv_file = merge_dialog_files()
+    profiler = PhaseProfiler(
+        enabled=bool(args.profile),
+        cprofile_path=Path(args.cprofile) if args.cprofile else None
+    )
+
+    result = merge_dialog_files(profiler)
 
-    if csv_file:
+    if result:
+        csv_file, records = result
         # TLK 파일 경로 설정
         tlk_file = csv_file.with_suffix('.tlk')
-        create_tlk_from_csv(csv_file, tlk_file, debug_mode=args.debug)
\ No newline at end of file
+        create_tlk_from_csv(csv_file, tlk_file, debug_mode=args.debug, records=records,
+                            profiler=profiler)
+
+    if args.profile:
+        profiler.finish(Path(args.profile))
\ No newline at end of file
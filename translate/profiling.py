@@ -0,0 +1,110 @@
+"""
+병합/TLK 파이프라인 단계별 프로파일러
+
+--profile 옵션이 켜지면 단계마다 벽시계 시간, CPU 시간, tracemalloc 최대 메모리를
+기록해 JSON 리포트로 저장합니다. 필요하면 cProfile 덤프도 함께 남깁니다.
+
+사용 예:
+    profiler = PhaseProfiler(enabled=True)
+    with profiler.phase('csv_parse'):
+        ...
+    profiler.finish(Path('profile_report.json'))
+"""
+
+import cProfile
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+
+class PhaseProfiler:
+    """단계별 시간/메모리 측정기 (비활성화 상태에서는 비용 없음)
+
+    단계는 중첩하지 않고 순서대로 측정합니다 (tracemalloc 최대값을 단계마다 초기화).
+    """
+
+    def __init__(self, enabled: bool = False, cprofile_path: Path | None = None):
+        self.enabled = enabled
+        self.cprofile_path = cprofile_path
+        self.phases: list[dict] = []
+        self.info: dict = {}
+        self._started = time.perf_counter()
+        self._cprofile = None
+
+        if self.enabled:
+            tracemalloc.start()
+            if cprofile_path:
+                self._cprofile = cProfile.Profile()
+                self._cprofile.enable()
+
+    def phase(self, name: str):
+        """측정 구간 컨텍스트 매니저"""
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            current, peak = tracemalloc.get_traced_memory()
+            self.phases.append({
+                'name': name,
+                'wall_s': round(wall, 6),
+                'cpu_s': round(cpu, 6),
+                'peak_mem_bytes': peak,
+                'end_mem_bytes': current,
+            })
+
+    def note(self, key: str, value) -> None:
+        """리포트에 함께 남길 부가 정보 (레코드 수 등)"""
+        if self.enabled:
+            self.info[key] = value
+
+    def report(self) -> dict:
+        """JSON 직렬화 가능한 리포트"""
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'total_wall_s': round(time.perf_counter() - self._started, 6),
+            'total_cpu_s': round(sum(p['cpu_s'] for p in self.phases), 6),
+            'peak_mem_bytes': max((p['peak_mem_bytes'] for p in self.phases), default=0),
+            'phases': self.phases,
+            'info': self.info,
+        }
+
+    def finish(self, report_path: Path) -> None:
+        """측정 종료: 요약 출력, JSON 리포트/cProfile 덤프 저장"""
+        if not self.enabled:
+            return
+
+        if self._cprofile:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(str(self.cprofile_path))
+        tracemalloc.stop()
+
+        report = self.report()
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print("\n=== 프로파일 ===")
+        print(f"  {'단계':16s} {'wall(s)':>9s} {'cpu(s)':>9s} {'peak(MB)':>9s}")
+        for p in self.phases:
+            print(f"  {p['name']:16s} {p['wall_s']:9.3f} {p['cpu_s']:9.3f} "
+                  f"{p['peak_mem_bytes'] / 1024 / 1024:9.1f}")
+        print(f"  총 {report['total_wall_s']:.3f}s")
+        print(f"리포트 저장: {report_path}")
+        if self._cprofile:
+            print(f"cProfile 덤프: {self.cprofile_path}")
@@ -0,0 +1,201 @@
+"""
+병합된 대화 레코드용 컬럼 기반 저장소
+
+레코드마다 dict를 만드는 대신 필드별 리스트 하나에 값을 모아 둡니다.
+merge_dialog_files(병합/검증)와 CSVToTLKConverter(TLK 생성)가 같은 저장소를 공유합니다.
+"""
+
+import sys
+from operator import itemgetter
+from typing import Iterable, Iterator, Mapping, Sequence
+
+# 자유 텍스트 필드는 값이 대부분 고유하므로 intern 하지 않음
+FREE_TEXT_FIELDS = frozenset({'Text', 'TextEng'})
+
+
+def strref_sort_key(strref: str):
+    """StrRef 정렬 키 (숫자가 아닌 StrRef는 맨 뒤로)"""
+    return int(strref) if strref.isdigit() else float('inf')
+
+
+class RecordView:
+    """저장소의 한 행을 가리키는 읽기 전용 뷰 (값 복사 없음)"""
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: 'RecordStore', row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, field: str) -> str:
+        return self._store.columns[field][self._row]
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._store.columns
+
+    def get(self, field: str, default: str = '') -> str:
+        column = self._store.columns.get(field)
+        return column[self._row] if column is not None else default
+
+    def keys(self) -> list[str]:
+        return list(self._store.fieldnames)
+
+    def to_dict(self) -> dict:
+        """필요할 때만 dict로 변환"""
+        return {field: column[self._row] for field, column in self._store.columns.items()}
+
+    def __repr__(self):
+        return f"RecordView({self.to_dict()!r})"
+
+
+class RecordStore:
+    """StrRef를 키로 하는 컬럼 기반 레코드 저장소
+
+    - 필드마다 리스트 하나 (반복되는 값은 sys.intern으로 공유)
+    - 같은 StrRef가 다시 들어오면 해당 행을 덮어씀 (나중 파일 우선)
+    - StrRef 정렬 순서는 한 번만 계산해 캐시
+    - 행마다 원본 CSV 파일명을 sources에 보관 (CSV 출력에는 포함되지 않음)
+    """
+
+    def __init__(self, fieldnames: Iterable[str] = ()):
+        self.fieldnames: list[str] = []
+        self.columns: dict[str, list[str]] = {}
+        self.sources: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self._order: list[int] | None = None
+        for field in fieldnames:
+            self.add_field(field)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, strref: str) -> bool:
+        return strref in self._rows
+
+    def __getitem__(self, strref: str) -> RecordView:
+        return RecordView(self, self._rows[strref])
+
+    def add_field(self, field: str) -> None:
+        """필드 추가 (기존 행은 빈 문자열로 채움)"""
+        if field in self.columns:
+            return
+        self.fieldnames.append(field)
+        self.columns[field] = [''] * self._size
+
+    def source(self, strref: str) -> str:
+        """레코드가 들어온 파일명"""
+        return self.sources[self._rows[strref]]
+
+    def put(self, row: Mapping[str, str], source: str = '') -> bool:
+        """dict 형태의 행 추가/덮어쓰기. StrRef가 없으면 False"""
+        strref = row.get('StrRef', '')
+        if not strref:
+            return False
+
+        for field in row:
+            if field and field not in self.columns:
+                self.add_field(field)
+
+        index = self._rows.get(strref)
+        if index is None:
+            index = self._size
+            self._rows[strref] = index
+            self._size += 1
+            self._order = None
+            self.sources.append(source)
+            for column in self.columns.values():
+                column.append('')
+        else:
+            self.sources[index] = source
+
+        intern = sys.intern
+        for field, column in self.columns.items():
+            value = row.get(field) or ''
+            if field not in FREE_TEXT_FIELDS:
+                value = intern(value)
+            column[index] = value
+        return True
+
+    def set_value(self, strref: str, field: str, value: str) -> bool:
+        """기존 레코드의 필드 값 하나 변경. StrRef가 없으면 False"""
+        index = self._rows.get(strref)
+        if index is None:
+            return False
+        self.add_field(field)
+        self.columns[field][index] = value if field in FREE_TEXT_FIELDS else sys.intern(value)
+        return True
+
+    def extend(self, fieldnames: Sequence[str], rows: Iterable[Sequence[str]], source: str = '') -> int:
+        """헤더 순서의 행 튜플들을 추가/덮어쓰기 (csv_rows.RowReader와 함께 사용)
+
+        컬럼 대응은 파일마다 한 번만 계산합니다. 추가된 행 수를 반환합니다.
+        """
+        if 'StrRef' not in fieldnames:
+            return 0
+        for field in fieldnames:
+            if field:
+                self.add_field(field)
+
+        # 중복 컬럼은 마지막 위치 사용 (DictReader와 동일)
+        positions = {field: pos for pos, field in enumerate(fieldnames) if field}
+        strref_pos = positions['StrRef']
+        targets = [(self.columns[field], pos, field not in FREE_TEXT_FIELDS)
+                   for field, pos in positions.items()]
+        absent = [column for field, column in self.columns.items() if field not in positions]
+
+        intern = sys.intern
+        source = intern(source)
+        sources = self.sources
+        row_index = self._rows
+        count = 0
+        for values in rows:
+            strref = values[strref_pos]
+            if not strref:
+                continue
+
+            index = row_index.get(strref)
+            if index is None:
+                index = self._size
+                row_index[strref] = index
+                self._size += 1
+                self._order = None
+                sources.append(source)
+                for column in self.columns.values():
+                    column.append('')
+            else:
+                sources[index] = source
+                for column in absent:
+                    column[index] = ''
+
+            for column, pos, shared in targets:
+                column[index] = intern(values[pos]) if shared else values[pos]
+            count += 1
+        return count
+
+    def items(self) -> Iterator[tuple[str, RecordView]]:
+        """삽입 순서로 (StrRef, 행 뷰) 반환"""
+        for strref, index in self._rows.items():
+            yield strref, RecordView(self, index)
+
+    def column(self, field: str) -> list[str]:
+        """필드 컬럼 (없는 필드는 빈 값 컬럼)"""
+        column = self.columns.get(field)
+        return column if column is not None else [''] * self._size
+
+    def sorted_order(self) -> list[int]:
+        """StrRef 숫자 순 행 인덱스 (캐시)"""
+        if self._order is None:
+            strrefs = self.columns.get('StrRef', [])
+            self._order = sorted(range(self._size), key=lambda i: strref_sort_key(strrefs[i]))
+        return self._order
+
+    def iter_sorted(self, fields: Sequence[str]) -> Iterator[tuple]:
+        """StrRef 순으로 지정 필드 값을 튜플로 반환 (csv.writer.writerows에 바로 사용)"""
+        order = self.sorted_order()
+        if not order:
+            return iter(())
+        if len(order) == 1:
+            return iter([tuple(self.column(field)[order[0]] for field in fields)])
+        pick = itemgetter(*order)
+        return zip(*(pick(self.column(field)) for field in fields))
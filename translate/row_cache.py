@@ -0,0 +1,137 @@
+"""
+편집기용 파일별 행 캐시
+
+파일마다 시그니처(mtime, 크기)와 함께 행을 보관하고, 시그니처가 바뀐 파일만 다시 읽습니다.
+편집기가 저장하면 해당 행만 메모리에서 바꾸므로 저장 후 코퍼스 전체를 다시 읽지 않습니다.
+편집 저널(edit_journal.py)에 남은 편집은 파일을 읽을 때 덮어씁니다.
+
+all_rows()는 모든 파일의 행을 이어 붙인 목록을 유지합니다. 행 배치(파일 목록, 파일별 행 수)가
+그대로면 바뀐 파일만 제자리에서 교체하고, 값이 달라진 행은 on_change로 알려 검색 색인이
+그 행만 갱신하게 합니다. 배치가 바뀌면 layout_version이 올라갑니다.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Sequence
+
+from corpus import csv_files, file_signature
+from csv_rows import load_rows
+from edit_journal import apply_row_edits, pending_edits
+
+
+class RowCache:
+    """파일명 → (시그니처, 행 목록)
+
+    Args:
+        fields: 읽을 컬럼 (None이면 전체)
+        named: namedtuple 행
+    """
+
+    def __init__(self, dialog_dir: Path, fields: Sequence[str] | None = None, named: bool = False):
+        self.dialog_dir = dialog_dir
+        self.fields = tuple(fields) if fields is not None else None
+        self.named = named
+        self.files: dict[str, tuple[list[int], list[tuple]]] = {}
+        self.layout_version = 0
+        self.on_change: Callable[[int, tuple], None] | None = None
+        self._all: list[tuple[str, tuple]] | None = None
+        self._starts: dict[str, int] = {}
+        # Streamlit 세션 스레드들이 같은 캐시를 공유
+        self._lock = threading.RLock()
+
+    def _fields_of(self, row: tuple) -> Sequence[str]:
+        return row._fields if self.named else self.fields
+
+    def _load(self, name: str, edits: dict[str, dict[str, str]] | None) -> list[tuple]:
+        _, rows = load_rows(self.dialog_dir / name, self.fields, self.named)
+        if edits and rows:
+            fields = self._fields_of(rows[0])
+            strref_pos = list(fields).index('StrRef')
+            rows = [apply_row_edits(row, fields, edits[row[strref_pos]]) if row[strref_pos] in edits else row
+                    for row in rows]
+        return rows
+
+    def _fresh(self, name: str, edits: dict | None = None) -> bool:
+        """시그니처가 바뀌었으면 다시 읽음 → 다시 읽었는지"""
+        signature = file_signature(self.dialog_dir / name)
+        entry = self.files.get(name)
+        if entry is not None and entry[0] == signature:
+            return False
+        if edits is None:
+            edits = pending_edits()
+        old_rows = entry[1] if entry else None
+        rows = self._load(name, edits.get(name))
+        self.files[name] = (signature, rows)
+
+        # 이어 붙인 목록에서 제자리 교체가 가능하면 바뀐 행만 알림
+        if self._all is not None and old_rows is not None and len(old_rows) == len(rows):
+            start = self._starts[name]
+            for i, (old, new) in enumerate(zip(old_rows, rows)):
+                if old != new:
+                    self._all[start + i] = (name, new)
+                    if self.on_change:
+                        self.on_change(start + i, new)
+        else:
+            self._all = None
+        return True
+
+    def rows(self, name: str) -> list[tuple]:
+        """파일 하나의 행 (바뀌었으면 다시 읽음)"""
+        with self._lock:
+            self._fresh(name)
+            return self.files[name][1]
+
+    def all_rows(self) -> list[tuple[str, tuple]]:
+        """모든 파일의 (파일명, 행) 목록 (이름순)"""
+        with self._lock:
+            names = [path.name for path in csv_files(self.dialog_dir)]
+            if self._all is not None and list(self._starts) != names:
+                self._all = None
+            edits = None
+            for name in names:
+                entry = self.files.get(name)
+                if entry is not None and entry[0] == file_signature(self.dialog_dir / name):
+                    continue
+                if edits is None:
+                    edits = pending_edits()
+                self._fresh(name, edits)
+            for name in list(self.files):
+                if name not in names:
+                    del self.files[name]
+
+            if self._all is None:
+                self._all = []
+                self._starts = {}
+                for name in names:
+                    self._starts[name] = len(self._all)
+                    self._all.extend((name, row) for row in self.files[name][1])
+                self.layout_version += 1
+            return self._all
+
+    def patch(self, name: str, strref: str, changes: dict[str, str]) -> bool:
+        """저장한 행을 메모리에서 갱신 (파일을 아직 읽지 않았으면 False)"""
+        return self.patch_many(name, {strref: changes}) > 0
+
+    def patch_many(self, name: str, changes: dict[str, dict[str, str]]) -> int:
+        """저장한 행들을 파일을 한 번 훑어 갱신 (StrRef → {필드: 값}) → 갱신한 행 수"""
+        with self._lock:
+            entry = self.files.get(name)
+            if entry is None or not entry[1]:
+                return 0
+            rows = entry[1]
+            fields = self._fields_of(rows[0])
+            strref_pos = list(fields).index('StrRef')
+            count = 0
+            for i, row in enumerate(rows):
+                row_changes = changes.get(row[strref_pos])
+                if row_changes is None:
+                    continue
+                new = apply_row_edits(row, fields, row_changes)
+                rows[i] = new
+                count += 1
+                if self._all is not None:
+                    position = self._starts[name] + i
+                    self._all[position] = (name, new)
+                    if self.on_change:
+                        self.on_change(position, new)
+            return count
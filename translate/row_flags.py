@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+행별 검증 플래그 (규칙별 비트셋)
+
+파일마다 규칙(완성형, TLK 인코딩, 엔진 토큰, 빈 번역)별로 문제가 있는 행 번호를
+정수 비트셋(비트 i = 행 i)으로 한 번 계산해 .cache/에 저장합니다. 다음에는 시그니처가
+바뀐 파일만 다시 계산하고, 편집기가 저장하면 저장한 행의 비트만 고칩니다.
+"문제 있는 행만" 필터는 비트셋 OR/스캔이고, 파일별 문제 수는 비트 수 세기입니다.
+
+행 번호는 StrRef 인덱스(strref_index.py)와 같은 순서이고, 아직 CSV에 반영되지 않은
+저널 편집을 덮어 계산합니다.
+
+사용법:
+    python3 row_flags.py          # 규칙별 문제 행 수와 문제가 많은 파일
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable
+
+from corpus import DIALOG_DIR, csv_files, file_signature, read_cache, write_cache
+from cp949_preflight import is_encodable
+from csv_rows import open_rows, read_rows_at
+from edit_journal import pending_edits
+from ksx1001 import NON_KSX1001_PATTERN
+from token_parity import diff_tokens
+
+CACHE_NAME = 'row_flags.json'
+CACHE_VERSION = 1
+
+# 규칙 이름 → 표시 이름 (비트셋 저장 순서)
+RULES = {
+    'ksx1001': '완성형 오류',
+    'cp949': 'TLK 인코딩 불가',
+    'tokens': '엔진 토큰 불일치',
+    'empty': '빈 번역',
+}
+
+# 숫자만 있는 코드 원문 (예: 100767, 453_452)은 번역이 비어도 정상
+_CODE_TEXT = re.compile(r'\d+_\d+')
+
+
+def is_empty_translation(text: str, text_eng: str) -> bool:
+    """번역이 비어 있는데 원문은 번역할 텍스트인지"""
+    if text or not text_eng:
+        return False
+    stripped = text_eng.strip()
+    return bool(stripped) and not stripped.isdigit() and not _CODE_TEXT.fullmatch(stripped)
+
+
+def row_rules(text: str, text_eng: str) -> list[str]:
+    """행이 걸리는 규칙 이름 목록"""
+    rules = []
+    if NON_KSX1001_PATTERN.search(text):
+        rules.append('ksx1001')
+    if not is_encodable(text):
+        rules.append('cp949')
+    if text and ('<' in text or '<' in text_eng) and diff_tokens(text_eng, text):
+        rules.append('tokens')
+    if is_empty_translation(text, text_eng):
+        rules.append('empty')
+    return rules
+
+
+class RowFlags:
+    """파일명 → {'signature', 'count', 'bits': {규칙: 비트셋}}"""
+
+    def __init__(self, files: dict[str, dict] | None = None, dialog_dir: Path = DIALOG_DIR):
+        self.files = files if files is not None else {}
+        self.dialog_dir = dialog_dir
+
+    @classmethod
+    def load(cls, dialog_dir: Path = DIALOG_DIR) -> 'RowFlags':
+        """캐시에서 로드 (없거나 다른 디렉토리/규칙이면 빈 플래그)"""
+        data = read_cache(CACHE_NAME)
+        root = str(dialog_dir.resolve())
+        if (not data or data.get('version') != CACHE_VERSION or data.get('root') != root
+                or data.get('rules') != list(RULES)):
+            return cls(dialog_dir=dialog_dir)
+        files = {
+            name: {
+                'signature': entry['signature'],
+                'count': entry['count'],
+                'bits': {rule: int(bits, 16) for rule, bits in entry['bits'].items()},
+            }
+            for name, entry in data['files'].items()
+        }
+        return cls(files, dialog_dir)
+
+    def save(self) -> None:
+        write_cache(CACHE_NAME, {
+            'version': CACHE_VERSION,
+            'root': str(self.dialog_dir.resolve()),
+            'rules': list(RULES),
+            'files': {
+                name: {
+                    'signature': entry['signature'],
+                    'count': entry['count'],
+                    'bits': {rule: format(bits, 'x') for rule, bits in entry['bits'].items()},
+                }
+                for name, entry in self.files.items()
+            },
+        })
+
+    def refresh(self, paths: list[Path] | None = None) -> int:
+        """시그니처가 바뀐 파일만 다시 계산하고 없어진 파일은 제거 → 다시 계산한 파일 수"""
+        if paths is None:
+            paths = csv_files(self.dialog_dir)
+        names = {path.name for path in paths}
+        for name in [name for name in self.files if name not in names]:
+            del self.files[name]
+
+        edits = None
+        changed = 0
+        for path in paths:
+            entry = self.files.get(path.name)
+            if entry is None or entry['signature'] != file_signature(path):
+                if edits is None:
+                    edits = pending_edits()
+                self.update_file(path, edits.get(path.name))
+                changed += 1
+        return changed
+
+    def update_file(self, path: Path, edits: dict[str, dict[str, str]] | None = None) -> None:
+        """파일 하나 다시 계산 (edits: 덮어쓸 저널 편집)"""
+        signature = file_signature(path)
+        bits = dict.fromkeys(RULES, 0)
+        count = 0
+        with open_rows(path, ('StrRef', 'Text', 'TextEng')) as reader:
+            for row, (strref, text, text_eng) in enumerate(reader):
+                if edits and strref in edits:
+                    text = edits[strref].get('Text', text)
+                for rule in row_rules(text, text_eng):
+                    bits[rule] |= 1 << row
+                count = row + 1
+        self.files[path.name] = {'signature': signature, 'count': count, 'bits': bits}
+
+    def entry(self, name: str) -> dict:
+        """파일의 플래그 (파일이 바뀌었으면 다시 계산)"""
+        path = self.dialog_dir / name
+        entry = self.files.get(name)
+        if entry is None or entry['signature'] != file_signature(path):
+            self.update_file(path, pending_edits().get(name))
+            entry = self.files[name]
+        return entry
+
+    def set_row(self, name: str, row: int, text: str, text_eng: str) -> None:
+        """행 하나의 비트 갱신 (저장 직후 호출)"""
+        rules = row_rules(text, text_eng)
+        bits = self.entry(name)['bits']
+        for rule in RULES:
+            if rule in rules:
+                bits[rule] |= 1 << row
+            else:
+                bits[rule] &= ~(1 << row)
+
+    def update_texts(self, name: str, texts: dict[str, str], offsets: list[list]) -> None:
+        """저장한 번역문의 행 비트 갱신 (offsets: StrRef 인덱스의 [[StrRef, 오프셋], ...])"""
+        positions = {strref: row for row, (strref, _) in enumerate(offsets)}
+        rows = [(positions[strref], text) for strref, text in texts.items() if strref in positions]
+        engs = read_rows_at(self.dialog_dir / name, [offsets[row][1] for row, _ in rows], ('TextEng',))
+        for (row, text), eng in zip(rows, engs):
+            if eng is not None:
+                self.set_row(name, row, text, eng[0])
+
+    def mask(self, name: str, rules: Iterable[str]) -> int:
+        """규칙들 중 하나라도 걸린 행의 비트셋"""
+        bits = self.entry(name)['bits']
+        mask = 0
+        for rule in rules:
+            mask |= bits[rule]
+        return mask
+
+    def rows(self, name: str, rules: Iterable[str]) -> list[int]:
+        """규칙들 중 하나라도 걸린 행 번호 (오름차순)"""
+        mask = self.mask(name, rules)
+        rows = []
+        while mask:
+            low = mask & -mask
+            rows.append(low.bit_length() - 1)
+            mask ^= low
+        return rows
+
+    def counts(self, name: str) -> dict[str, int]:
+        """규칙별 문제 행 수"""
+        return {rule: bits.bit_count() for rule, bits in self.entry(name)['bits'].items()}
+
+    def issue_count(self, name: str) -> int:
+        """문제가 하나라도 있는 행 수"""
+        return self.mask(name, RULES).bit_count()
+
+
+def row_flags(dialog_dir: Path = DIALOG_DIR) -> RowFlags:
+    """캐시된 플래그를 로드해 바뀐 파일만 다시 계산 (다시 계산했으면 저장)"""
+    flags = RowFlags.load(dialog_dir)
+    if flags.refresh():
+        flags.save()
+    return flags
+
+
+def main():
+    flags = row_flags()
+    totals = dict.fromkeys(RULES, 0)
+    per_file = []
+    for name in sorted(flags.files):
+        for rule, count in flags.counts(name).items():
+            totals[rule] += count
+        issues = flags.issue_count(name)
+        if issues:
+            per_file.append((issues, name))
+
+    print(f"검사한 파일: {len(flags.files)}개")
+    for rule, label in RULES.items():
+        print(f"  {label}: {totals[rule]}행")
+    if per_file:
+        print("\n문제가 많은 파일:")
+        for issues, name in sorted(per_file, key=lambda item: (-item[0], item[1]))[:20]:
+            print(f"  {name}: {issues}행")
+
+
+if __name__ == '__main__':
+    main()
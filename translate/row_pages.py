@@ -0,0 +1,145 @@
+"""
+단일 파일 모드용 페이지 단위 행 소스
+
+파일 전체를 행으로 만들지 않고, 보이는 페이지와 미리 읽을 다음 페이지의 행만 읽습니다.
+필터가 없으면 행 수와 행 위치를 StrRef 인덱스(strref_index.py)의 오프셋 목록에서
+가져오므로 파일을 파싱하지 않고 페이지 수를 알고 해당 행만 읽습니다.
+필터가 있으면 번역문 컬럼만 스트리밍하며 요청한 페이지를 채울 만큼만 검사하고,
+찾은 행 번호는 필터별로 보관해 다음 페이지는 멈춘 곳부터 이어서 검사합니다.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+from csv_rows import read_rows_at
+from edit_journal import apply_row_edits
+
+# 보이는 페이지 뒤로 미리 읽어 둘 페이지 수
+LOOKAHEAD_PAGES = 1
+# 필터 검사 시 한 번에 읽는 행 수 (묶음 사이에는 파일을 닫아 둠)
+SCAN_BATCH = 500
+
+
+class FilteredView:
+    """필터에 맞는 행 번호를 필요한 만큼만 찾는 뷰"""
+
+    def __init__(self, texts: Iterator[tuple[int, str]], predicate: Callable[[str], bool],
+                 candidates: set[int] | None = None):
+        self._texts = texts
+        self.predicate = predicate
+        self.candidates = candidates
+        self.matches: list[int] = []
+        self.exhausted = False
+
+    def ensure(self, count: int) -> None:
+        """일치하는 행을 count개 찾거나 파일 끝까지 검사"""
+        candidates = self.candidates
+        while len(self.matches) < count and not self.exhausted:
+            item = next(self._texts, None)
+            if item is None:
+                self.exhausted = True
+            elif (candidates is None or item[0] in candidates) and self.predicate(item[1]):
+                self.matches.append(item[0])
+
+
+class PagedRows:
+    """파일 하나의 페이지 단위 행 소스
+
+    Args:
+        count: 전체 행 수 (인덱스에서)
+        read: 행 번호 목록 → 행 목록 (namedtuple)
+        scan: () → (행 번호, StrRef, 번역문) 이터레이터
+        edits: CSV에 아직 반영되지 않은 편집 (StrRef → {필드: 값})
+    """
+
+    def __init__(self, count: int, read: Callable[[Sequence[int]], list[tuple]],
+                 scan: Callable[[], Iterator[tuple[int, str, str]]],
+                 edits: dict[str, dict[str, str]] | None = None,
+                 page_size: int = 15, lookahead: int = LOOKAHEAD_PAGES):
+        self.count = count
+        self.page_size = page_size
+        self.lookahead = lookahead
+        self.edits = dict(edits or {})
+        self._read = read
+        self._scan = scan
+        self._rows: dict[int, tuple] = {}
+        self._views: dict[object, FilteredView] = {}
+
+    @classmethod
+    def from_csv(cls, path: Path, offsets: list[list], edits: dict[str, dict[str, str]] | None = None,
+                 page_size: int = 15) -> 'PagedRows':
+        """CSV 파일 (offsets: StrRef 인덱스의 [[StrRef, 오프셋], ...])"""
+
+        def read(indexes):
+            return read_rows_at(path, [offsets[i][1] for i in indexes], named=True)
+
+        def scan():
+            for start in range(0, len(offsets), SCAN_BATCH):
+                batch = read_rows_at(path, [offset for _, offset in offsets[start:start + SCAN_BATCH]],
+                                     ('StrRef', 'Text'))
+                yield from ((start + i, *row) for i, row in enumerate(batch) if row is not None)
+
+        return cls(len(offsets), read, scan, edits, page_size)
+
+    @classmethod
+    def from_workspace(cls, workspace, name: str, page_size: int = 15) -> 'PagedRows':
+        """SQLite 작업공간의 파일"""
+        return cls(workspace.row_count(name), lambda indexes: workspace.rows_at(name, indexes),
+                   lambda: iter(workspace.file_texts(name)), page_size=page_size)
+
+    def _texts(self) -> Iterator[tuple[int, str]]:
+        edits = self.edits
+        for i, strref, text in self._scan():
+            changes = edits.get(strref)
+            yield i, changes.get('Text', text) if changes else text
+
+    def _materialize(self, indexes: Sequence[int]) -> None:
+        missing = [i for i in indexes if i not in self._rows]
+        if not missing:
+            return
+        for i, row in zip(missing, self._read(missing)):
+            if row is None:
+                continue
+            changes = self.edits.get(row.StrRef)
+            self._rows[i] = apply_row_edits(row, row._fields, changes) if changes else row
+
+    def page(self, page: int, key: object = None, predicate: Callable[[str], bool] | None = None,
+             candidates: Sequence[int] | None = None) -> tuple[list[tuple[int, tuple]], int, int, bool]:
+        """0부터 세는 페이지의 (행 번호, 행) 목록
+
+        key/predicate: 필터 식별자와 번역문 검사 함수 (None이면 전체 행)
+        candidates: 미리 좁힌 행 번호 (오름차순, 예: 검증 플래그 비트셋의 행)
+
+        Returns:
+            (행 목록, 지금까지 알려진 행 수, 페이지 수, 행 수가 확정되었는지)
+        """
+        size = self.page_size
+        wanted = (page + 1 + self.lookahead) * size
+        if predicate is None:
+            indexes = range(self.count) if candidates is None else candidates
+            total = len(indexes)
+            exact = True
+        else:
+            view = self._views.get(key)
+            if view is None:
+                view = self._views[key] = FilteredView(
+                    self._texts(), predicate, None if candidates is None else set(candidates))
+            view.ensure(wanted)
+            total = len(view.matches)
+            exact = view.exhausted
+            indexes = view.matches
+
+        pages = max(1, (total + size - 1) // size)
+        page = min(page, pages - 1)
+        start = page * size
+        self._materialize(indexes[start:wanted])
+        rows = [(i, self._rows[i]) for i in indexes[start:start + size] if i in self._rows]
+        return rows, total, pages, exact
+
+    def patch(self, strref: str, changes: dict[str, str]) -> None:
+        """저장한 편집 반영 (읽어 둔 행 갱신, 필터 결과는 다시 검사)"""
+        self.edits.setdefault(strref, {}).update(changes)
+        for i, row in self._rows.items():
+            if row.StrRef == strref:
+                self._rows[i] = apply_row_edits(row, row._fields, changes)
+        self._views.clear()
@@ -0,0 +1,177 @@
+"""
+전체 검색용 n-gram 역색인
+
+컬럼(Text, TextEng)마다 한글은 음절 2-gram, 영문/숫자는 소문자 단어를 토큰으로
+행 번호 목록(posting)을 만듭니다. 검색어에서 같은 토큰을 뽑아 posting을 교집합한 뒤
+후보 행만 실제 문자열로 확인하므로, 키 입력마다 코퍼스 전체를 훑지 않습니다.
+영문 검색어는 부분 단어도 찾도록 그 조각을 포함하는 단어들의 posting 합집합을 씁니다.
+
+행 수정은 update()로 이전 텍스트와 토큰을 비교해, 없어진 토큰의 posting에서는 행을 빼고
+새 토큰의 posting에만 넣습니다 (posting은 행 번호 오름차순 유지).
+"""
+
+import re
+from bisect import bisect_left, insort
+from typing import Iterable, Sequence
+
+# 겹치는 한글 2-gram (lookahead로 한 번에 추출)
+HANGUL_BIGRAM = re.compile(r'(?=([가-힣]{2}))')
+WORD = re.compile(r'[a-z0-9]+')
+
+SEARCH_MODES = ('contains', 'exact', 'regex')
+
+
+def tokenize(lowered: str) -> set[str]:
+    """소문자로 바꾼 텍스트의 토큰 (영문/숫자 단어 + 한글 2-gram)"""
+    tokens = set(WORD.findall(lowered))
+    if not lowered.isascii():
+        tokens.update(HANGUL_BIGRAM.findall(lowered))
+    return tokens
+
+
+class SearchIndex:
+    """컬럼별 역색인 (행 번호 = 색인에 넣은 순서)"""
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self.texts: dict[str, list[str]] = {field: [] for field in self.fields}
+        self.lowered: dict[str, list[str]] = {field: [] for field in self.fields}
+        self.postings: dict[str, dict[str, list[int]]] = {field: {} for field in self.fields}
+        self._words: dict[str, list[str] | None] = {field: None for field in self.fields}
+
+    @classmethod
+    def build(cls, fields: Sequence[str], rows: Iterable[Sequence[str]]) -> 'SearchIndex':
+        """rows: fields 순서의 값 튜플"""
+        index = cls(fields)
+        for values in rows:
+            index.add(values)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.texts[self.fields[0]])
+
+    def add(self, values: Sequence[str]) -> int:
+        """행 추가 → 행 번호"""
+        row = len(self)
+        for field, text in zip(self.fields, values):
+            self.texts[field].append(text)
+            self.lowered[field].append(text.lower())
+        self._index_row(row)
+        return row
+
+    def update(self, row: int, values: Sequence[str]) -> None:
+        """행 내용 교체 (바뀐 토큰의 posting만 고침)"""
+        for field, text in zip(self.fields, values):
+            lowered = text.lower()
+            old = tokenize(self.lowered[field][row])
+            new = tokenize(lowered)
+            self.texts[field][row] = text
+            self.lowered[field][row] = lowered
+
+            postings = self.postings[field]
+            for token in old - new:
+                posting = postings[token]
+                i = bisect_left(posting, row)
+                if i < len(posting) and posting[i] == row:
+                    del posting[i]
+                if not posting:
+                    del postings[token]
+                    self._words[field] = None
+            for token in new - old:
+                posting = postings.get(token)
+                if posting is None:
+                    postings[token] = [row]
+                    self._words[field] = None
+                else:
+                    insort(posting, row)
+
+    def _index_row(self, row: int) -> None:
+        # 추가한 행은 항상 마지막 번호이므로 append로 오름차순 유지
+        for field in self.fields:
+            postings = self.postings[field]
+            for token in tokenize(self.lowered[field][row]):
+                posting = postings.get(token)
+                if posting is None:
+                    postings[token] = [row]
+                    self._words[field] = None
+                else:
+                    posting.append(row)
+
+    def _word_list(self, field: str) -> list[str]:
+        """부분 단어 검색용 영문/숫자 토큰 목록"""
+        words = self._words[field]
+        if words is None:
+            words = self._words[field] = [token for token in self.postings[field] if token.isascii()]
+        return words
+
+    def candidates(self, query: str, field: str) -> set[int] | None:
+        """검색어를 포함할 수 있는 행 (None = 색인으로 좁힐 수 없음)"""
+        lowered = query.lower()
+        postings = self.postings[field]
+        constraints = []
+        for bigram in set(HANGUL_BIGRAM.findall(lowered)):
+            posting = postings.get(bigram)
+            if posting is None:
+                return set()
+            constraints.append(posting)
+        for fragment in set(WORD.findall(lowered)):
+            rows = set()
+            for word in self._word_list(field):
+                if fragment in word:
+                    rows.update(postings[word])
+            if not rows:
+                return set()
+            constraints.append(rows)
+        if not constraints:
+            return None
+
+        constraints.sort(key=len)
+        result = set(constraints[0])
+        for posting in constraints[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, fields: Sequence[str] | None = None, mode: str = 'contains',
+               ranked: bool = True) -> list[int]:
+        """검색어가 있는 행 번호
+
+        mode: 'contains' (대소문자 무시 부분 일치), 'exact' (대소문자 구분), 'regex'
+        ranked: True면 일치 횟수가 많고 텍스트가 짧은 행부터, False면 색인 순서
+
+        Raises:
+            re.error: 잘못된 정규식
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"알 수 없는 검색 모드: {mode}")
+        fields = self.fields if fields is None else tuple(fields)
+        pattern = re.compile(query) if mode == 'regex' else None
+        lowered_query = query.lower()
+
+        scores: dict[int, tuple[int, int]] = {}
+        for field in fields:
+            texts = self.texts[field]
+            if mode == 'regex':
+                # 정규식은 토큰을 뽑을 수 없으므로 전체 확인
+                rows = range(len(texts))
+            else:
+                rows = self.candidates(query, field)
+                if rows is None:
+                    rows = range(len(texts))
+
+            lowered = self.lowered[field]
+            for row in rows:
+                if mode == 'contains':
+                    count = lowered[row].count(lowered_query)
+                elif mode == 'exact':
+                    count = texts[row].count(query)
+                else:
+                    count = sum(1 for _ in pattern.finditer(texts[row]))
+                if count:
+                    best_count, length = scores.get(row, (0, 0))
+                    scores[row] = (best_count + count, max(length, len(texts[row])))
+
+        if ranked:
+            return sorted(scores, key=lambda row: (-scores[row][0], scores[row][1], row))
+        return sorted(scores)
@@ -0,0 +1,152 @@
+"""
+StrRef → (파일, 행 번호, 바이트 오프셋) 인덱스
+
+편집기의 StrRef 검색이 CSV를 하나씩 파싱하며 찾지 않도록, 파일마다 행의
+StrRef와 시작 바이트 오프셋을 한 번 기록해 .cache/에 저장합니다. 다음에는
+시그니처가 바뀐 파일만 다시 훑고, 편집기가 파일을 저장하면 그 파일만 갱신합니다.
+행 내용은 read_row_at으로 오프셋부터 한 행만 읽습니다.
+"""
+
+from pathlib import Path
+
+from corpus import DIALOG_DIR, csv_files, file_signature, read_cache, write_cache
+from csv_rows import RowReader, read_row_at
+
+CACHE_NAME = 'strref_index.json'
+CACHE_VERSION = 1
+
+
+def scan_offsets(path: Path) -> list[list]:
+    """파일의 [[StrRef, 행 시작 바이트 오프셋], ...] (행 번호 = 목록 위치)"""
+    position = 0
+
+    def lines():
+        nonlocal position
+        for line in f:
+            position += len(line)
+            yield line.decode('utf-8')
+
+    entries = []
+    with open(path, 'rb') as f:
+        # csv.reader는 행 하나를 만들 만큼만 줄을 가져가므로, 행을 받은 직후의
+        # position이 다음 행의 시작 위치 (건너뛴 빈 줄을 가리킬 수는 있음)
+        reader = RowReader(lines(), ('StrRef',))
+        start = position
+        for strref, in reader:
+            entries.append([strref, start])
+            start = position
+    return entries
+
+
+class StrRefIndex:
+    """파일명 → {'signature', 'rows': [[StrRef, 오프셋], ...]}"""
+
+    def __init__(self, files: dict[str, dict] | None = None, dialog_dir: Path = DIALOG_DIR):
+        self.files = files if files is not None else {}
+        self.dialog_dir = dialog_dir
+        self._lookup: dict[str, tuple[str, int, int]] | None = None
+
+    @classmethod
+    def load(cls, dialog_dir: Path = DIALOG_DIR) -> 'StrRefIndex':
+        """캐시에서 로드 (없거나 다른 디렉토리의 인덱스면 빈 인덱스)"""
+        data = read_cache(CACHE_NAME)
+        root = str(dialog_dir.resolve())
+        if not data or data.get('version') != CACHE_VERSION or data.get('root') != root:
+            return cls(dialog_dir=dialog_dir)
+        return cls(data['files'], dialog_dir)
+
+    def save(self) -> None:
+        write_cache(CACHE_NAME, {
+            'version': CACHE_VERSION,
+            'root': str(self.dialog_dir.resolve()),
+            'files': self.files,
+        })
+
+    def refresh(self, paths: list[Path] | None = None) -> int:
+        """시그니처가 바뀐 파일만 다시 훑고 없어진 파일은 제거
+
+        Returns:
+            다시 훑은 파일 수
+        """
+        if paths is None:
+            paths = csv_files(self.dialog_dir)
+        names = {path.name for path in paths}
+        removed = [name for name in self.files if name not in names]
+        for name in removed:
+            del self.files[name]
+
+        changed = 0
+        for path in paths:
+            entry = self.files.get(path.name)
+            if entry is None or entry['signature'] != file_signature(path):
+                self.update_file(path)
+                changed += 1
+        if removed:
+            self._lookup = None
+        return changed
+
+    def update_file(self, path: Path) -> None:
+        """파일 하나 다시 훑기 (저장 직후 호출)"""
+        name = path.name
+        old = self.files.get(name)
+        rows = scan_offsets(path)
+        self.files[name] = {'signature': file_signature(path), 'rows': rows}
+
+        # StrRef 구성이 그대로면(번역문만 바뀐 경우) 전체 조회표를 다시 만들지 않고 위치만 갱신
+        lookup = self._lookup
+        if lookup is None:
+            return
+        if old is None or [strref for strref, _ in old['rows']] != [strref for strref, _ in rows]:
+            self._lookup = None
+            return
+        for row, (strref, offset) in enumerate(rows):
+            if lookup.get(strref, (name,))[0] == name:
+                lookup[strref] = (name, row, offset)
+
+    def entries(self, name: str) -> list[list]:
+        """파일의 [[StrRef, 오프셋], ...] (파일이 바뀌었으면 다시 훑음)"""
+        path = self.dialog_dir / name
+        entry = self.files.get(name)
+        if entry is None or entry['signature'] != file_signature(path):
+            self.update_file(path)
+        return self.files[name]['rows']
+
+    def _build_lookup(self) -> dict[str, tuple[str, int, int]]:
+        # 병합과 같이 이름순으로 뒤에 오는 파일이 우선
+        lookup = {}
+        for name in sorted(self.files):
+            for row, (strref, offset) in enumerate(self.files[name]['rows']):
+                lookup[strref] = (name, row, offset)
+        return lookup
+
+    def lookup(self, strref: str) -> tuple[str, int, int] | None:
+        """(파일명, 행 번호, 바이트 오프셋)"""
+        if self._lookup is None:
+            self._lookup = self._build_lookup()
+        return self._lookup.get(strref)
+
+    def read(self, strref: str, fields=None, named: bool = False) -> tuple[str, int, tuple] | None:
+        """(파일명, 행 번호, 행). 인덱스 이후 파일이 바뀌었으면 그 파일을 다시 훑고 재시도"""
+        for _ in range(2):
+            location = self.lookup(strref)
+            if location is None:
+                return None
+            name, row, offset = location
+            path = self.dialog_dir / name
+            if path.exists() and self.files[name]['signature'] == file_signature(path):
+                values = read_row_at(path, offset, fields, named)
+                return name, row, values
+            if path.exists():
+                self.update_file(path)
+            else:
+                del self.files[name]
+                self._lookup = None
+        return None
+
+
+def strref_index(dialog_dir: Path = DIALOG_DIR) -> StrRefIndex:
+    """캐시된 인덱스를 로드해 바뀐 파일만 갱신 (갱신했으면 저장)"""
+    index = StrRefIndex.load(dialog_dir)
+    if index.refresh():
+        index.save()
+    return index
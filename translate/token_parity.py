@@ -0,0 +1,60 @@
+"""
+엔진 토큰 일치 검사 (Text vs TextEng)
+
+<FirstName>, <CUSTOM1001>, <StartAction>...</Start> 같은 엔진 토큰은 번역문에도
+원문과 같은 개수로 남아 있어야 합니다. 성별 토큰(<lord/lady> 등)은 한국어에서
+흔히 생략되므로 검사 대상이 아닙니다.
+"""
+
+import re
+from typing import Iterable
+
+# 엔진 토큰: 영문으로 시작하고 공백/슬래시가 없는 <Name>, </Name>
+TOKEN_PATTERN = re.compile(r'</?[A-Za-z][A-Za-z0-9_]*>')
+
+
+def extract_tokens(text: str) -> list[str]:
+    """텍스트의 엔진 토큰 목록"""
+    return TOKEN_PATTERN.findall(text)
+
+
+def diff_tokens(text_eng: str, text: str) -> tuple[list[str], list[str]] | None:
+    """토큰 불일치 시 (누락, 추가) 토큰 목록, 일치하면 None"""
+    findall = TOKEN_PATTERN.findall
+    eng_tokens = findall(text_eng)
+    tokens = findall(text)
+    if len(eng_tokens) == len(tokens) and sorted(eng_tokens) == sorted(tokens):
+        return None
+
+    missing = list(eng_tokens)
+    extra = []
+    for token in tokens:
+        if token in missing:
+            missing.remove(token)
+        else:
+            extra.append(token)
+    return missing, extra
+
+
+def check_token_parity(strrefs: Iterable[str], texts: Iterable[str], text_engs: Iterable[str],
+                       dlgs: Iterable[str], sources: Iterable[str]) -> list[dict]:
+    """컬럼을 한 번 훑으며 토큰 불일치 행을 찾음
+
+    번역이 비어 있는 행은 검사하지 않습니다 (empty_text 검사에서 다룸).
+    """
+    mismatches = []
+    for strref, text, text_eng, dlg, source in zip(strrefs, texts, text_engs, dlgs, sources):
+        # 빠른 경로: 어느 쪽에도 '<'가 없으면 토큰도 없음
+        if not text or ('<' not in text_eng and '<' not in text):
+            continue
+        diff = diff_tokens(text_eng, text)
+        if diff:
+            missing, extra = diff
+            mismatches.append({
+                'strref': strref,
+                'file': source,
+                'dlg': dlg,
+                'missing': missing,
+                'extra': extra,
+            })
+    return mismatches
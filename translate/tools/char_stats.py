@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+문자 빈도/커버리지 통계 스크립트
+
+dialog_translated/의 Text 컬럼에서 코드 포인트, 한글 음절, 기호, 줄 길이 히스토그램을
+만들어 요약을 출력하고 JSON/CSV로 저장합니다. 파일별 결과는 .cache/에 저장되어
+다음 실행에서는 바뀐 파일만 다시 읽습니다.
+
+사용법:
+    python3 char_stats.py                           # 요약 출력
+    python3 char_stats.py --json stats.json         # 전체 히스토그램 JSON 저장
+    python3 char_stats.py --csv chars.csv           # 문자별 빈도 CSV 저장
+    python3 char_stats.py --top 50                  # 상위 50자 출력
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from char_stats import CharStats, char_category, corpus_stats
+from corpus import DIALOG_DIR, csv_files
+
+
+def histogram(counter: Counter) -> list[list]:
+    """[문자, 코드 포인트, 횟수] 목록 (빈도순)"""
+    return [[char, f"U+{ord(char):04X}", count] for char, count in counter.most_common()]
+
+
+def write_json(path: Path, stats: CharStats) -> None:
+    report = {
+        'summary': stats.summary(),
+        'codepoints': histogram(stats.chars),
+        'hangul': histogram(stats.hangul()),
+        'symbols': histogram(stats.symbols()),
+        'line_lengths': {str(length): count for length, count in sorted(stats.line_lengths.items())},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+
+def write_csv(path: Path, stats: CharStats) -> None:
+    """문자별 빈도와 누적 비율"""
+    total = sum(stats.chars.values())
+    cumulative = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Rank', 'Char', 'CodePoint', 'Category', 'Count', 'Cumulative'])
+        for rank, (char, count) in enumerate(stats.chars.most_common(), start=1):
+            cumulative += count
+            writer.writerow([rank, char, f"U+{ord(char):04X}", char_category(char), count,
+                             f"{cumulative / total:.6f}"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='번역문 문자 빈도/커버리지 통계')
+    parser.add_argument('dialog_dir', nargs='?', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--json', metavar='PATH', help='전체 히스토그램 JSON 저장 경로')
+    parser.add_argument('--csv', metavar='PATH', help='문자별 빈도 CSV 저장 경로')
+    parser.add_argument('--top', type=int, default=20, help='출력할 상위 한글 수 (기본: 20)')
+    args = parser.parse_args()
+
+    dialog_dir = Path(args.dialog_dir)
+    if not dialog_dir.is_dir():
+        print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+        sys.exit(1)
+
+    files = csv_files(dialog_dir)
+    stats, changed = corpus_stats(files)
+    summary = stats.summary()
+
+    print(f"파일: {len(files)}개 (다시 읽음: {changed}개)")
+    print(f"행: {summary['rows']:,}개, 문자: {summary['chars']:,}개 ({summary['distinct_chars']}종)")
+    for category, count in sorted(summary['category_totals'].items(), key=lambda x: -x[1]):
+        print(f"  {category}: {count:,}회 ({summary['category_distinct'][category]}종)")
+    print(f"한글 음절: {summary['hangul_distinct']}종 (완성형 {summary['ksx1001_used']}자 사용)")
+    if summary['non_ksx1001_hangul']:
+        print(f"  완성형 외: {''.join(summary['non_ksx1001_hangul'])}")
+    coverage = ', '.join(f"상위 {top}자 {ratio * 100:.2f}%"
+                         for top, ratio in summary['hangul_top_coverage'].items())
+    print(f"한글 커버리지: {coverage}")
+    print(f"줄: {summary['lines']:,}개, 평균 {summary['mean_line_length']}자, 최대 {summary['max_line_length']}자")
+
+    if args.top > 0:
+        top = ' '.join(f"{char}({count})" for char, count in stats.hangul().most_common(args.top))
+        print(f"\n상위 한글 {args.top}자: {top}")
+
+    if args.json:
+        write_json(Path(args.json), stats)
+        print(f"\nJSON 저장: {args.json}")
+    if args.csv:
+        write_csv(Path(args.csv), stats)
+        print(f"CSV 저장: {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
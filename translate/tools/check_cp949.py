@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+TLK 인코딩 사전 검사 스크립트
+
+TLK 빌드 시 CP949(한글 문자열) 또는 CP1252(그 외)로 인코딩할 수 없어 문자열 전체가
+UTF-8로 대체되는 문자(특수 기호, 이모지 등)를 빌드 전에 찾고 대체 문자를 제안합니다.
+
+사용법:
+    python3 check_cp949.py                      # dialog_translated/ 전체 검사
+    python3 check_cp949.py <csv_file>           # 특정 파일 검사
+    python3 check_cp949.py --report report.csv  # 결과를 CSV로 저장
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from corpus import DIALOG_DIR, csv_files
+from cp949_preflight import find_encoding_failures
+from csv_rows import open_rows
+
+
+def load_texts(paths: list[Path]) -> tuple[list[str], list[str], list[str]]:
+    """파일들의 (StrRef, Text, 파일명) 컬럼"""
+    strrefs, texts, sources = [], [], []
+    for path in paths:
+        with open_rows(path, ('StrRef', 'Text')) as reader:
+            for strref, text in reader:
+                strrefs.append(strref)
+                texts.append(text)
+                sources.append(path.name)
+    return strrefs, texts, sources
+
+
+def describe(char: str) -> str:
+    return f"'{char}' (U+{ord(char):04X})"
+
+
+def print_failures(failures: list[dict]) -> None:
+    """문자별로 묶어 출력 (발생 횟수 순)"""
+    by_char: dict[str, list[dict]] = {}
+    for failure in failures:
+        by_char.setdefault(failure['char'], []).append(failure)
+
+    print("\n⚠️  TLK 인코딩 불가 문자 발견!")
+    print(f"   - 문자 종류: {len(by_char)}개")
+    print(f"   - 총 발생 횟수: {len(failures)}회\n")
+
+    for char, occurrences in sorted(by_char.items(), key=lambda x: -len(x[1])):
+        first = occurrences[0]
+        suggestion = f"'{first['suggestion']}'" if first['suggestion'] else '(삭제)'
+        print(f"{describe(char)} [{first['encoding']}] - {len(occurrences)}회, 제안: {suggestion}")
+        for occ in occurrences[:5]:
+            print(f"  [{occ['file']}] StrRef {occ['strref']}, 위치 {occ['offset']}")
+        if len(occurrences) > 5:
+            print(f"  ... 외 {len(occurrences) - 5}건")
+        print()
+
+
+def write_report(report_path: Path, failures: list[dict]) -> None:
+    with open(report_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['File', 'StrRef', 'Offset', 'Char', 'CodePoint', 'Encoding', 'Suggestion'])
+        for failure in failures:
+            writer.writerow([failure['file'], failure['strref'], failure['offset'], failure['char'],
+                             f"U+{ord(failure['char']):04X}", failure['encoding'], failure['suggestion']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TLK 인코딩(CP949/CP1252) 사전 검사')
+    parser.add_argument('target', nargs='?', default=str(DIALOG_DIR),
+                        help='검사할 CSV 파일 또는 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--report', metavar='CSV',
+                        help='검사 결과 CSV 저장 경로')
+    args = parser.parse_args()
+
+    target = Path(args.target)
+    if target.is_file():
+        paths = [target]
+        print(f"검사 파일: {target}")
+    elif target.is_dir():
+        paths = csv_files(target)
+        print(f"검사 디렉토리: {target}")
+    else:
+        print(f"오류: 경로를 찾을 수 없습니다: {target}")
+        sys.exit(1)
+    print("-" * 60)
+
+    failures = find_encoding_failures(*load_texts(paths))
+    print(f"검사한 파일: {len(paths)}개")
+
+    if args.report:
+        write_report(Path(args.report), failures)
+        print(f"결과 저장: {args.report}")
+
+    if failures:
+        print_failures(failures)
+        sys.exit(1)
+    print("\n✅ 모든 텍스트를 TLK 인코딩(CP949/CP1252)으로 변환할 수 있습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,63 +8,111 @@ dialog_translated/ 디렉토리의 CSV 파일들에서 완성형 한글 2,350자
 사용법:
     python3 check_ksx1001.py                    # dialog_translated/ 전체 검사
     python3 check_ksx1001.py <csv_file>         # 특정 파일 검사
+    python3 check_ksx1001.py --jobs 4           # 프로세스 4개로 병렬 검사
+
+검사 결과는 파일 내용 해시별로 .cache/에 저장되어, 바뀌지 않은 파일은 다시 읽지 않습니다.
 """
 
-import csv
+import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from corpus import read_cache, write_cache
+from csv_rows import open_rows
+from ksx1001 import KSX1001_HANGUL, NON_KSX1001_PATTERN
 
-def get_ksx1001_hangul():
-    """KS X 1001에 정의된 완성형 한글 2,350자를 반환"""
-    hangul_chars = set()
-
-    # KS X 1001 한글 영역: EUC-KR 바이트 범위 0xB0A1-0xC8FE
-    for first in range(0xB0, 0xC9):
-        for second in range(0xA1, 0xFF):
-            if first == 0xC8 and second > 0xFE:
-                continue
-            try:
-                byte_seq = bytes([first, second])
-                char = byte_seq.decode('euc-kr')
-                if '\uAC00' <= char <= '\uD7A3':
-                    hangul_chars.add(char)
-            except:
-                pass
+CACHE_NAME = 'check_ksx1001.json'
+CACHE_VERSION = 2
+# 검사 패턴(완성형 테이블에서 생성)이 바뀌면 캐시된 결과 무효
+PATTERN_DIGEST = hashlib.blake2b(NON_KSX1001_PATTERN.pattern.encode('utf-8'), digest_size=16).hexdigest()
 
-    return hangul_chars
 
-
-def check_csv_file(csv_path: Path, ksx1001_hangul: set) -> dict:
+def check_csv_file(csv_path: Path) -> dict:
     """CSV 파일에서 완성형을 벗어나는 한글을 검사"""
     non_ksx1001_chars = {}
-
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row_num, row in enumerate(reader, start=2):
-            text = row.get('Text', '')
-            strref = row.get('StrRef', '')
-
-            for i, char in enumerate(text):
-                if '\uAC00' <= char <= '\uD7A3':  # 한글 음절
-                    if char not in ksx1001_hangul:
-                        if char not in non_ksx1001_chars:
-                            non_ksx1001_chars[char] = []
-                        context = text[max(0, i-10):i+11]
-                        non_ksx1001_chars[char].append({
-                            'file': csv_path.name,
-                            'row': row_num,
-                            'strref': strref,
-                            'context': context
-                        })
+    finditer = NON_KSX1001_PATTERN.finditer
+
+    with open_rows(csv_path, ('StrRef', 'Text')) as reader:
+        for row_num, (strref, text) in enumerate(reader, start=2):
+            # 정규식 한 번으로 행 전체를 훑음 (대부분의 행은 매치 없음)
+            for match in finditer(text):
+                char = match.group()
+                i = match.start()
+                if char not in non_ksx1001_chars:
+                    non_ksx1001_chars[char] = []
+                context = text[max(0, i-10):i+11]
+                non_ksx1001_chars[char].append({
+                    'file': csv_path.name,
+                    'row': row_num,
+                    'strref': strref,
+                    'context': context
+                })
 
     return non_ksx1001_chars
 
 
-def check_directory(dir_path: Path) -> bool:
+def file_digest(path: Path) -> str:
+    """파일 내용 해시 (캐시 키)"""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def load_result_cache() -> dict:
+    """파일 경로 → {'digest', 'result'} (완성형 테이블/검사 패턴이 바뀌면 무효)"""
+    data = read_cache(CACHE_NAME)
+    if not data or data.get('version') != CACHE_VERSION or data.get('pattern') != PATTERN_DIGEST:
+        return {}
+    return data['files']
+
+
+def check_files(csv_files: list[Path], jobs: int = 1) -> list[dict]:
+    """파일별 검사 결과 (입력 순서 유지)
+
+    내용 해시가 캐시와 같은 파일은 건너뛰고, 나머지는 jobs개 프로세스로 나눠 검사합니다.
+    """
+    cache = load_result_cache()
+    results: list[dict | None] = []
+    pending = []
+    digests = {}
+    for index, csv_file in enumerate(csv_files):
+        key = str(csv_file.resolve())
+        digest = file_digest(csv_file)
+        digests[key] = digest
+        entry = cache.get(key)
+        if entry and entry['digest'] == digest:
+            results.append(entry['result'])
+        else:
+            results.append(None)
+            pending.append(index)
+
+    if pending:
+        paths = [csv_files[index] for index in pending]
+        if jobs > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                fresh = list(executor.map(check_csv_file, paths, chunksize=16))
+        else:
+            fresh = [check_csv_file(path) for path in paths]
+        for index, result in zip(pending, fresh):
+            results[index] = result
+
+        for csv_file, result in zip(csv_files, results):
+            key = str(csv_file.resolve())
+            cache[key] = {'digest': digests[key], 'result': result}
+        write_cache(CACHE_NAME, {
+            'version': CACHE_VERSION,
+            'pattern': PATTERN_DIGEST,
+            'files': cache,
+        })
+
+    return results
+
+
+def check_directory(dir_path: Path, jobs: int = 1) -> bool:
     """디렉토리 내 모든 CSV 파일 검사"""
-    ksx1001_hangul = get_ksx1001_hangul()
-    print(f"KS X 1001 완성형 한글: {len(ksx1001_hangul)}자")
+    print(f"KS X 1001 완성형 한글: {len(KSX1001_HANGUL)}자")
     print(f"검사 디렉토리: {dir_path}")
     print("-" * 60)
 
@@ -76,8 +124,7 @@ def check_directory(dir_path: Path) -> bool:
     all_non_ksx1001 = {}
     files_checked = 0
 
-    for csv_file in csv_files:
-        result = check_csv_file(csv_file, ksx1001_hangul)
+    for result in check_files(csv_files, jobs):
         files_checked += 1
 
         for char, occurrences in result.items():
@@ -113,14 +160,20 @@ def main():
     translate_dir = script_dir.parent
     default_dir = translate_dir / "dialog_translated"
 
-    if len(sys.argv) > 1:
-        target = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(description='완성형 한글(KS X 1001) 검사')
+    parser.add_argument('target', nargs='?',
+                        help='검사할 CSV 파일 또는 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='병렬 검사 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    if args.target:
+        target = Path(args.target)
         if target.is_file():
-            ksx1001_hangul = get_ksx1001_hangul()
-            print(f"KS X 1001 완성형 한글: {len(ksx1001_hangul)}자")
+            print(f"KS X 1001 완성형 한글: {len(KSX1001_HANGUL)}자")
             print(f"검사 파일: {target}")
             print("-" * 60)
-            result = check_csv_file(target, ksx1001_hangul)
+            result = check_files([target])[0]
             if result:
                 total = sum(len(v) for v in result.values())
                 print(f"\n⚠️  완성형을 벗어나는 한글: {len(result)}종, {total}회")
@@ -129,7 +182,7 @@ def main():
                 print("\n✅ 모든 한글이 완성형 범위 내에 있습니다.")
                 sys.exit(0)
         elif target.is_dir():
-            success = check_directory(target)
+            success = check_directory(target, args.jobs)
             sys.exit(0 if success else 1)
         else:
             print(f"오류: 경로를 찾을 수 없습니다: {target}")
@@ -138,7 +191,7 @@ def main():
         if not default_dir.exists():
             print(f"오류: 디렉토리를 찾을 수 없습니다: {default_dir}")
             sys.exit(1)
-        success = check_directory(default_dir)
+        success = check_directory(default_dir, args.jobs)
         sys.exit(0 if success else 1)
 
 
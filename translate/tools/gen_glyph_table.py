@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+한글 글리프 테이블 생성 스크립트 (mac/hook/korean_glyph_table.h)
+
+번역 코퍼스에서 실제로 쓰이는 완성형 한글만 모아 폰트 베이크 목록을 만들고,
+CP949 코드(KS X 1001 순번) → 글리프 인덱스 재배치 테이블을 함께 생성합니다.
+훅을 KOREAN_GLYPH_SUBSET으로 빌드하면 2,350자 전체 대신 이 목록만 베이크하고,
+install.py의 트램폴린도 같은 재배치 테이블로 글리프 인덱스를 조회합니다.
+
+기본 배치는 빈도순입니다. 자주 쓰는 글자가 아틀라스 앞쪽 몇 줄에 모이므로
+텍스트를 그릴 때 텍스처 캐시 지역성이 좋아집니다 (char_stats.py 통계 사용).
+
+사용법:
+    python3 gen_glyph_table.py                          # dialog_translated/ 기준 생성 (빈도순)
+    python3 gen_glyph_table.py --order code             # 완성형 코드 순서로 배치
+    python3 gen_glyph_table.py --all                    # 안 쓰는 글자도 뒤쪽에 포함 (채팅 입력용)
+    python3 gen_glyph_table.py --extra ui_strings.txt   # 추가 텍스트의 글자도 포함
+    python3 gen_glyph_table.py --output <header.h>      # 출력 경로 지정
+"""
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from char_stats import corpus_stats
+from corpus import DIALOG_DIR, TRANSLATE_DIR, csv_files
+from ksx1001 import GLYPH_BASE_INDEX, KSX1001_HANGUL, KSX1001_SET
+
+DEFAULT_OUTPUT = TRANSLATE_DIR.parent / "mac" / "hook" / "korean_glyph_table.h"
+# 베이크하지 않은 글자의 글리프 인덱스
+MISSING_GLYPH = ord('?')
+# 아틀라스 배치 추정값 (훅의 4096x4096 텍스처)
+ATLAS_SIZE = 4096
+DEFAULT_CELL_SIZE = 64
+
+
+def collect_usage(paths: list[Path], extra_files: list[Path] = ()) -> Counter:
+    """완성형 한글 → 코퍼스 Text 사용 횟수 (추가 텍스트 파일의 글자는 0회로 포함)"""
+    stats, _ = corpus_stats(paths)
+    usage = Counter({char: count for char, count in stats.hangul().items() if char in KSX1001_SET})
+    for path in extra_files:
+        for char in set(path.read_text(encoding='utf-8')) & KSX1001_SET:
+            usage.setdefault(char, 0)
+    return usage
+
+
+def build_layout(usage: Counter, order: str = 'frequency',
+                 include_all: bool = False) -> tuple[list[str], list[int]]:
+    """(베이크 목록, KS X 1001 순번 → 글리프 인덱스)
+
+    order='frequency'면 사용 횟수 내림차순(같으면 코드 순), 'code'면 완성형 코드 순서.
+    include_all이면 안 쓰는 글자도 사용 글자 뒤에 코드 순서로 붙입니다.
+    """
+    if order == 'frequency':
+        bake_list = sorted(usage, key=lambda char: (-usage[char], char))
+    else:
+        bake_list = [char for char in KSX1001_HANGUL if char in usage]
+    if include_all:
+        bake_list += [char for char in KSX1001_HANGUL if char not in usage]
+    slots = {char: GLYPH_BASE_INDEX + index for index, char in enumerate(bake_list)}
+    remap = [slots.get(char, MISSING_GLYPH) for char in KSX1001_HANGUL]
+    return bake_list, remap
+
+
+def plan_atlas(bake_list: list[str], usage: Counter, cell_size: int = DEFAULT_CELL_SIZE,
+               thresholds: tuple[float, ...] = (0.9, 0.99, 0.999)) -> dict:
+    """아틀라스 줄 배치 추정
+
+    셀 크기로 한 줄에 들어가는 글리프 수를 구하고, 사용 빈도 누적 비율별로
+    가장 자주 쓰는 글자들이 차지하는 줄 수를 이 배치와 코드 순서 배치에서 비교합니다.
+    """
+    per_row = max(1, ATLAS_SIZE // cell_size)
+    total_glyphs = GLYPH_BASE_INDEX + len(bake_list)
+    code_order = [char for char in KSX1001_HANGUL if char in set(bake_list)]
+    rows_of = {
+        'layout': {char: (GLYPH_BASE_INDEX + i) // per_row for i, char in enumerate(bake_list)},
+        'code': {char: (GLYPH_BASE_INDEX + i) // per_row for i, char in enumerate(code_order)},
+    }
+
+    ranked = [char for char, count in usage.most_common() if count > 0]
+    total_uses = sum(usage.values())
+    hot_rows = []
+    covered = 0
+    index = 0
+    for threshold in thresholds:
+        while index < len(ranked) and covered < threshold * total_uses:
+            covered += usage[ranked[index]]
+            index += 1
+        hot = ranked[:index]
+        hot_rows.append({
+            'coverage': threshold,
+            'glyphs': len(hot),
+            'rows': len({rows_of['layout'][char] for char in hot}),
+            'code_order_rows': len({rows_of['code'][char] for char in hot}),
+        })
+
+    return {
+        'cell_size': cell_size,
+        'per_row': per_row,
+        'rows': -(-total_glyphs // per_row),
+        'hot_rows': hot_rows,
+    }
+
+
+def format_array(values: list[int], digits: int, per_line: int) -> list[str]:
+    lines = []
+    for i in range(0, len(values), per_line):
+        chunk = values[i:i + per_line]
+        lines.append('    ' + ''.join(f'0x{value:0{digits}X}, ' for value in chunk))
+    return lines
+
+
+def render_header(bake_list: list[str], remap: list[int], order: str, plan: dict) -> str:
+    char_count = len(bake_list)
+    total = GLYPH_BASE_INDEX + char_count
+    order_name = '사용 빈도순' if order == 'frequency' else '완성형 코드 순서'
+    lines = [
+        '/**',
+        ' * NWN:EE 한글 글리프 테이블 (자동 생성)',
+        ' *',
+        ' * 번역 코퍼스에서 실제 사용되는 완성형 한글만 포함',
+        f' * 총 {total}자 (ASCII {GLYPH_BASE_INDEX} + 한글 {char_count})',
+        f' * 배치: {order_name}',
+        f' * 아틀라스 추정 ({plan["cell_size"]}px 셀, 줄당 {plan["per_row"]}자, {plan["rows"]}줄):',
+        *(f' *   사용량 {row["coverage"] * 100:g}%: {row["glyphs"]}자 → {row["rows"]}줄'
+          f' (코드 순서 {row["code_order_rows"]}줄)' for row in plan['hot_rows']),
+        ' *',
+        ' * 생성: python3 translate/tools/gen_glyph_table.py',
+        ' */',
+        '',
+        '#ifndef KOREAN_GLYPH_TABLE_H',
+        '#define KOREAN_GLYPH_TABLE_H',
+        '',
+        '#include <stdint.h>',
+        '',
+        '// 글리프 개수',
+        f'#define KOREAN_GLYPH_TOTAL {total}',
+        f'#define KOREAN_CHAR_COUNT {char_count}',
+        f'#define KSX1001_REMAP_COUNT {len(remap)}',
+        '',
+        '// 베이크용 유니코드 배열 (한글 부분만, ASCII는 원본 사용)',
+        '// 글리프 인덱스 = 256 + 배열 위치',
+        'static const uint32_t korean_unicodes[KOREAN_CHAR_COUNT] = {',
+        *format_array([ord(char) for char in bake_list], 4, 10),
+        '};',
+        '',
+        '// 글리프 인덱스 재배치 테이블 (트램펄린에서 ldrh 한 번으로 조회)',
+        '// 순번 = (lead - 0xB0) * 94 + (trail - 0xA1), 베이크하지 않은 글자는 \'?\'',
+        '__attribute__((used))',
+        'static const uint16_t ksx1001_glyph_remap[KSX1001_REMAP_COUNT] = {',
+        *format_array(remap, 4, 16),
+        '};',
+        '',
+        '/**',
+        ' * CP949 2바이트를 글리프 인덱스로 변환',
+        ' * @return 글리프 인덱스 (256+), 미지원 문자는 \'?\' 반환',
+        ' */',
+        'static inline uint16_t cp949_to_glyph_index(uint8_t lead, uint8_t trail) {',
+        '    if (lead >= 0xB0 && lead <= 0xC8 && trail >= 0xA1 && trail <= 0xFE) {',
+        '        return ksx1001_glyph_remap[(lead - 0xB0) * 94 + (trail - 0xA1)];',
+        '    }',
+        '    return \'?\';  // 미지원 문자',
+        '}',
+        '',
+        '#endif // KOREAN_GLYPH_TABLE_H',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='한글 글리프 테이블(korean_glyph_table.h) 생성')
+    parser.add_argument('dialog_dir', nargs='?', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--order', choices=('frequency', 'code'), default='frequency',
+                        help='글리프 배치 순서 (기본: frequency)')
+    parser.add_argument('--all', action='store_true',
+                        help='코퍼스에 없는 완성형 글자도 뒤쪽에 포함')
+    parser.add_argument('--cell-size', type=int, default=DEFAULT_CELL_SIZE,
+                        help=f'아틀라스 배치 추정용 글리프 셀 크기 (기본: {DEFAULT_CELL_SIZE}px)')
+    parser.add_argument('--extra', action='append', default=[], metavar='TXT',
+                        help='글자를 추가로 포함할 UTF-8 텍스트 파일 (여러 번 지정 가능)')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT),
+                        help='출력 헤더 경로 (기본: mac/hook/korean_glyph_table.h)')
+    args = parser.parse_args()
+
+    dialog_dir = Path(args.dialog_dir)
+    if not dialog_dir.is_dir():
+        print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+        sys.exit(1)
+
+    usage = collect_usage(csv_files(dialog_dir), [Path(path) for path in args.extra])
+    bake_list, remap = build_layout(usage, args.order, args.all)
+    plan = plan_atlas(bake_list, usage, args.cell_size)
+
+    output = Path(args.output)
+    output.write_text(render_header(bake_list, remap, args.order, plan), encoding='utf-8')
+    print(f"사용 한글: {len(usage)}자 / 완성형 {len(KSX1001_HANGUL)}자")
+    print(f"베이크 글리프: {GLYPH_BASE_INDEX + len(bake_list)}개 (전체 베이크 대비 "
+          f"{len(KSX1001_HANGUL) - len(bake_list)}자 감소)")
+    print(f"아틀라스 추정: 셀 {plan['cell_size']}px, 줄당 {plan['per_row']}자, {plan['rows']}줄")
+    for row in plan['hot_rows']:
+        print(f"  사용량 {row['coverage'] * 100:g}%: {row['glyphs']}자 → {row['rows']}줄 "
+              f"(코드 순서 배치 {row['code_order_rows']}줄)")
+    print(f"생성 완료: {output}")
+
+
+if __name__ == '__main__':
+    main()
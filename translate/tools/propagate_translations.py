@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+동일 원문 번역 일괄 전파 스크립트
+
+영어 원문(TextEng)이 같은 StrRef들 중 번역된 것이 있으면, 아직 번역되지 않은
+형제 StrRef에 같은 번역을 채웁니다. 형제끼리 번역이 서로 다른 원문은 불일치로 보고합니다.
+
+사용법:
+    python3 propagate_translations.py                       # 미리보기 (파일 변경 없음)
+    python3 propagate_translations.py --apply               # CSV에 반영
+    python3 propagate_translations.py --report report.csv   # 번역 불일치 보고서 저장
+    python3 propagate_translations.py --apply --use-majority  # 불일치 원문도 다수 번역으로 채움
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from corpus import DIALOG_DIR, corpus_signature, csv_files, load_records
+from edit_journal import JOURNAL_PATH, apply_file_edits, compacting_path, pending_edits
+from translation_memory import TranslationMemory, plan_propagation
+
+
+def load_memory(files: list[Path], records) -> TranslationMemory:
+    """캐시가 최신이면 재사용, 아니면 새로 만들어 캐시에 저장"""
+    signature = corpus_signature(files)
+    memory = TranslationMemory.load(signature)
+    if memory is None:
+        memory = TranslationMemory.build(records, signature)
+        memory.save()
+        print("번역 메모리 인덱스 생성 (캐시 저장)")
+    else:
+        print("번역 메모리 인덱스 캐시 사용")
+    return memory
+
+
+def apply_fills(dialog_dir: Path, fills: list[dict]) -> int:
+    """파일별로 한 번씩, 채운 행의 바이트만 바꿔 번역 반영 (나머지 행은 그대로)"""
+    by_file: dict[str, dict[str, dict[str, str]]] = {}
+    for fill in fills:
+        by_file.setdefault(fill['file'], {})[fill['strref']] = {'Text': fill['text']}
+
+    updated = 0
+    for filename, changes in sorted(by_file.items()):
+        updated += apply_file_edits(dialog_dir / filename, changes)
+        print(f"  {filename}: {len(changes)}개")
+    return updated
+
+
+def write_report(report_path: Path, conflicts: list[dict]) -> None:
+    """번역 불일치 보고서 (원문, 번역, 사용 횟수, StrRef 목록)"""
+    with open(report_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['TextEng', 'Text', 'Count', 'StrRefs'])
+        for conflict in conflicts:
+            strrefs = ' '.join(f"{strref}({source})" for strref, source in conflict['members'])
+            for text, count in conflict['translations']:
+                writer.writerow([conflict['source'], text, count, strrefs])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동일 원문 번역 일괄 전파')
+    parser.add_argument('dialog_dir', nargs='?', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--apply', action='store_true',
+                        help='CSV 파일에 반영 (없으면 미리보기만)')
+    parser.add_argument('--use-majority', action='store_true',
+                        help='형제 번역이 서로 다르면 가장 많이 쓰인 번역으로 채움')
+    parser.add_argument('--report', metavar='CSV',
+                        help='번역 불일치 보고서 저장 경로')
+    args = parser.parse_args()
+
+    dialog_dir = Path(args.dialog_dir)
+    if not dialog_dir.is_dir():
+        print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+        sys.exit(1)
+
+    # 저널 편집이 남아 있으면 미번역 판단이 틀리고, 나중에 압축될 때 채운 번역을 덮어쓸 수 있음
+    if dialog_dir.resolve() == DIALOG_DIR.resolve() and (pending_edits() or compacting_path(JOURNAL_PATH).exists()):
+        if args.apply:
+            print("오류: CSV에 반영되지 않은 편집 저널이 있습니다. 먼저 'python3 edit_journal.py --compact'를 실행하세요.")
+            sys.exit(1)
+        print("경고: CSV에 반영되지 않은 편집 저널이 있습니다 (미리보기는 CSV 기준).")
+
+    files = csv_files(dialog_dir)
+    records = load_records(files)
+    memory = load_memory(files, records)
+    print(f"동일 원문 그룹: {len(memory.groups)}개 ({memory.sibling_count()}개 StrRef)")
+
+    fills, conflicts = plan_propagation(memory, records, use_majority=args.use_majority)
+    print(f"채울 수 있는 미번역 형제: {len(fills)}개")
+    print(f"번역 불일치 원문: {len(conflicts)}개")
+
+    for fill in fills[:10]:
+        print(f"  [{fill['file']}] StrRef {fill['strref']}: {fill['source'][:40]} → {fill['text'][:40]}")
+    if len(fills) > 10:
+        print(f"  ... 외 {len(fills) - 10}개")
+
+    if args.report:
+        write_report(Path(args.report), conflicts)
+        print(f"\n불일치 보고서 저장: {args.report}")
+
+    if args.apply and fills:
+        print("\n반영 중...")
+        updated = apply_fills(dialog_dir, fills)
+        print(f"✅ {updated}개 StrRef 번역 반영")
+    elif fills:
+        print("\n미리보기만 했습니다. 반영하려면 --apply 옵션을 사용하세요.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+코퍼스 전체 정규식 찾아 바꾸기
+
+모든 번역 CSV에서 정규식으로 찾아 바꿉니다. 기본은 미리보기(파일 변경 없음)로
+파일별 바꿀 행/치환 수와 바뀌는 행의 전후(-/+)를 보여 주고, --apply면 반영합니다.
+기본 대상 컬럼은 Text이며 --fields로 바꿀 수 있습니다.
+
+패턴은 작업 프로세스마다 한 번만 컴파일하고 파일들을 병렬로 처리합니다. 반영할 때는
+파일마다 바뀐 행의 바이트만 갈아 끼워 한 번만 쓰고(임시 파일 → 원자적 교체),
+나머지 행은 그대로 둡니다.
+
+사용법:
+    python3 replace_text.py '드워프' '드워프족'                 # 미리보기
+    python3 replace_text.py '(\\d)\\s+개' '\\1개' --apply       # 반영
+    python3 replace_text.py 'Neverwinter' '네버윈터' --fields Text,SpeakerName
+    python3 replace_text.py '...' '...' --literal --ignore-case --show 50
+"""
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from corpus import DIALOG_DIR, csv_files
+from csv_rows import open_rows
+from edit_journal import JOURNAL_PATH, apply_file_edits, compacting_path, pending_edits
+
+# 작업 프로세스별 (컴파일된 패턴, 바꿀 문자열, 대상 컬럼, 반영 여부)
+_job: tuple[re.Pattern, str, tuple[str, ...], bool] | None = None
+
+
+def init_job(pattern: str, flags: int, replacement: str, fields: tuple[str, ...], apply: bool) -> None:
+    """작업 프로세스 초기화 (패턴은 여기서 한 번만 컴파일)"""
+    global _job
+    _job = (re.compile(pattern, flags), replacement, fields, apply)
+
+
+def replace_file(path: Path) -> dict:
+    """파일 하나 찾아 바꾸기
+
+    Returns:
+        {'file', 'rows': 바뀐 행 수, 'count': 치환 수,
+         'changes': [(StrRef, 컬럼, 이전, 이후), ...]}
+    """
+    pattern, replacement, fields, apply = _job
+    changes: dict[str, dict[str, str]] = {}
+    previews = []
+    count = 0
+    with open_rows(path, ('StrRef',) + fields, keep_newlines=True) as reader:
+        for strref, *values in reader:
+            for field, value in zip(fields, values):
+                if not value:
+                    continue
+                new, n = pattern.subn(replacement, value)
+                if n and new != value:
+                    changes.setdefault(strref, {})[field] = new
+                    previews.append((strref, field, value, new))
+                    count += n
+
+    rows = len(changes)
+    if apply and changes:
+        rows = apply_file_edits(path, changes)
+    return {'file': path.name, 'rows': rows, 'count': count, 'changes': previews}
+
+
+def replace_files(paths: list[Path], pattern: str, flags: int, replacement: str,
+                  fields: tuple[str, ...], apply: bool = False, jobs: int = 1) -> list[dict]:
+    """파일별 결과 (입력 순서 유지, 바뀌는 파일만)"""
+    args = (pattern, flags, replacement, fields, apply)
+    if jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_job, initargs=args) as executor:
+            results = list(executor.map(replace_file, paths, chunksize=16))
+    else:
+        init_job(*args)
+        results = [replace_file(path) for path in paths]
+    return [result for result in results if result['rows']]
+
+
+def show_change(name: str, strref: str, field: str, old: str, new: str) -> None:
+    """바뀌는 행의 전후 표시 (여러 줄 값은 줄마다)"""
+    label = f" ({field})" if field != 'Text' else ""
+    print(f"\n[{name}] StrRef {strref}{label}")
+    for line in old.splitlines() or ['']:
+        print(f"  - {line}")
+    for line in new.splitlines() or ['']:
+        print(f"  + {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='코퍼스 전체 정규식 찾아 바꾸기')
+    parser.add_argument('pattern', help='찾을 정규식 (--literal이면 일반 문자열)')
+    parser.add_argument('replacement', help=r'바꿀 문자열 (정규식 그룹 참조 \1, \g<name> 사용 가능)')
+    parser.add_argument('--dir', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--fields', default='Text',
+                        help='대상 컬럼, 쉼표로 구분 (기본: Text)')
+    parser.add_argument('--literal', action='store_true', help='패턴을 일반 문자열로 취급')
+    parser.add_argument('--ignore-case', '-i', action='store_true', help='대소문자 무시')
+    parser.add_argument('--apply', action='store_true', help='CSV 파일에 반영 (없으면 미리보기만)')
+    parser.add_argument('--show', type=int, default=20,
+                        help='미리보기로 보여 줄 바뀌는 행 수 (기본: 20, -1이면 전부)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='병렬 처리 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    dialog_dir = Path(args.dir)
+    if not dialog_dir.is_dir():
+        print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+        sys.exit(1)
+
+    fields = tuple(field.strip() for field in args.fields.split(',') if field.strip())
+    if not fields or 'StrRef' in fields:
+        print("오류: --fields에는 StrRef가 아닌 컬럼을 하나 이상 지정하세요.")
+        sys.exit(1)
+
+    pattern = re.escape(args.pattern) if args.literal else args.pattern
+    flags = re.IGNORECASE if args.ignore_case else 0
+    try:
+        re.compile(pattern, flags).sub(args.replacement, '')
+    except re.error as e:
+        print(f"오류: 잘못된 정규식 또는 바꿀 문자열: {e}")
+        sys.exit(1)
+
+    # 저널 편집이 남아 있으면 나중에 압축될 때 이 치환을 덮어쓸 수 있음
+    if dialog_dir.resolve() == DIALOG_DIR.resolve() and (pending_edits() or compacting_path(JOURNAL_PATH).exists()):
+        if args.apply:
+            print("오류: CSV에 반영되지 않은 편집 저널이 있습니다. 먼저 'python3 edit_journal.py --compact'를 실행하세요.")
+            sys.exit(1)
+        print("경고: CSV에 반영되지 않은 편집 저널이 있습니다 (미리보기는 CSV 기준).")
+
+    paths = csv_files(dialog_dir)
+    results = replace_files(paths, pattern, flags, args.replacement, fields, args.apply, args.jobs)
+
+    total_rows = sum(result['rows'] for result in results)
+    total_count = sum(result['count'] for result in results)
+    if not results:
+        print(f"일치하는 행이 없습니다 ({len(paths)}개 파일, 컬럼: {', '.join(fields)})")
+        return
+
+    shown = 0
+    for result in results:
+        for change in result['changes']:
+            if args.show >= 0 and shown >= args.show:
+                break
+            show_change(result['file'], *change)
+            shown += 1
+    hidden = sum(len(result['changes']) for result in results) - shown
+    if hidden:
+        print(f"\n  ... 외 {hidden}개 행")
+
+    print("\n파일별 바뀌는 행:")
+    for result in results:
+        print(f"  {result['file']}: {result['rows']}행 ({result['count']}곳)")
+    print(f"\n합계: {len(results)}개 파일, {total_rows}행, {total_count}곳")
+
+    if args.apply:
+        print(f"✅ {len(results)}개 파일에 반영")
+    else:
+        print("\n미리보기만 했습니다. 반영하려면 --apply 옵션을 사용하세요.")
+
+
+if __name__ == '__main__':
+    main()
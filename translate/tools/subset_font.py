@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+릴리스 폰트 서브셋 스크립트
+
+한글 폰트에는 현대 한글 11,172자와 한자 등 게임에서 쓰지 않는 글리프가 많으므로,
+ASCII/Latin-1(CP1252 포함)과 번역 코퍼스에서 실제로 쓰이는 문자만 남겨 용량을 줄입니다.
+결과는 .cache/fonts/에 (폰트 해시, 문자 집합 해시)로 저장해 두고, 폰트와 코퍼스
+문자 집합이 그대로면 다시 만들지 않습니다. 네트워크 없이 fontTools만 사용합니다.
+
+사용법:
+    python3 subset_font.py <font.ttf> --output <out.ttf>              # 코퍼스 문자만 포함
+    python3 subset_font.py <font.ttf> --output <out.ttf> --all-hangul # 완성형 2,350자 전체 포함
+    python3 subset_font.py <font.ttf> --output <out.ttf> --extra ui_strings.txt
+
+fontTools가 없으면 종료 코드 2로 끝납니다 (pip install fonttools).
+"""
+
+import argparse
+import hashlib
+import shutil
+import sys
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from char_stats import corpus_stats
+from corpus import CACHE_DIR, DIALOG_DIR, csv_files
+from ksx1001 import KSX1001_HANGUL
+
+FONT_CACHE_DIR = CACHE_DIR / "fonts"
+# 서브셋 옵션을 바꾸면 올려서 기존 캐시를 무효화
+SUBSET_VERSION = 1
+# fontTools 미설치
+EXIT_NO_FONTTOOLS = 2
+
+# 항상 포함: ASCII 출력 문자, CP1252 0x80-0x9F 구간(번역 안 된 영문 문자열), Latin-1
+BASE_CHARS = (
+    ''.join(map(chr, range(0x20, 0x7F)))
+    + bytes(range(0x80, 0xA0)).decode('cp1252', errors='ignore')
+    + ''.join(map(chr, range(0xA0, 0x100)))
+)
+
+
+def file_digest(path: Path) -> str:
+    """폰트 파일 내용 해시"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def collect_codepoints(paths: list[Path], extra_files: list[Path] = (),
+                       all_hangul: bool = False) -> list[int]:
+    """서브셋에 남길 코드 포인트 (정렬)"""
+    stats, _ = corpus_stats(paths)
+    chars = set(BASE_CHARS)
+    chars.update(stats.chars)
+    for path in extra_files:
+        chars.update(path.read_text(encoding='utf-8'))
+    if all_hangul:
+        chars.update(KSX1001_HANGUL)
+    # 제어 문자(줄바꿈 등)는 글리프가 필요 없음
+    return sorted(ord(char) for char in chars if unicodedata.category(char)[0] != 'C')
+
+
+def codepoints_digest(codepoints: list[int]) -> str:
+    data = f'{SUBSET_VERSION}:' + ','.join(map(str, codepoints))
+    return hashlib.blake2b(data.encode('ascii'), digest_size=16).hexdigest()
+
+
+def subset_font(font_path: Path, codepoints: list[int]) -> tuple[Path, bool]:
+    """캐시된 서브셋 경로 (없으면 생성)
+
+    Returns:
+        (서브셋 폰트 경로, 새로 생성했는지)
+    """
+    font_key = file_digest(font_path)
+    cache_path = FONT_CACHE_DIR / f"{font_key}-{codepoints_digest(codepoints)}{font_path.suffix}"
+    if cache_path.exists():
+        return cache_path, False
+
+    from fontTools import subset
+
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.notdef_outline = True
+    options.glyph_names = False
+
+    font = subset.load_font(str(font_path), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+    subset.save_font(font, str(tmp_path), options)
+    font.close()
+    tmp_path.replace(cache_path)
+
+    # 같은 폰트의 이전 문자 집합 서브셋 정리
+    for old in FONT_CACHE_DIR.glob(f"{font_key}-*"):
+        if old != cache_path:
+            old.unlink()
+    return cache_path, True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='릴리스 폰트 서브셋 (ASCII/Latin-1 + 코퍼스 문자)')
+    parser.add_argument('font', help='원본 폰트 (.ttf/.otf)')
+    parser.add_argument('--output', required=True,
+                        help='서브셋 폰트 저장 경로')
+    parser.add_argument('--dialog-dir', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--all-hangul', action='store_true',
+                        help='코퍼스에 없는 완성형 한글도 포함 (채팅 입력, 전체 베이크 훅용)')
+    parser.add_argument('--extra', action='append', default=[], metavar='TXT',
+                        help='글자를 추가로 포함할 UTF-8 텍스트 파일 (여러 번 지정 가능)')
+    args = parser.parse_args()
+
+    font_path = Path(args.font)
+    dialog_dir = Path(args.dialog_dir)
+    if not font_path.is_file():
+        print(f"오류: 폰트 파일을 찾을 수 없습니다: {font_path}")
+        sys.exit(1)
+    if not dialog_dir.is_dir():
+        print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+        sys.exit(1)
+
+    try:
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("오류: fontTools가 설치되어 있지 않습니다 (pip install fonttools)")
+        sys.exit(EXIT_NO_FONTTOOLS)
+
+    codepoints = collect_codepoints(csv_files(dialog_dir), [Path(path) for path in args.extra],
+                                    args.all_hangul)
+    cache_path, created = subset_font(font_path, codepoints)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(cache_path, output)
+
+    source_size = font_path.stat().st_size / 1024 / 1024
+    subset_size = output.stat().st_size / 1024 / 1024
+    print(f"포함 문자: {len(codepoints)}자{' (완성형 한글 전체 포함)' if args.all_hangul else ''}")
+    print(f"서브셋{'' if created else ' (캐시)'}: {font_path.name} {source_size:.1f} MB → "
+          f"{subset_size:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
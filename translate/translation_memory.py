@@ -0,0 +1,127 @@
+"""
+번역 메모리: 영어 원문(TextEng)이 같은 StrRef 묶음 인덱스
+
+정규화한 TextEng의 해시를 키로 같은 원문을 가진 (StrRef, 파일) 목록을 모읍니다.
+병합 시 O(n) 한 번으로 만들어 .cache/에 저장하고, 일괄 전파 도구
+(tools/propagate_translations.py)와 편집기의 "동일 원문" 표시에 사용합니다.
+"""
+
+import hashlib
+import re
+from collections import Counter
+
+from corpus import read_cache, write_cache
+from record_store import RecordStore
+
+CACHE_NAME = 'translation_memory.json'
+CACHE_VERSION = 1
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_source(text: str) -> str:
+    """원문 정규화 (공백 정리)"""
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def source_key(text_eng: str) -> str | None:
+    """정규화한 원문의 해시 키. 비어 있거나 숫자 코드뿐이면 None"""
+    normalized = normalize_source(text_eng)
+    if not normalized or normalized.isdigit():
+        return None
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def is_translated(text: str, text_eng: str) -> bool:
+    """번역 여부 (비어 있거나 공백만 빼고 원문과 같으면 미번역)"""
+    return bool(text) and text != text_eng and normalize_source(text) != normalize_source(text_eng)
+
+
+class TranslationMemory:
+    """원문 해시 → [[StrRef, 파일명], ...] (형제가 2개 이상인 원문만 보관)"""
+
+    def __init__(self, groups: dict[str, list[list[str]]], signature: dict | None = None):
+        self.groups = groups
+        self.signature = signature
+
+    @classmethod
+    def build(cls, records: RecordStore, signature: dict | None = None) -> 'TranslationMemory':
+        """레코드 저장소에서 O(n)으로 인덱스 생성"""
+        buckets: dict[str, list[list[str]]] = {}
+        for strref, text_eng, source in zip(records.column('StrRef'), records.column('TextEng'),
+                                            records.sources):
+            key = source_key(text_eng)
+            if key:
+                buckets.setdefault(key, []).append([strref, source])
+        groups = {key: members for key, members in buckets.items() if len(members) > 1}
+        return cls(groups, signature)
+
+    @classmethod
+    def load(cls, signature: dict | None = None) -> 'TranslationMemory | None':
+        """캐시에서 로드. signature가 주어지면 코퍼스가 바뀌지 않았을 때만 사용"""
+        data = read_cache(CACHE_NAME)
+        if not data or data.get('version') != CACHE_VERSION:
+            return None
+        if signature is not None and data.get('signature') != signature:
+            return None
+        return cls(data['groups'], data.get('signature'))
+
+    def save(self) -> None:
+        write_cache(CACHE_NAME, {
+            'version': CACHE_VERSION,
+            'signature': self.signature,
+            'groups': self.groups,
+        })
+
+    def siblings(self, text_eng: str, strref: str | None = None) -> list[list[str]]:
+        """같은 원문을 가진 다른 [StrRef, 파일명] 목록"""
+        key = source_key(text_eng)
+        members = self.groups.get(key, []) if key else []
+        return [member for member in members if member[0] != strref]
+
+    def sibling_count(self) -> int:
+        return sum(len(members) for members in self.groups.values())
+
+
+def plan_propagation(memory: TranslationMemory, records: RecordStore,
+                     use_majority: bool = False) -> tuple[list[dict], list[dict]]:
+    """미번역 형제 채우기 계획과 번역 불일치 목록
+
+    Returns:
+        (fills, conflicts)
+        fills: {'strref', 'file', 'text', 'source'} - 채울 번역
+        conflicts: {'source', 'translations', 'members'} - 형제 간 번역이 다른 원문
+    """
+    fills = []
+    conflicts = []
+
+    for members in memory.groups.values():
+        translations: Counter = Counter()
+        untranslated = []
+        text_eng = ''
+        for strref, source in members:
+            if strref not in records:
+                continue
+            record = records[strref]
+            text_eng = record.get('TextEng')
+            text = record.get('Text')
+            if is_translated(text, text_eng):
+                translations[text] += 1
+            else:
+                untranslated.append((strref, source))
+
+        if len(translations) > 1:
+            conflicts.append({
+                'source': text_eng,
+                'translations': translations.most_common(),
+                'members': members,
+            })
+            if not use_majority:
+                continue
+
+        if translations and untranslated:
+            best = translations.most_common(1)[0][0]
+            for strref, source in untranslated:
+                fills.append({'strref': strref, 'file': source, 'text': best, 'source': text_eng})
+
+    return fills, conflicts
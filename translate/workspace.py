@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+SQLite 번역 작업공간
+
+dialog_translated/의 CSV들을 SQLite 파일 하나(WAL 모드)로 가져와 편집기의 읽기/쓰기를
+인덱스 쿼리로 처리합니다. StrRef 조회는 B-tree 인덱스, 텍스트 검색은 FTS5 trigram
+색인(3자 이상, 없으면 전체 스캔)을 쓰므로 검색과 저장 비용이 코퍼스 크기가 아니라
+결과 크기에 비례합니다.
+
+저장한 행은 dirty로 표시되고, 내보내기는 dirty 행이 있는 파일에서 그 행의 바이트만
+바꿔 원래 CSV 배치(merge_dialog_files.py가 읽는 형식)로 되돌립니다 (--full이면 전체 파일을
+작업공간 내용으로 다시 씀). 가져오기는 시그니처가 바뀐 파일만 다시 읽고, 내보내지 않은
+편집이 있는 파일은 --force 없이는 덮어쓰지 않습니다.
+
+사용법:
+    python3 workspace.py import            # CSV → 작업공간 (바뀐 파일만)
+    python3 workspace.py export            # 편집한 행을 CSV에 반영
+    python3 workspace.py export --full --output out/   # 전체 CSV를 다른 디렉토리로 내보내기
+    python3 workspace.py status            # 가져온 파일/행, 내보내지 않은 편집 수
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Sequence
+
+from corpus import DIALOG_DIR, TRANSLATE_DIR, csv_files, file_signature
+from csv_rows import load_rows, row_type, write_rows
+from edit_journal import apply_file_edits
+
+WORKSPACE_PATH = TRANSLATE_DIR / "workspace.sqlite3"
+SCHEMA_VERSION = 1
+# trigram 색인이 쓰이는 최소 검색어 길이
+FTS_MIN_QUERY = 3
+# 편집기 전체 검색 결과 컬럼 (editor.SEARCH_FIELDS와 같은 순서)
+SEARCH_COLUMNS = ('strref', 'text', 'text_eng', 'speaker_type', 'speaker_name')
+# 이 수 이상의 파일을 한 번에 가져오면 행마다 트리거로 갱신하지 않고 FTS 색인을 다시 만듦
+BULK_IMPORT_FILES = 50
+FIELD_COLUMNS = {'Text': 'text', 'TextEng': 'text_eng'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    fieldnames TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL REFERENCES files(name),
+    row INTEGER NOT NULL,
+    strref TEXT NOT NULL,
+    text TEXT NOT NULL,
+    text_eng TEXT NOT NULL,
+    speaker_type TEXT NOT NULL,
+    speaker_name TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    dirty INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (file, row)
+);
+CREATE INDEX IF NOT EXISTS rows_strref ON rows (strref);
+CREATE INDEX IF NOT EXISTS rows_dirty ON rows (file) WHERE dirty;
+"""
+
+# 외부 콘텐츠 FTS5 테이블 (SQLite 3.34+ trigram)과 rows 동기화 트리거
+FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS rows_fts USING fts5(
+    text, text_eng, content='rows', content_rowid='id', tokenize='trigram'
+)
+"""
+FTS_TRIGGERS = {
+    'rows_ai': """CREATE TRIGGER IF NOT EXISTS rows_ai AFTER INSERT ON rows BEGIN
+    INSERT INTO rows_fts (rowid, text, text_eng) VALUES (new.id, new.text, new.text_eng);
+END""",
+    'rows_ad': """CREATE TRIGGER IF NOT EXISTS rows_ad AFTER DELETE ON rows BEGIN
+    INSERT INTO rows_fts (rows_fts, rowid, text, text_eng) VALUES ('delete', old.id, old.text, old.text_eng);
+END""",
+    'rows_au': """CREATE TRIGGER IF NOT EXISTS rows_au AFTER UPDATE OF text, text_eng ON rows BEGIN
+    INSERT INTO rows_fts (rows_fts, rowid, text, text_eng) VALUES ('delete', old.id, old.text, old.text_eng);
+    INSERT INTO rows_fts (rowid, text, text_eng) VALUES (new.id, new.text, new.text_eng);
+END""",
+}
+
+
+def _regexp(pattern: str, value: str) -> bool:
+    return re.search(pattern, value) is not None
+
+
+class Workspace:
+    """SQLite 작업공간 연결 (Streamlit 세션 스레드에서 공유하므로 잠금으로 직렬화)"""
+
+    def __init__(self, path: Path = WORKSPACE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.create_function('REGEXP', 2, _regexp, deterministic=True)
+        self.lock = threading.RLock()
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.execute(FTS_TABLE)
+            for trigger in FTS_TRIGGERS.values():
+                self.conn.execute(trigger)
+            self.fts = True
+        except sqlite3.OperationalError:
+            # FTS5/trigram이 없는 SQLite: 검색은 전체 스캔
+            self.fts = False
+        self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # 가져오기 / 내보내기
+
+    def import_csv(self, dialog_dir: Path = DIALOG_DIR, force: bool = False) -> dict[str, list[str]]:
+        """CSV 가져오기 (시그니처가 바뀐 파일만)
+
+        Returns:
+            {'imported': [...], 'removed': [...], 'conflicts': [...]}
+            conflicts: 내보내지 않은 편집이 있어 건너뛴 파일 (force면 덮어씀)
+        """
+        result = {'imported': [], 'removed': [], 'conflicts': []}
+        paths = {path.name: path for path in csv_files(dialog_dir)}
+        with self.lock:
+            stored = dict(self.conn.execute('SELECT name, signature FROM files'))
+            dirty = {name for name, in self.conn.execute('SELECT DISTINCT file FROM rows WHERE dirty')}
+
+            removed = []
+            changed = []
+            for name in sorted(set(stored) - set(paths)):
+                (result['conflicts'] if name in dirty and not force else removed).append(name)
+            for name, path in sorted(paths.items()):
+                signature = json.dumps(file_signature(path))
+                if stored.get(name) == signature:
+                    continue
+                if name in dirty and not force:
+                    result['conflicts'].append(name)
+                else:
+                    changed.append((name, path, signature))
+            bulk = self.fts and len(changed) >= BULK_IMPORT_FILES
+
+            self.conn.execute('BEGIN')
+            try:
+                if bulk:
+                    for trigger in FTS_TRIGGERS:
+                        self.conn.execute(f'DROP TRIGGER {trigger}')
+                for name in removed:
+                    self.conn.execute('DELETE FROM rows WHERE file = ?', (name,))
+                    self.conn.execute('DELETE FROM files WHERE name = ?', (name,))
+                    result['removed'].append(name)
+                for name, path, signature in changed:
+                    self._import_file(name, path, signature)
+                    result['imported'].append(name)
+                if bulk:
+                    self.conn.execute("INSERT INTO rows_fts (rows_fts) VALUES ('rebuild')")
+                    for trigger in FTS_TRIGGERS.values():
+                        self.conn.execute(trigger)
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('dialog_dir', ?)",
+                                  (str(dialog_dir.resolve()),))
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def _import_file(self, name: str, path: Path, signature: str) -> None:
+        # fields는 원본 그대로(내보내기용), 검색/편집 컬럼은 편집기와 같이 줄바꿈을 \n으로
+        fieldnames, rows = load_rows(path, keep_newlines=True)
+        positions = {field: pos for pos, field in enumerate(fieldnames)}
+
+        def column(values, field):
+            pos = positions.get(field)
+            return values[pos].replace('\r\n', '\n') if pos is not None else ''
+
+        self.conn.execute('DELETE FROM rows WHERE file = ?', (name,))
+        self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                          (name, json.dumps(fieldnames, ensure_ascii=False), signature))
+        self.conn.executemany(
+            'INSERT INTO rows (file, row, strref, text, text_eng, speaker_type, speaker_name, fields)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            ((name, index, column(values, 'StrRef'), column(values, 'Text'), column(values, 'TextEng'),
+              column(values, 'SpeakerType'), column(values, 'SpeakerName'),
+              json.dumps(values, ensure_ascii=False))
+             for index, values in enumerate(rows)))
+
+    def export_csv(self, dialog_dir: Path = DIALOG_DIR, full: bool = False) -> dict[str, int]:
+        """작업공간 → CSV (파일명 → 내보낸 행 수)
+
+        기본은 dirty 행만 원래 CSV에서 바이트 단위로 교체하고, full이면 모든 파일을
+        작업공간 내용으로 다시 씁니다 (파일/행 순서 고정이라 같은 내용이면 같은 결과).
+        """
+        exported = {}
+        with self.lock:
+            if full:
+                dialog_dir.mkdir(parents=True, exist_ok=True)
+                for name, fieldnames in self.conn.execute('SELECT name, fieldnames FROM files ORDER BY name').fetchall():
+                    fieldnames = json.loads(fieldnames)
+                    rows = self._file_values(name, fieldnames)
+                    write_rows(dialog_dir / name, fieldnames, rows)
+                    exported[name] = len(rows)
+            else:
+                changes: dict[str, dict[str, dict[str, str]]] = {}
+                for name, strref, text in self.conn.execute(
+                        'SELECT file, strref, text FROM rows WHERE dirty ORDER BY file, row'):
+                    changes.setdefault(name, {})[strref] = {'Text': text}
+                for name, file_changes in changes.items():
+                    path = dialog_dir / name
+                    if not path.exists():
+                        print(f"  [작업공간] 파일 없음, 편집 {len(file_changes)}건 건너뜀: {path}")
+                        continue
+                    exported[name] = apply_file_edits(path, file_changes)
+
+            # 가져온 디렉토리로 내보냈으면 쓴 파일을 다시 가져와 편집 완료 처리
+            source = self.conn.execute("SELECT value FROM meta WHERE key = 'dialog_dir'").fetchone()
+            if source and str(dialog_dir.resolve()) == source[0]:
+                self.conn.execute('BEGIN')
+                try:
+                    for name in exported:
+                        path = dialog_dir / name
+                        self._import_file(name, path, json.dumps(file_signature(path)))
+                    self.conn.execute('COMMIT')
+                except BaseException:
+                    self.conn.execute('ROLLBACK')
+                    raise
+        return exported
+
+    def _file_values(self, name: str, fieldnames: list[str]) -> list[list[str]]:
+        """파일의 전체 행 값 (편집한 행은 Text를 편집한 값으로)"""
+        text_pos = fieldnames.index('Text') if 'Text' in fieldnames else None
+        rows = []
+        for fields, text, dirty in self.conn.execute(
+                'SELECT fields, text, dirty FROM rows WHERE file = ? ORDER BY row', (name,)):
+            values = json.loads(fields)
+            if dirty and text_pos is not None:
+                values[text_pos] = text
+            rows.append(values)
+        return rows
+
+    @staticmethod
+    def _editor_row(fieldnames: list[str], values: list[str]) -> tuple:
+        """편집기 행 (load_rows 기본값과 같이 필드 안 줄바꿈은 \n)"""
+        return row_type(tuple(fieldnames))._make(value.replace('\r\n', '\n') for value in values)
+
+    # 편집기 읽기/쓰기
+
+    def file_names(self) -> list[str]:
+        with self.lock:
+            return [name for name, in self.conn.execute('SELECT name FROM files ORDER BY name')]
+
+    def file_rows(self, name: str) -> list[tuple]:
+        """파일의 행 (헤더 필드명을 속성으로 갖는 namedtuple)"""
+        with self.lock:
+            found = self.conn.execute('SELECT fieldnames FROM files WHERE name = ?', (name,)).fetchone()
+            if found is None:
+                return []
+            fieldnames = json.loads(found[0])
+            return [self._editor_row(fieldnames, values) for values in self._file_values(name, fieldnames)]
+
+    def row_count(self, name: str) -> int:
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM rows WHERE file = ?', (name,)).fetchone()[0]
+
+    def rows_at(self, name: str, indexes: Sequence[int]) -> list[tuple]:
+        """파일의 지정한 행 번호들만 (편집기 namedtuple 행)"""
+        with self.lock:
+            found = self.conn.execute('SELECT fieldnames FROM files WHERE name = ?', (name,)).fetchone()
+            if found is None:
+                return []
+            fieldnames = json.loads(found[0])
+            by_row = {}
+            for index, fields, text in self.conn.execute(
+                    f"SELECT row, fields, text FROM rows WHERE file = ? AND row IN ({', '.join('?' * len(indexes))})",
+                    (name, *indexes)):
+                values = json.loads(fields)
+                if 'Text' in fieldnames:
+                    values[fieldnames.index('Text')] = text
+                by_row[index] = self._editor_row(fieldnames, values)
+        return [by_row.get(index) for index in indexes]
+
+    def file_texts(self, name: str) -> list[tuple[int, str, str]]:
+        """파일의 (행 번호, StrRef, 번역문) 목록 (필터용)"""
+        with self.lock:
+            return self.conn.execute(
+                'SELECT row, strref, text FROM rows WHERE file = ? ORDER BY row', (name,)).fetchall()
+
+    def get(self, strref: str) -> tuple[str, int, tuple] | None:
+        """StrRef → (파일명, 행 번호, namedtuple 행)"""
+        with self.lock:
+            found = self.conn.execute(
+                'SELECT r.file, r.row, r.fields, r.text, f.fieldnames FROM rows r'
+                ' JOIN files f ON f.name = r.file WHERE r.strref = ? ORDER BY r.file LIMIT 1',
+                (strref,)).fetchone()
+        if found is None:
+            return None
+        name, index, fields, text, fieldnames = found
+        fieldnames = json.loads(fieldnames)
+        values = json.loads(fields)
+        if 'Text' in fieldnames:
+            values[fieldnames.index('Text')] = text
+        return name, index, self._editor_row(fieldnames, values)
+
+    def all_rows(self) -> list[tuple[str, tuple]]:
+        """(파일명, SEARCH_COLUMNS 순서 값) 전체 목록 (파일/행 순서)"""
+        with self.lock:
+            return [(row[0], row[1:]) for row in self.conn.execute(
+                f"SELECT file, {', '.join(SEARCH_COLUMNS)} FROM rows ORDER BY file, row")]
+
+    def search(self, query: str, fields: Sequence[str] = ('Text',), mode: str = 'contains',
+               ranked: bool = True, limit: int | None = None) -> list[tuple[str, tuple]]:
+        """(파일명, SEARCH_COLUMNS 순서 값) 검색 결과
+
+        mode: 'contains' (대소문자 무시), 'exact' (대소문자 구분), 'regex'
+        ranked: FTS 색인을 쓸 때는 bm25 순, 아니면 파일/행 순서
+
+        Raises:
+            re.error: 잘못된 정규식
+        """
+        columns = [FIELD_COLUMNS[field] for field in fields]
+        select = f"SELECT r.file, {', '.join('r.' + column for column in SEARCH_COLUMNS)} FROM rows r"
+        order = ' ORDER BY r.file, r.row'
+        params: list = []
+
+        if mode == 'regex':
+            re.compile(query)
+            where = ' OR '.join(f'r.{column} REGEXP ?' for column in columns)
+            params = [query] * len(columns)
+            sql = f'{select} WHERE {where}{order}'
+        elif self.fts and len(query) >= FTS_MIN_QUERY:
+            phrase = '"' + query.replace('"', '""') + '"'
+            match = f"{{{' '.join(columns)}}} : {phrase}"
+            sql = (f'{select} JOIN rows_fts ON rows_fts.rowid = r.id WHERE rows_fts MATCH ?'
+                   + (' ORDER BY rows_fts.rank' if ranked else order))
+            params = [match]
+        else:
+            where = ' OR '.join(f'instr(lower(r.{column}), lower(?)) > 0' for column in columns)
+            params = [query] * len(columns)
+            sql = f'{select} WHERE {where}{order}'
+        if limit is not None and mode != 'exact':
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self.lock:
+            results = [(row[0], row[1:]) for row in self.conn.execute(sql, params)]
+
+        if mode == 'exact':
+            # 색인/lower()는 대소문자를 무시하므로 후보를 다시 확인
+            positions = [SEARCH_COLUMNS.index(column) for column in columns]
+            results = [(name, row) for name, row in results
+                       if any(query in row[pos] for pos in positions)]
+            if limit is not None:
+                results = results[:limit]
+        return results
+
+    def update_texts(self, name: str, texts: dict[str, str]) -> int:
+        """번역문 저장 (한 트랜잭션) → 바꾼 행 수"""
+        with self.lock:
+            self.conn.execute('BEGIN')
+            try:
+                count = 0
+                for strref, text in texts.items():
+                    count += self.conn.execute(
+                        'UPDATE rows SET text = ?, dirty = 1 WHERE file = ? AND strref = ?',
+                        (text, name, strref)).rowcount
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+        return count
+
+    def status(self) -> dict:
+        with self.lock:
+            files, = self.conn.execute('SELECT COUNT(*) FROM files').fetchone()
+            rows, = self.conn.execute('SELECT COUNT(*) FROM rows').fetchone()
+            dirty = self.conn.execute(
+                'SELECT file, COUNT(*) FROM rows WHERE dirty GROUP BY file ORDER BY file').fetchall()
+        return {'files': files, 'rows': rows, 'dirty': dict(dirty), 'fts': self.fts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 번역 작업공간')
+    parser.add_argument('command', choices=('import', 'export', 'status'))
+    parser.add_argument('--dialog-dir', default=str(DIALOG_DIR),
+                        help='번역 CSV 디렉토리 (기본: dialog_translated/)')
+    parser.add_argument('--workspace', default=str(WORKSPACE_PATH),
+                        help='작업공간 파일 (기본: translate/workspace.sqlite3)')
+    parser.add_argument('--force', action='store_true',
+                        help='import: 내보내지 않은 편집이 있는 파일도 CSV로 덮어쓰기')
+    parser.add_argument('--full', action='store_true',
+                        help='export: 편집한 행만이 아니라 모든 파일을 다시 쓰기')
+    parser.add_argument('--output', metavar='DIR',
+                        help='export 대상 디렉토리 (기본: --dialog-dir)')
+    args = parser.parse_args()
+
+    dialog_dir = Path(args.dialog_dir)
+    workspace = Workspace(Path(args.workspace))
+
+    if args.command == 'import':
+        if not dialog_dir.is_dir():
+            print(f"오류: 디렉토리를 찾을 수 없습니다: {dialog_dir}")
+            sys.exit(1)
+        result = workspace.import_csv(dialog_dir, force=args.force)
+        print(f"가져온 파일: {len(result['imported'])}개, 제거: {len(result['removed'])}개")
+        if result['conflicts']:
+            print(f"[!] 내보내지 않은 편집이 있어 건너뜀 ({len(result['conflicts'])}개, --force로 덮어쓰기):")
+            for name in result['conflicts']:
+                print(f"  {name}")
+    elif args.command == 'export':
+        output = Path(args.output) if args.output else dialog_dir
+        exported = workspace.export_csv(output, full=args.full)
+        print(f"내보낸 파일: {len(exported)}개 ({sum(exported.values())}행) → {output}")
+    else:
+        status = workspace.status()
+        print(f"작업공간: {workspace.path}")
+        print(f"파일: {status['files']}개, 행: {status['rows']}개, "
+              f"전문 검색 색인: {'있음' if status['fts'] else '없음 (전체 스캔)'}")
+        print(f"내보내지 않은 편집: {sum(status['dirty'].values())}행")
+        for name, count in status['dirty'].items():
+            print(f"  {name}: {count}행")
+    workspace.close()
+
+
+if __name__ == '__main__':
+    main()